@@ -16,6 +16,11 @@ setuptools.setup(
     install_requires=[
         'typing',
     ],
+    extras_require={
+        'numpy': [
+            'numpy',
+        ],
+    },
     classifiers=(
         'Programming Language :: Python :: 3.6',
         'License :: OSI Approved :: MIT License',
@@ -1,5 +1,45 @@
-from datetime import date
-from working_calendar import WorkingCalendar
+import copy
+import io
+import os
+import pickle
+import subprocess
+import sys
+
+from array import array
+from datetime import (
+    date,
+    datetime,
+    time
+)
+from tempfile import TemporaryDirectory
+from threading import Thread
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+from working_calendar import (
+    ConcurrentWorkingCalendar,
+    DayKinds,
+    Frequencies,
+    FrozenWorkingCalendar,
+    IndexKinds,
+    LayeredWorkingCalendar,
+    Months,
+    WorkingCalendar
+)
+from working_calendar.exceptions import (
+    InvalidRecordsException,
+    NotEnoughWorkingDaysException,
+    NotWorkingScheduleException,
+    StartGreaterEndException
+)
 
 
 def clear_working_calendar(working_calendar):
@@ -10,6 +50,31 @@ def clear_working_calendar(working_calendar):
     working_calendar.update_working_time_minutes(480)  # 8 hours * 60 minutes
 
 
+def test_months_get_span():
+    assert Months.get_by_ordinal(2) == Months.FEBRUARY
+    assert Months.get_by_ordinal(13) is None
+
+    assert Months.get_month_span(2018, 2) == (date(2018, 2, 1).toordinal(), date(2018, 2, 28).toordinal())
+    assert Months.get_month_span(2020, 2) == (date(2020, 2, 1).toordinal(), date(2020, 2, 29).toordinal())
+    assert Months.get_month_span(2018, 12) == (date(2018, 12, 1).toordinal(), date(2018, 12, 31).toordinal())
+    assert Months.get_year_span(2000) == (date(2000, 1, 1).toordinal(), date(2000, 12, 31).toordinal())
+    assert Months.get_year_span(9999) == (date(9999, 1, 1).toordinal(), date(9999, 12, 31).toordinal())
+
+    try:
+        Months.get_month_span(2018, 13)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError
+
+    try:
+        Months.get_year_span(10000)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError
+
+
 def test_add_working_day(working_calendar):
     clear_working_calendar(working_calendar)
 
@@ -152,6 +217,15 @@ def test_is_weekend(working_calendar):
     working_calendar.add_weekend(4)
     assert working_calendar.is_weekend(test_date)
 
+    working_calendar.remove_weekend(4)
+    assert not working_calendar.is_weekend(test_date)
+
+    working_calendar.extend_weekends([4, 5])
+    assert working_calendar.is_weekend(test_date)
+
+    working_calendar.clear_weekends()
+    assert not working_calendar.is_weekend(test_date)
+
 
 def test_is_working(working_calendar):
     clear_working_calendar(working_calendar)
@@ -728,7 +802,7 @@ def test_get_next_working_day(working_calendar):
     assert working_calendar.get_next_working_day(date(2018, 3, 8)) == date(2018, 3, 10)
 
 
-def test_skip_working_days(working_calendar):
+def test_get_previous_working_day(working_calendar):
     clear_working_calendar(working_calendar)
 
     weekends = [6, 7]
@@ -741,20 +815,88 @@ def test_skip_working_days(working_calendar):
         date(2018, 3, 10),
     ]
 
-    try:
-        assert working_calendar.skip_working_days(date(2018, 3, 1), -1)
-    except ValueError:
-        pass
-    else:
-        raise AssertionError
+    assert working_calendar.get_previous_working_day(date(2018, 3, 2)) == date(2018, 3, 1)
+    assert working_calendar.get_previous_working_day(date(2018, 3, 5)) == date(2018, 3, 4)
+    assert working_calendar.get_previous_working_day(date(2018, 3, 12)) == date(2018, 3, 11)
+
+    working_calendar.extend_weekends(weekends)
+    assert working_calendar.get_previous_working_day(date(2018, 3, 5)) == date(2018, 3, 2)
+    assert working_calendar.get_previous_working_day(date(2018, 3, 4)) == date(2018, 3, 2)
+    assert working_calendar.get_previous_working_day(date(2018, 3, 12)) == date(2018, 3, 9)
+    assert working_calendar.get_previous_working_day(date(2018, 3, 9)) == date(2018, 3, 8)
+    working_calendar.clear_weekends()
+
+    working_calendar.extend_holidays(holidays)
+    assert working_calendar.get_previous_working_day(date(2018, 3, 10)) == date(2018, 3, 7)
+    assert working_calendar.get_previous_working_day(date(2018, 3, 9)) == date(2018, 3, 7)
+    assert working_calendar.get_previous_working_day(date(2018, 3, 12)) == date(2018, 3, 11)
+    working_calendar.clear_holidays()
+
+    working_calendar.extend_weekends(weekends)
+    working_calendar.extend_holidays(holidays)
+    assert working_calendar.get_previous_working_day(date(2018, 3, 12)) == date(2018, 3, 7)
+    assert working_calendar.get_previous_working_day(date(2018, 3, 10)) == date(2018, 3, 7)
+    assert working_calendar.get_previous_working_day(date(2018, 3, 5)) == date(2018, 3, 2)
+
+    working_calendar.extend_working_days(additional_working_days)
+    assert working_calendar.get_previous_working_day(date(2018, 3, 12)) == date(2018, 3, 10)
+    assert working_calendar.get_previous_working_day(date(2018, 3, 10)) == date(2018, 3, 8)
+    assert working_calendar.get_previous_working_day(date(2018, 3, 9)) == date(2018, 3, 8)
+    assert working_calendar.get_previous_working_day(date(2018, 3, 5)) == date(2018, 3, 2)
+
+    working_calendar.extend_weekends([1, 2, 3, 4, 5])
+    assert working_calendar.get_previous_working_day(date(2018, 3, 12)) == date(2018, 3, 10)
 
     try:
-        assert working_calendar.skip_working_days(date(2018, 3, 1), 0)
-    except ValueError:
+        working_calendar.get_previous_working_day(date(2018, 3, 8))
+    except NotEnoughWorkingDaysException:
         pass
     else:
         raise AssertionError
 
+
+def test_holiday_runs(working_calendar):
+    clear_working_calendar(working_calendar)
+
+    working_calendar.extend_weekends([6, 7])
+    # 400 days of holidays with weekends inside are one run of removed days
+    working_calendar.extend_holidays(date.fromordinal(ordinal) for ordinal in range(
+        date(2018, 3, 5).toordinal(), date(2019, 4, 9).toordinal()
+    ))
+
+    tables = working_calendar._get_tables()
+
+    assert len(tables.run_starts) == 1
+    assert working_calendar.get_next_working_day(date(2018, 3, 2)) == date(2019, 4, 9)
+    assert working_calendar.get_next_working_day(date(2018, 12, 31)) == date(2019, 4, 9)
+    assert working_calendar.get_previous_working_day(date(2019, 4, 9)) == date(2018, 3, 2)
+    assert working_calendar.get_previous_working_day(date(2018, 12, 31)) == date(2018, 3, 2)
+
+    working_calendar.add_working_day(date(2018, 12, 29))
+    assert working_calendar.get_next_working_day(date(2018, 12, 1)) == date(2018, 12, 29)
+    assert working_calendar.get_next_working_day(date(2018, 12, 29)) == date(2019, 4, 9)
+    assert working_calendar.get_previous_working_day(date(2019, 1, 31)) == date(2018, 12, 29)
+    assert working_calendar.get_previous_working_day(date(2018, 12, 29)) == date(2018, 3, 2)
+
+    clear_working_calendar(working_calendar)
+
+
+def test_skip_working_days(working_calendar):
+    clear_working_calendar(working_calendar)
+
+    weekends = [6, 7]
+    holidays = [
+        date(2018, 3, 8),
+        date(2018, 3, 9),
+    ]
+    additional_working_days = [
+        date(2018, 3, 8),
+        date(2018, 3, 10),
+    ]
+
+    assert working_calendar.skip_working_days(date(2018, 3, 1), 0) == date(2018, 3, 1)
+    assert working_calendar.skip_working_days(date(2018, 3, 1), -1) == date(2018, 2, 28)
+
     try:
         assert working_calendar.skip_working_days(date(2018, 3, 1), '123')
     except ValueError:
@@ -813,11 +955,989 @@ def test_skip_working_days(working_calendar):
     assert working_calendar.skip_working_days(date(2018, 3, 3), 2) == date(2018, 3, 7)
     assert working_calendar.skip_working_days(date(2018, 3, 7), 2) == date(2018, 3, 9)
     assert working_calendar.skip_working_days(date(2018, 3, 8), 2) == date(2018, 3, 11)
+    assert working_calendar.skip_working_days(date(2018, 3, 12), -1) == date(2018, 3, 11)
+    assert working_calendar.skip_working_days(date(2018, 3, 12), -2) == date(2018, 3, 9)
+    assert working_calendar.skip_working_days(date(2018, 3, 11), -2) == date(2018, 3, 7)
+    assert working_calendar.skip_working_days(date(2018, 3, 9), -1) == date(2018, 3, 7)
+
+    working_calendar.extend_weekends([1, 2, 3, 4, 5])
+    working_calendar.clear_working_days()
+
+    try:
+        working_calendar.skip_working_days(date(2018, 3, 1), 1)
+    except NotEnoughWorkingDaysException:
+        pass
+    else:
+        raise AssertionError
+
+
+def test_ordinal_api(working_calendar):
+    clear_working_calendar(working_calendar)
+
+    working_calendar.extend_weekends([6, 7])
+    working_calendar.extend_holidays([date(2018, 3, 8), date(2018, 3, 9)])
+    working_calendar.add_working_day(date(2018, 3, 10))
+    working_calendar.update_not_standard_working_day(date(2018, 3, 10), 240)
+
+    start = date(2018, 3, 1).toordinal()
+    end = date(2018, 3, 12).toordinal()
+
+    assert working_calendar.is_working_ordinal(date(2018, 3, 10).toordinal())
+    assert not working_calendar.is_working_ordinal(date(2018, 3, 8).toordinal())
+    assert working_calendar.count_working_days_between_ordinals(start, end) == 7
+    assert working_calendar.count_working_minutes_between_ordinals(start, end) == 3120
+    assert working_calendar.skip_working_days_ordinal(start, 6) == date(2018, 3, 11).toordinal()
+    assert working_calendar.skip_working_days_ordinal(start, 0) == start
+    assert working_calendar.get_next_working_ordinal(date(2018, 3, 7).toordinal()) == date(2018, 3, 10).toordinal()
+    assert working_calendar.get_previous_working_ordinal(end) == date(2018, 3, 10).toordinal()
+
+
+def test_build_index(working_calendar):
+    clear_working_calendar(working_calendar)
+
+    weekends = [6, 7]
+    start_date = date(2018, 3, 1)
+    end_date = date(2018, 3, 12)
+
+    working_calendar.extend_weekends(weekends)
+    working_calendar.build_index(date(2018, 1, 1), date(2018, 12, 31))
+    assert working_calendar.count_working_days_between(start_date, end_date) == 8
+    assert working_calendar.count_working_minutes_between(start_date, end_date) == 3840
+
+    working_calendar.add_holiday(date(2018, 3, 8))
+    assert working_calendar.count_working_days_between(start_date, end_date) == 7
+
+    working_calendar.add_working_day(date(2018, 3, 10))
+    working_calendar.update_not_standard_working_day(date(2018, 3, 10), 240)
+    assert working_calendar.count_working_days_between(start_date, end_date) == 8
+    assert working_calendar.count_working_minutes_between(start_date, end_date) == 3600
+
+    assert working_calendar.count_working_days_between(date(2017, 12, 31), date(2018, 1, 1)) == 1
+
+    working_calendar.drop_index()
+    assert working_calendar.count_working_days_between(start_date, end_date) == 8
+
+    try:
+        working_calendar.build_index(end_date, start_date)
+    except StartGreaterEndException:
+        pass
+    else:
+        raise AssertionError
+
+
+def test_build_fenwick_index(working_calendar):
+    clear_working_calendar(working_calendar)
+
+    start_date = date(2018, 3, 1)
+    end_date = date(2018, 3, 12)
+
+    working_calendar.extend_weekends([6, 7])
+    working_calendar.build_index(date(2018, 1, 1), date(2018, 12, 31), IndexKinds.FENWICK)
+    assert working_calendar.count_working_days_between(start_date, end_date) == 8
+    assert working_calendar.count_working_minutes_between(start_date, end_date) == 3840
+
+    working_calendar.add_holiday(date(2018, 3, 8))
+    working_calendar.add_working_day(date(2018, 3, 10))
+    working_calendar.update_not_standard_working_day(date(2018, 3, 10), 240)
+    assert working_calendar.count_working_days_between(start_date, end_date) == 8
+    assert working_calendar.count_working_minutes_between(start_date, end_date) == 3600
+    assert working_calendar.is_working(date(2018, 3, 10))
+    assert not working_calendar.is_working(date(2018, 3, 8))
+
+    working_calendar.remove_holiday(date(2018, 3, 8))
+    working_calendar.remove_not_standard_working_day(date(2018, 3, 10))
+    assert working_calendar.count_working_days_between(start_date, end_date) == 9
+    assert working_calendar.count_working_minutes_between(start_date, end_date) == 4320
+
+    working_calendar.add_weekend(5)
+    assert working_calendar.count_working_days_between(start_date, end_date) == 7
+    assert working_calendar.skip_working_days(start_date, 3) == date(2018, 3, 7)
+
+    working_calendar.drop_index()
+    assert working_calendar.count_working_days_between(start_date, end_date) == 7
+
+
+def test_cache():
+    working_calendar = WorkingCalendar(cache_size=2)
+
+    assert working_calendar.get_cache_info() == (0, 0, 2, 0)
+
+    assert working_calendar.count_working_days_in_month(2018, 3) == 22
+    assert working_calendar.count_working_days_in_month(2018, 3) == 22
+    assert working_calendar.get_cache_info() == (1, 1, 2, 1)
+
+    working_calendar.add_holiday(date(2018, 3, 8))
+    assert working_calendar.count_working_days_in_month(2018, 3) == 21
+    assert working_calendar.get_cache_info() == (1, 2, 2, 2)
+
+    assert working_calendar.count_working_minutes_in_year(2018) == 260 * 480
+    assert working_calendar.get_cache_info() == (1, 3, 2, 2)
+
+    working_calendar.update_cache_size(0)
+    assert working_calendar.count_working_days_in_month(2018, 3) == 21
+    assert working_calendar.get_cache_info() == (1, 3, 0, 0)
+
+    working_calendar.clear_cache()
+    assert working_calendar.get_cache_info() == (0, 0, 0, 0)
+
+    try:
+        working_calendar.update_cache_size(-1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError
+
+    frozen_calendar = WorkingCalendar(cache_size=4).freeze()
+    errors = []
+
+    def read(offset):
+        try:
+            # threads share 5 months, so results are found and evicted by other threads at the same time
+            for _ in range(2000):
+                for month in range(3):
+                    frozen_calendar.count_working_days_in_month(2018, (month + offset) % 5 + 1)
+        except Exception as exception:
+            errors.append(exception)
+
+    threads = [Thread(target=read, args=(offset,)) for offset in range(8)]
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads often, so they interleave inside methods of cache
+
+    try:
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert errors == []
+    assert frozen_calendar.get_cache_info().currsize == 4
+
+
+def test_freeze(working_calendar):
+    clear_working_calendar(working_calendar)
+
+    working_calendar.extend_weekends([6, 7])
+    working_calendar.extend_holidays([date(2018, 3, 8), date(2018, 3, 9)])
+    working_calendar.add_working_day(date(2018, 3, 10))
+    working_calendar.update_not_standard_working_day(date(2018, 3, 10), 240)
+
+    frozen_calendar = working_calendar.freeze()
+
+    assert frozen_calendar.get_holidays() == {date(2018, 3, 8), date(2018, 3, 9)}
+    assert frozen_calendar.get_working_days() == {date(2018, 3, 10)}
+    assert frozen_calendar.get_not_standard_working_days() == {date(2018, 3, 10): 240}
+    assert frozen_calendar.is_holiday(date(2018, 3, 8))
+    assert frozen_calendar.is_additional_working_day(date(2018, 3, 10))
+    assert frozen_calendar.is_not_standard_working_day(date(2018, 3, 10))
+    assert frozen_calendar.is_weekend(date(2018, 3, 11))
+    assert frozen_calendar.count_working_days_between(date(2018, 3, 1), date(2018, 3, 12)) == 7
+    assert frozen_calendar.count_working_minutes_between(date(2018, 3, 1), date(2018, 3, 12)) == 3120
+    assert frozen_calendar.get_next_working_day(date(2018, 3, 7)) == date(2018, 3, 10)
+    assert frozen_calendar.skip_working_days(date(2018, 3, 10), 10) == date(2018, 3, 23)
+
+    assert frozen_calendar == working_calendar.freeze()
+    assert hash(frozen_calendar) == hash(working_calendar.freeze())
+    assert {frozen_calendar: 1}[working_calendar.freeze()] == 1
+
+    working_calendar.add_holiday(date(2018, 3, 1))
+    assert frozen_calendar != working_calendar.freeze()
+    assert frozen_calendar.count_working_days_between(date(2018, 3, 1), date(2018, 3, 12)) == 7
+
+    assert not hasattr(frozen_calendar, 'add_holiday')
+
+    try:
+        frozen_calendar._working_time_minutes = 1
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError
+
+
+def test_count_working_days_between_many(working_calendar):
+    if numpy is None:
+        return
+
+    clear_working_calendar(working_calendar)
+
+    working_calendar.extend_weekends([6, 7])
+    working_calendar.extend_holidays([date(2018, 3, 8), date(2018, 3, 9)])
+    working_calendar.add_working_day(date(2018, 3, 10))
+    working_calendar.update_not_standard_working_day(date(2018, 3, 10), 240)
+
+    start_dates = numpy.array(['2018-03-01', '2018-03-10', '2018-01-01'], dtype='datetime64[D]')
+    end_dates = numpy.array(['2018-03-12', '2018-03-10', '2018-12-31'], dtype='datetime64[D]')
+
+    assert working_calendar.count_working_days_between_many(start_dates, end_dates).tolist() == [
+        working_calendar.count_working_days_between(date(2018, 3, 1), date(2018, 3, 12)),
+        1,
+        working_calendar.count_working_days_in_year(2018),
+    ]
+    assert working_calendar.count_working_minutes_between_many(start_dates, end_dates).tolist() == [
+        working_calendar.count_working_minutes_between(date(2018, 3, 1), date(2018, 3, 12)),
+        240,
+        working_calendar.count_working_minutes_in_year(2018),
+    ]
+
+    ordinals = [date(2018, 3, 1).toordinal(), date(2018, 3, 12).toordinal()]
+    assert working_calendar.count_working_days_between_many([ordinals[0]], [ordinals[1]]).tolist() == [7]
+    assert working_calendar.count_working_days_between_many([date(2018, 3, 1)], [date(2018, 3, 12)]).tolist() == [7]
+
+    try:
+        working_calendar.count_working_days_between_many(end_dates, start_dates)
+    except StartGreaterEndException:
+        pass
+    else:
+        raise AssertionError
+
+
+def test_skip_working_days_many(working_calendar):
+    if numpy is None:
+        return
+
+    clear_working_calendar(working_calendar)
+
+    working_calendar.extend_weekends([6, 7])
+    working_calendar.extend_holidays([date(2018, 3, 8), date(2018, 3, 9)])
+    working_calendar.extend_working_days([date(2018, 3, 8), date(2018, 3, 10)])
+
+    dates = numpy.array(['2018-03-01', '2018-03-03', '2018-03-08', '2018-03-12', '2018-03-11'], dtype='datetime64[D]')
+    skip_days = numpy.array([2, 1, 2, -2, 0])
+
+    assert working_calendar.skip_working_days_many(dates, skip_days).tolist() == [
+        date(2018, 3, 3),
+        date(2018, 3, 6),
+        date(2018, 3, 11),
+        date(2018, 3, 9),
+        date(2018, 3, 11),
+    ]
+    assert working_calendar.skip_working_days_many(dates, 1).tolist() == [
+        working_calendar.skip_working_days(day.item(), 1) for day in dates
+    ]
+
+    try:
+        working_calendar.skip_working_days_many(dates, numpy.array([1.5] * 5))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError
+
+
+def test_bulk_loaders(working_calendar):
+    clear_working_calendar(working_calendar)
+
+    working_calendar.extend_weekends([6, 7])
+    working_calendar.extend_holidays(array('i', [date(2018, 3, 8).toordinal(), date(2018, 3, 9).toordinal()]))
+    working_calendar.extend_working_days(range(date(2018, 3, 10).toordinal(), date(2018, 3, 11).toordinal()))
+    working_calendar.update_not_standard_working_days({date(2018, 3, 10): 240, date(2018, 3, 12): 300})
+
+    assert working_calendar.get_holidays() == {date(2018, 3, 8), date(2018, 3, 9)}
+    assert working_calendar.get_working_days() == {date(2018, 3, 10)}
+    assert working_calendar.get_not_standard_working_days() == {date(2018, 3, 10): 240, date(2018, 3, 12): 300}
+    assert working_calendar.count_working_minutes_between(date(2018, 3, 1), date(2018, 3, 12)) == 2940
+
+    try:
+        working_calendar.extend_holidays([date(2018, 3, 1), 'x'])
+    except Exception:
+        pass
+    else:
+        raise AssertionError
+
+    assert not working_calendar.is_holiday(date(2018, 3, 1))
+
+    try:
+        working_calendar.update_not_standard_working_days({date(2018, 3, 1): 240, date(2018, 3, 2): 0})
+    except ValueError:
+        pass
+    else:
+        raise AssertionError
+
+    assert not working_calendar.is_not_standard_working_day(date(2018, 3, 1))
+
+    if numpy is not None:
+        working_calendar.extend_holidays(numpy.array(['2018-03-01', '2018-03-02'], dtype='datetime64[D]'))
+
+        assert working_calendar.get_holidays() == {date(2018, 3, 1), date(2018, 3, 2), date(2018, 3, 8), date(2018, 3, 9)}
+
+
+def test_layered_calendar(working_calendar):
+    clear_working_calendar(working_calendar)
+
+    working_calendar.extend_weekends([6, 7])
+    working_calendar.extend_holidays([date(2018, 3, 8)])
+
+    regional_calendar = WorkingCalendar()
+    regional_calendar.extend_holidays([date(2018, 3, 9), date(2018, 3, 12)])
+    regional_calendar.update_not_standard_working_day(date(2018, 3, 6), 300)
+
+    company_calendar = WorkingCalendar()
+    company_calendar.add_working_day(date(2018, 3, 10))
+    company_calendar.add_working_day(date(2018, 3, 12))
+    company_calendar.update_not_standard_working_day(date(2018, 3, 6), 240)
+
+    layered_calendar = LayeredWorkingCalendar(working_calendar, regional_calendar, company_calendar, cache_size=8)
+    layered_calendar.build_index(date(2018, 1, 1), date(2018, 12, 31))
+
+    assert layered_calendar.get_holidays() == {date(2018, 3, 8), date(2018, 3, 9), date(2018, 3, 12)}
+    assert layered_calendar.get_not_standard_working_days() == {date(2018, 3, 6): 240}
+    assert layered_calendar.is_holiday(date(2018, 3, 9))
+    assert layered_calendar.is_working(date(2018, 3, 12))
+    assert not layered_calendar.is_working(date(2018, 3, 9))
+    assert layered_calendar.is_weekend(date(2018, 3, 11))
+    assert layered_calendar.count_working_days_between(date(2018, 3, 1), date(2018, 3, 12)) == 7
+    assert layered_calendar.count_working_minutes_between(date(2018, 3, 1), date(2018, 3, 12)) == 3120
+    assert layered_calendar.get_next_working_day(date(2018, 3, 7)) == date(2018, 3, 10)
+
+    tables = layered_calendar._get_tables()
+    assert layered_calendar._get_tables() is tables
+
+    regional_calendar.add_holiday(date(2018, 3, 1))
+    assert layered_calendar._get_tables() is not tables
+    assert layered_calendar.count_working_days_between(date(2018, 3, 1), date(2018, 3, 12)) == 6
+    assert layered_calendar.count_working_days_between(
+        date(2018, 3, 1), date(2018, 3, 12)
+    ) == layered_calendar.count_working_days_between(date(2017, 3, 1), date(2019, 3, 12)) - (
+        layered_calendar.count_working_days_between(date(2017, 3, 1), date(2018, 2, 28)) +
+        layered_calendar.count_working_days_between(date(2018, 3, 13), date(2019, 3, 12))
+    )
+
+    nested_calendar = LayeredWorkingCalendar(LayeredWorkingCalendar(working_calendar, regional_calendar), company_calendar)
+    assert nested_calendar.count_working_days_between(date(2018, 3, 1), date(2018, 3, 12)) == 6
+
+    try:
+        LayeredWorkingCalendar()
+    except ValueError:
+        pass
+    else:
+        raise AssertionError
+
+
+def test_clone(working_calendar):
+    clear_working_calendar(working_calendar)
+
+    working_calendar.extend_weekends([6, 7])
+    working_calendar.extend_holidays([date(2018, 3, 8), date(2018, 3, 9)])
+    working_calendar.build_index(date(2018, 1, 1), date(2018, 12, 31), IndexKinds.FENWICK)
+
+    clone_calendar = working_calendar.clone()
+
+    assert clone_calendar.get_holidays() is working_calendar.get_holidays()
+    assert clone_calendar.count_working_days_between(date(2018, 3, 1), date(2018, 3, 12)) == 6
+
+    clone_calendar.add_working_day(date(2018, 3, 10))
+    working_calendar.add_holiday(date(2018, 3, 1))
+
+    assert clone_calendar.get_holidays() is not working_calendar.get_holidays()
+    assert clone_calendar.get_holidays() == {date(2018, 3, 8), date(2018, 3, 9)}
+    assert working_calendar.get_holidays() == {date(2018, 3, 1), date(2018, 3, 8), date(2018, 3, 9)}
+    assert not working_calendar.is_additional_working_day(date(2018, 3, 10))
+    assert clone_calendar.count_working_days_between(date(2018, 3, 1), date(2018, 3, 12)) == 7
+    assert working_calendar.count_working_days_between(date(2018, 3, 1), date(2018, 3, 12)) == 5
+
+    clone_calendar.clear_weekends()
+    assert working_calendar.is_weekend(date(2018, 3, 11))
+    assert not clone_calendar.is_weekend(date(2018, 3, 11))
+
+    working_calendar.drop_index()
+
+
+def test_concurrent_calendar(working_calendar):
+    clear_working_calendar(working_calendar)
+
+    working_calendar.extend_weekends([6, 7])
+    working_calendar.update_cache_size(4)
+
+    concurrent_calendar = ConcurrentWorkingCalendar(working_calendar)
+    concurrent_calendar.extend_holidays([date(2018, 3, 8), date(2018, 3, 9)])
+
+    assert not working_calendar.is_holiday(date(2018, 3, 8))
+    assert concurrent_calendar.is_holiday(date(2018, 3, 8))
+
+    for name in ('attach', 'from_buffer', 'load'):
+        assert not hasattr(concurrent_calendar, name)
+    assert concurrent_calendar.count_working_days_between(date(2018, 3, 1), date(2018, 3, 12)) == 6
+
+    snapshot = concurrent_calendar.freeze()
+
+    try:
+        with concurrent_calendar.transaction() as calendar:
+            calendar.add_working_day(date(2018, 3, 10))
+            calendar.update_not_standard_working_day(date(2018, 3, 10), 0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError
+
+    assert concurrent_calendar.freeze() is snapshot
+    assert not concurrent_calendar.is_additional_working_day(date(2018, 3, 10))
+
+    results = set()
+    errors = []
+
+    def read(offset):
+        try:
+            for _ in range(200):
+                results.add(concurrent_calendar.count_working_days_between(date(2018, 3, 1), date(2018, 3, 12)))
+
+                # readers share cache of snapshot, so its results are found and evicted by other readers
+                for month in range(3):
+                    concurrent_calendar.count_working_days_in_month(2018, (month + offset) % 5 + 1)
+        except Exception as exception:
+            errors.append(exception)
+
+    threads = [Thread(target=read, args=(offset,)) for offset in range(8)]
+
+    for thread in threads:
+        thread.start()
+
+    for _ in range(50):
+        with concurrent_calendar.transaction() as calendar:
+            calendar.remove_holiday(date(2018, 3, 8))
+            calendar.remove_holiday(date(2018, 3, 9))
+
+        concurrent_calendar.extend_holidays([date(2018, 3, 8), date(2018, 3, 9)])
+
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert results <= {6, 8}
+    assert snapshot.count_working_days_between(date(2018, 3, 1), date(2018, 3, 12)) == 6
+    assert snapshot.get_cache_info().maxsize == 4
+
+    working_calendar.update_cache_size(0)
+
+
+def test_iter_working_days(working_calendar):
+    clear_working_calendar(working_calendar)
+
+    working_calendar.extend_weekends([6, 7])
+    working_calendar.extend_holidays([date(2018, 3, 8), date(2018, 3, 9)])
+    working_calendar.add_working_day(date(2018, 3, 10))
+
+    assert list(working_calendar.iter_working_days(date(2018, 3, 1), date(2018, 3, 12))) == [
+        date(2018, 3, 1),
+        date(2018, 3, 2),
+        date(2018, 3, 5),
+        date(2018, 3, 6),
+        date(2018, 3, 7),
+        date(2018, 3, 10),
+        date(2018, 3, 12),
+    ]
+    assert list(working_calendar.iter_working_days(date(2018, 3, 1), date(2018, 3, 12), step=3)) == [
+        date(2018, 3, 1),
+        date(2018, 3, 6),
+        date(2018, 3, 12),
+    ]
+    assert list(working_calendar.iter_non_working_days(date(2018, 3, 1), date(2018, 3, 12))) == [
+        date(2018, 3, 3),
+        date(2018, 3, 4),
+        date(2018, 3, 8),
+        date(2018, 3, 9),
+        date(2018, 3, 11),
+    ]
+    assert [chunk.tolist() for chunk in working_calendar.iter_working_ordinal_chunks(
+        date(2018, 3, 1), date(2018, 3, 12), size=4
+    )] == [
+        [date(2018, 3, day).toordinal() for day in (1, 2, 5, 6)],
+        [date(2018, 3, day).toordinal() for day in (7, 10, 12)],
+    ]
+
+    try:
+        working_calendar.iter_working_days(date(2018, 3, 1), date(2018, 3, 12), step=0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError
+
+    try:
+        working_calendar.iter_non_working_days(date(2018, 3, 12), date(2018, 3, 1))
+    except StartGreaterEndException:
+        pass
+    else:
+        raise AssertionError
+
+
+def test_aggregate(working_calendar):
+    clear_working_calendar(working_calendar)
+
+    working_calendar.extend_weekends([6, 7])
+    working_calendar.extend_holidays([date(2018, 2, 23), date(2018, 3, 8), date(2018, 3, 9)])
+    working_calendar.add_working_day(date(2018, 3, 10))
+    working_calendar.update_not_standard_working_day(date(2018, 3, 10), 240)
+
+    buckets = working_calendar.aggregate(date(2018, 2, 15), date(2018, 3, 12), Frequencies.MONTH)
+
+    assert buckets == [
+        (date(2018, 2, 15), date(2018, 2, 28), 9, 4320),
+        (date(2018, 3, 1), date(2018, 3, 12), 7, 3120),
+    ]
+    assert buckets[1].working_days == 7
+
+    buckets = working_calendar.aggregate(date(2018, 3, 1), date(2018, 3, 12), 'week')
+
+    assert [(bucket.start_date, bucket.working_days) for bucket in buckets] == [
+        (date(2018, 3, 1), 2),
+        (date(2018, 3, 5), 4),
+        (date(2018, 3, 12), 1),
+    ]
+
+    buckets = working_calendar.aggregate(date(2018, 1, 1), date(2018, 12, 31), 'quarter')
+
+    assert [bucket.working_days for bucket in buckets] == [
+        working_calendar.count_working_days_between(date(2018, 1, 1), date(2018, 3, 31)),
+        working_calendar.count_working_days_between(date(2018, 4, 1), date(2018, 6, 30)),
+        working_calendar.count_working_days_between(date(2018, 7, 1), date(2018, 9, 30)),
+        working_calendar.count_working_days_between(date(2018, 10, 1), date(2018, 12, 31)),
+    ]
+    assert working_calendar.aggregate(date(2018, 1, 1), date(2018, 12, 31), 'year')[0].working_minutes == (
+        working_calendar.count_working_minutes_in_year(2018)
+    )
+
+    if numpy is not None:
+        buckets = working_calendar.aggregate(date(2018, 2, 15), date(2018, 3, 12), as_array=True)
+
+        assert buckets['working_days'].tolist() == [9, 7]
+        assert buckets['working_minutes'].tolist() == [4320, 3120]
+        assert buckets['start_date'][1] == numpy.datetime64('2018-03-01')
+
+    try:
+        working_calendar.aggregate(date(2018, 3, 1), date(2018, 3, 12), 'day')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError
+
+
+def test_count_working_minutes_between_datetimes(working_calendar):
+    clear_working_calendar(working_calendar)
+
+    working_calendar.extend_weekends([6, 7])
+    working_calendar.extend_holidays([date(2018, 3, 8)])
+    working_calendar.update_not_standard_working_day(date(2018, 3, 7), 420)
+
+    try:
+        working_calendar.count_working_minutes_between_datetimes(datetime(2018, 3, 6), datetime(2018, 3, 7))
+    except NotWorkingScheduleException:
+        pass
+    else:
+        raise AssertionError
+
+    working_calendar.update_working_schedule([(time(14, 0), time(18, 0)), (time(9, 0), time(13, 0))])
+
+    assert working_calendar.get_working_time_minutes() == 480
+    assert working_calendar.get_working_schedule() == ((time(9, 0), time(13, 0)), (time(14, 0), time(18, 0)))
+
+    # 14:30-18:00 on tuesday, 7 hours on wednesday, holiday on thursday, 09:00-10:00 on friday
+    assert working_calendar.count_working_minutes_between_datetimes(
+        datetime(2018, 3, 6, 14, 30), datetime(2018, 3, 9, 10, 0)
+    ) == 690
+    # shorter day ends at 17:00
+    assert working_calendar.count_working_minutes_between_datetimes(
+        datetime(2018, 3, 7, 12, 0), datetime(2018, 3, 7, 18, 0)
+    ) == 240
+    assert working_calendar.count_working_minutes_between_datetimes(
+        datetime(2018, 3, 10, 12, 0), datetime(2018, 3, 11, 12, 0)
+    ) == 0
+    assert working_calendar.count_working_minutes_between_datetimes(date(2018, 3, 5), date(2018, 3, 10)) == (
+        working_calendar.count_working_minutes_between(date(2018, 3, 5), date(2018, 3, 9))
+    )
+    assert working_calendar.count_working_hours_between_datetimes(
+        datetime(2018, 3, 6, 9, 0), datetime(2018, 3, 6, 13, 30)
+    ) == 4.0
+    assert working_calendar.freeze().count_working_minutes_between_datetimes(
+        datetime(2018, 3, 6, 14, 30), datetime(2018, 3, 9, 10, 0)
+    ) == 690
+
+    # longer day must end before midnight, so counting is monotonic at midnight
+    working_calendar.update_not_standard_working_day(date(2018, 3, 6), 840)
+
+    assert working_calendar.count_working_minutes_between_datetimes(
+        datetime(2018, 3, 6, 9, 0), datetime(2018, 3, 6, 23, 59)
+    ) == 839
+    assert working_calendar.count_working_minutes_between_datetimes(
+        datetime(2018, 3, 6, 9, 0), datetime(2018, 3, 7, 0, 0)
+    ) == 840
+
+    for update in (
+        lambda: working_calendar.update_not_standard_working_day(date(2018, 3, 6), 841),
+        lambda: working_calendar.update_not_standard_working_days({date(2018, 3, 6): 1000}),
+        lambda: working_calendar.update_working_schedule([(time(9, 0), time(13, 0)), (time(15, 0), time(18, 0))]),
+    ):
+        try:
+            update()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError
+
+    assert working_calendar.get_not_standard_working_days()[date(2018, 3, 6)] == 840
+    assert working_calendar.get_working_schedule() == ((time(9, 0), time(13, 0)), (time(14, 0), time(18, 0)))
+
+    working_calendar.remove_not_standard_working_day(date(2018, 3, 6))
+
+    for intervals in ([], [(time(9, 0), time(9, 0))], [(time(9, 0), time(13, 0)), (time(12, 0), time(18, 0))]):
+        try:
+            working_calendar.update_working_schedule(intervals)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError
+
+    working_calendar.update_working_time_minutes(480)
+    assert working_calendar.get_working_schedule() is None
+
+
+def test_save_load(working_calendar):
+    clear_working_calendar(working_calendar)
+
+    working_calendar.extend_weekends([6, 7])
+    working_calendar.extend_holidays([date(2018, 3, 8), date(2018, 3, 9)])
+    working_calendar.add_working_day(date(2018, 3, 10))
+    working_calendar.update_not_standard_working_day(date(2018, 3, 10), 240)
+    working_calendar.build_index(date(2018, 1, 1), date(2018, 12, 31))
+
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'calendar.bin')
+        working_calendar.save(path)
+
+        for use_mmap in (True, False):
+            frozen_calendar = FrozenWorkingCalendar.load(path, use_mmap=use_mmap)
+
+            assert frozen_calendar == working_calendar.freeze()
+            assert frozen_calendar._get_index() is not None
+            assert frozen_calendar.count_working_days_between(date(2018, 3, 1), date(2018, 3, 12)) == 7
+            assert frozen_calendar.count_working_minutes_between(date(2018, 3, 1), date(2018, 3, 12)) == 3120
+            assert frozen_calendar.skip_working_days(date(2018, 3, 10), 10) == date(2018, 3, 23)
+
+        working_calendar.save(path, with_index=False)
+        assert FrozenWorkingCalendar.load(path)._get_index() is None
+
+    try:
+        FrozenWorkingCalendar.from_buffer(b'not a calendar' * 8)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError
+
+    working_calendar.drop_index()
+
+
+def test_publish_attach(working_calendar):
+    if shared_memory is None:
+        return
+
+    clear_working_calendar(working_calendar)
+
+    working_calendar.extend_weekends([6, 7])
+    working_calendar.extend_holidays([date(2018, 3, 8), date(2018, 3, 9)])
+    working_calendar.add_working_day(date(2018, 3, 10))
+    working_calendar.build_index(date(2018, 1, 1), date(2018, 12, 31))
+
+    block = working_calendar.publish()
+
+    try:
+        frozen_calendar = FrozenWorkingCalendar.attach(block.name)
+
+        assert frozen_calendar == working_calendar.freeze()
+        assert frozen_calendar._get_index() is not None
+        assert frozen_calendar.count_working_days_between(date(2018, 3, 1), date(2018, 3, 12)) == 7
+        assert frozen_calendar.get_next_working_day(date(2018, 3, 7)) == date(2018, 3, 10)
+
+        # independent process which attaches block must not remove it when it exits
+        code = (
+            'from datetime import date\n'
+            'from working_calendar import FrozenWorkingCalendar\n'
+            'frozen_calendar = FrozenWorkingCalendar.attach({!r})\n'
+            'print(frozen_calendar.count_working_days_between(date(2018, 3, 1), date(2018, 3, 12)))\n'
+        ).format(block.name)
+        environment = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        for _ in range(2):
+            process = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, env=environment)
+
+            assert process.returncode == 0
+            assert process.stdout.strip() == b'7'
+    finally:
+        block.close()
+        block.unlink()
+
+    working_calendar.drop_index()
+
+
+def test_import_ics(working_calendar):
+    clear_working_calendar(working_calendar)
+
+    ics = io.StringIO(
+        'BEGIN:VCALENDAR\r\n'
+        'BEGIN:VEVENT\r\n'
+        'DTSTART;VALUE=DATE:20180101\r\n'
+        'DTEND;VALUE=DATE:20180103\r\n'
+        'SUMMARY:New Year\r\n'
+        '  holidays\r\n'
+        'END:VEVENT\r\n'
+        'BEGIN:VEVENT\r\n'
+        'DTSTART;VALUE=DATE:20170308\r\n'
+        'RRULE:FREQ=YEARLY;COUNT=3\r\n'
+        'EXDATE;VALUE=DATE:20180308\r\n'
+        'SUMMARY:Women\'s Day\r\n'
+        'END:VEVENT\r\n'
+        'BEGIN:VEVENT\r\n'
+        'DTSTART;VALUE=DATE:20160501\r\n'
+        'DURATION:P2D\r\n'
+        'RRULE:FREQ=YEARLY;UNTIL=20180501\r\n'
+        'SUMMARY:Labour Day\r\n'
+        'BEGIN:VALARM\r\n'
+        'ACTION:DISPLAY\r\n'
+        'DURATION:PT15M\r\n'
+        'SUMMARY:Working tomorrow?\r\n'
+        'END:VALARM\r\n'
+        'END:VEVENT\r\n'
+        'BEGIN:VEVENT\r\n'
+        'DTSTART:20180428T090000\r\n'
+        'DTEND:20180428T180000\r\n'
+        'SUMMARY:Working Saturday\r\n'
+        'END:VEVENT\r\n'
+        'END:VCALENDAR\r\n'
+    )
+
+    def classify(summary):
+        return DayKinds.WORKING_DAY if summary.startswith('Working') else DayKinds.HOLIDAY
+
+    assert working_calendar.import_ics(ics, date(2018, 1, 1), date(2019, 12, 31), classify) == 6
+    assert working_calendar.get_holidays() == {
+        date(2018, 1, 1),
+        date(2018, 1, 2),
+        date(2018, 5, 1),
+        date(2018, 5, 2),
+        date(2019, 3, 8),
+    }
+    assert working_calendar.get_working_days() == {date(2018, 4, 28)}
+
+    clear_working_calendar(working_calendar)
+
+    lines = [b'BEGIN:VEVENT\n', b'DTSTART:20180101\n', b'END:VEVENT\n']
+
+    assert working_calendar.import_ics(lines, date(2018, 1, 2), date(2018, 12, 31)) == 0
+    assert working_calendar.import_ics(lines, date(2018, 1, 1), date(2018, 12, 31), 'working_day') == 1
+    assert working_calendar.get_working_days() == {date(2018, 1, 1)}
+
+    clear_working_calendar(working_calendar)
+
+    lines = [
+        'BEGIN:VEVENT',
+        'DTSTART;VALUE=DATE:20181122',
+        'RRULE:FREQ=YEARLY;BYMONTH=11;BYDAY=4TH',
+        'SUMMARY:Thanksgiving Day',
+        'END:VEVENT',
+        'BEGIN:VEVENT',
+        'DTSTART;VALUE=DATE:20180528',
+        'RRULE:FREQ=YEARLY;BYMONTH=5;BYDAY=-1MO;COUNT=2',
+        'SUMMARY:Memorial Day',
+        'END:VEVENT',
+        'BEGIN:VEVENT',
+        'DTSTART;VALUE=DATE:20180101',
+        'RRULE:FREQ=YEARLY;BYMONTH=1,7;BYMONTHDAY=1,-1;UNTIL=20190101',
+        'SUMMARY:Inventory',
+        'END:VEVENT',
+        'BEGIN:VEVENT',
+        'DTSTART;VALUE=DATE:20200115',
+        'RRULE:FREQ=YEARLY;BYMONTHDAY=15;COUNT=3',
+        'SUMMARY:Payday',
+        'END:VEVENT',
+    ]
+
+    assert working_calendar.import_ics(lines, date(2018, 1, 1), date(2020, 12, 31)) == 13
+    assert working_calendar.get_holidays() == {
+        date(2018, 11, 22),
+        date(2019, 11, 28),
+        date(2020, 11, 26),
+        date(2018, 5, 28),
+        date(2019, 5, 27),
+        date(2018, 1, 1),
+        date(2018, 1, 31),
+        date(2018, 7, 1),
+        date(2018, 7, 31),
+        date(2019, 1, 1),
+        date(2020, 1, 15),
+        date(2020, 2, 15),
+        date(2020, 3, 15),
+    }
+
+    for lines, kind in (
+        (['BEGIN:VEVENT', 'DTSTART:20180101', 'RRULE:FREQ=MONTHLY', 'END:VEVENT'], DayKinds.HOLIDAY),
+        (['BEGIN:VEVENT', 'DTSTART:20180101', 'RRULE:FREQ=YEARLY;BYWEEKNO=1', 'END:VEVENT'], DayKinds.HOLIDAY),
+        (['BEGIN:VEVENT', 'DTSTART:20180101', 'RRULE:FREQ=YEARLY;BYDAY=1MO', 'END:VEVENT'], DayKinds.HOLIDAY),
+        (['BEGIN:VEVENT', 'DTSTART:20180101', 'RRULE:FREQ=YEARLY;BYMONTH=13', 'END:VEVENT'], DayKinds.HOLIDAY),
+        (['BEGIN:VEVENT', 'DTSTART:20181301', 'END:VEVENT'], DayKinds.HOLIDAY),
+        (['BEGIN:VEVENT', 'SUMMARY:No start', 'END:VEVENT'], DayKinds.HOLIDAY),
+        (['BEGIN:VEVENT', 'DTSTART:20180101', 'END:VEVENT'], DayKinds.NOT_STANDARD_WORKING_DAY),
+    ):
+        try:
+            working_calendar.import_ics(lines, date(2018, 1, 1), date(2018, 12, 31), kind)
+        except ValueError:
+            pass
+        else:
+            assert False
+
+    try:
+        working_calendar.import_ics([], date(2018, 1, 2), date(2018, 1, 1))
+    except StartGreaterEndException:
+        pass
+    else:
+        assert False
+
+    clear_working_calendar(working_calendar)
+
+
+def test_dump_load_records(working_calendar):
+    clear_working_calendar(working_calendar)
+
+    working_calendar.extend_holidays([date(2018, 3, 8), date(2018, 1, 1)])
+    working_calendar.extend_working_days([date(2018, 3, 8), date(2018, 4, 28)])
+    working_calendar.update_not_standard_working_days({date(2018, 3, 7): 420, date(2018, 2, 22): 420})
+
+    csv_file = io.StringIO(newline='')
+    working_calendar.dump_csv(csv_file)
+
+    assert csv_file.getvalue() == (
+        'date,kind,minutes\n'
+        '2018-01-01,holiday,\n'
+        '2018-02-22,not_standard_working_day,420\n'
+        '2018-03-07,not_standard_working_day,420\n'
+        '2018-03-08,holiday,\n'
+        '2018-03-08,working_day,\n'
+        '2018-04-28,working_day,\n'
+    )
+
+    json_file = io.StringIO()
+    working_calendar.dump_json(json_file)
+
+    assert json_file.getvalue().splitlines()[1] == '{"date": "2018-02-22", "kind": "not_standard_working_day", "minutes": 420}'
+
+    for load, file in ((WorkingCalendar.load_csv, csv_file), (WorkingCalendar.load_json, json_file)):
+        file.seek(0)
+        calendar = WorkingCalendar()
+
+        assert load(calendar, file) == []
+        assert calendar.get_holidays() == working_calendar.get_holidays()
+        assert calendar.get_working_days() == working_calendar.get_working_days()
+        assert calendar.get_not_standard_working_days() == working_calendar.get_not_standard_working_days()
+
+    calendar = WorkingCalendar()
+    lines = [
+        'date,kind,minutes',
+        '2018-01-01,holiday,',
+        '2018-13-01,holiday,',
+        '2018-01-02,vacation,',
+        '2018-01-03,holiday,60',
+        '2018-01-04,not_standard_working_day,0',
+        '2018-01-05,working_day',
+        '2018-01-06,working_day,',
+    ]
+
+    try:
+        calendar.load_csv(lines)
+    except InvalidRecordsException as exception:
+        assert [line for line, error in exception.errors] == [3, 4, 5, 6, 7]
+    else:
+        assert False
+
+    assert calendar.get_holidays() == set()
+    assert calendar.load_csv(lines, skip_errors=True)[0] == (3, 'invalid date \'2018-13-01\'')
+    assert calendar.get_holidays() == {date(2018, 1, 1)}
+    assert calendar.get_working_days() == {date(2018, 1, 6)}
+
+    lines = [
+        '{"date": "2018-01-01", "kind": "holiday"}',
+        '{"date": "2018-01-02", "kind": "not_standard_working_day", "minutes": "60"}',
+        '[1, 2]',
+        '{"date": "2018-01-03"',
+    ]
+
+    assert [line for line, error in calendar.load_json(lines, skip_errors=True)] == [2, 3, 4]
+
+    calendar = WorkingCalendar()
+    calendar.update_working_schedule([(time(9, 0), time(18, 0))])
+    lines = [
+        'date,kind,minutes',
+        '2018-01-01,holiday,',
+        '2018-01-02,working_day,',
+        '2018-01-03,not_standard_working_day,1000',
+        '2018-01-04,not_standard_working_day,420',
+    ]
+
+    try:
+        calendar.load_csv(lines)
+    except InvalidRecordsException as exception:
+        assert [line for line, error in exception.errors] == [4]
+    else:
+        assert False
+
+    assert calendar.get_holidays() == set()
+    assert calendar.get_working_days() == set()
+    assert calendar.get_not_standard_working_days() == {}
+    assert [line for line, error in calendar.load_csv(lines, skip_errors=True)] == [4]
+    assert calendar.get_not_standard_working_days() == {date(2018, 1, 4): 420}
+
+    clear_working_calendar(working_calendar)
+
+
+def test_pickle_copy(working_calendar):
+    clear_working_calendar(working_calendar)
+
+    working_calendar.extend_weekends([6, 7])
+    working_calendar.extend_holidays([date(2018, 3, 8), date(2018, 3, 9)])
+    working_calendar.add_working_day(date(2018, 3, 10))
+    working_calendar.update_not_standard_working_day(date(2018, 3, 7), 420)
+    working_calendar.update_working_schedule([(time(9), time(13)), (time(14), time(18))])
+    working_calendar.build_index(date(2018, 1, 1), date(2018, 12, 31), IndexKinds.FENWICK)
+
+    calendar = pickle.loads(pickle.dumps(working_calendar))
+
+    assert calendar.freeze() == working_calendar.freeze()
+    assert calendar._weekends == working_calendar._weekends
+    assert calendar._index_kind is IndexKinds.FENWICK
+    assert calendar.count_working_days_between(date(2018, 3, 1), date(2018, 3, 12)) == 7
+
+    frozen_calendar = working_calendar.freeze()
+
+    assert pickle.loads(pickle.dumps(frozen_calendar)) == frozen_calendar
+    assert copy.copy(frozen_calendar) is frozen_calendar
+    assert copy.deepcopy(frozen_calendar) is frozen_calendar
+
+    for calendar in (copy.copy(working_calendar), copy.deepcopy(working_calendar)):
+        calendar.add_holiday(date(2018, 3, 12))
+
+        assert calendar.get_holidays() is not working_calendar.get_holidays()
+        assert not working_calendar.is_holiday(date(2018, 3, 12))
+        assert calendar.count_working_days_between(date(2018, 3, 1), date(2018, 3, 12)) == 6
+        assert working_calendar.count_working_days_between(date(2018, 3, 1), date(2018, 3, 12)) == 7
+
+    calendar = copy.deepcopy(working_calendar)
+
+    for name in ('_holidays', '_working_days', '_not_standard_working_days', '_weekends'):
+        assert getattr(calendar, name) == getattr(working_calendar, name)
+        assert getattr(calendar, name) is not getattr(working_calendar, name)
+
+    calendar.get_holidays().add(date(2018, 3, 13))
+
+    assert not working_calendar.is_holiday(date(2018, 3, 13))
+
+    calendars = copy.deepcopy([working_calendar, working_calendar])
+
+    assert calendars[0] is calendars[1]
+
+    working_calendar.drop_index()
+    working_calendar.update_working_time_minutes(480)
 
 
 if __name__ == '__main__':
     wc = WorkingCalendar()
 
+    test_months_get_span()
     test_add_working_day(wc)
     test_add_holiday(wc)
     test_update_not_standard_working_day(wc)
@@ -825,11 +1945,14 @@ if __name__ == '__main__':
     test_is_additional_working_day(wc)
     test_is_holiday(wc)
     test_is_not_standard_working_day(wc)
+    test_is_weekend(wc)
     test_is_working(wc)
     test_count_working_days_between(wc)
     test_count_working_days_in_year(wc)
     test_count_working_days_in_month(wc)
     test_get_next_working_day(wc)
+    test_get_previous_working_day(wc)
+    test_holiday_runs(wc)
     test_skip_working_days(wc)
     test_count_working_minutes_between(wc)
     test_count_working_minutes_in_year(wc)
@@ -837,3 +1960,22 @@ if __name__ == '__main__':
     test_count_working_hours_between(wc)
     test_count_working_hours_in_year(wc)
     test_count_working_hours_in_month(wc)
+    test_ordinal_api(wc)
+    test_build_index(wc)
+    test_build_fenwick_index(wc)
+    test_cache()
+    test_freeze(wc)
+    test_count_working_days_between_many(wc)
+    test_skip_working_days_many(wc)
+    test_bulk_loaders(wc)
+    test_layered_calendar(wc)
+    test_clone(wc)
+    test_concurrent_calendar(wc)
+    test_iter_working_days(wc)
+    test_aggregate(wc)
+    test_count_working_minutes_between_datetimes(wc)
+    test_save_load(wc)
+    test_publish_attach(wc)
+    test_import_ics(wc)
+    test_dump_load_records(wc)
+    test_pickle_copy(wc)
@@ -1,5 +1,11 @@
 from .enumerations import (
     Months,
-    DaysOfWeek
+    DaysOfWeek,
+    DayKinds,
+    Frequencies,
+    IndexKinds
 )
 from .core import WorkingCalendar
+from .frozen import FrozenWorkingCalendar
+from .layered import LayeredWorkingCalendar
+from .concurrent import ConcurrentWorkingCalendar
@@ -0,0 +1,1377 @@
+import datetime
+
+from array import array
+from collections import namedtuple
+from itertools import islice
+from typing import (
+    Any,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+
+from .cache import CacheInfo
+from .enumerations import (
+    MONTH_OFFSETS,
+    YEAR_FIRST_ORDINALS,
+    Months,
+    DaysOfWeek,
+    Frequencies
+)
+from .exceptions import (
+    NotDateException,
+    NotDayOfWeekException,
+    NotEnoughWorkingDaysException,
+    NotWorkingScheduleException,
+    StartGreaterEndException
+)
+from .indexes import PrefixSumIndex
+from .records import (
+    iter_records,
+    write_csv,
+    write_json
+)
+from .storage import (
+    create_shared_memory,
+    pack_calendar
+)
+from .tables import Tables
+from . import vectorized
+
+
+Bucket = namedtuple('Bucket', ['start_date', 'end_date', 'working_days', 'working_minutes'])
+
+
+class BaseWorkingCalendar(object):
+    """
+    Queries of working days shared by mutable and frozen calendars.
+
+    Subclasses should set:
+    _weekend_flags — is day weekend by ordinal of date modulo 7 (bool).
+    _working_time_minutes — working minutes of normal working day (int).
+    _working_schedule — working intervals of day (minutes from midnight, int), None if schedule is not set.
+    _version — counter of changes of calendar (int).
+    _cache — cache of results of counting (QueryCache).
+
+    and implement '_get_tables'.
+    """
+
+    def _get_tables(self):
+        # type: (...) -> Tables
+
+        """
+        Return lookup tables for counting.
+
+        :return: lookup tables
+        :rtype: Tables
+        """
+
+        raise NotImplementedError
+
+    def _get_index(self):
+        # type: (...) -> Optional[PrefixSumIndex]
+
+        """
+        Return precomputed index.
+
+        :return: precomputed index or None if index is not used
+        :rtype: Optional[PrefixSumIndex]
+        """
+
+        return None
+
+    @staticmethod
+    def _check_date(
+        date  # type: datetime.date
+    ):
+        # type: (...) -> datetime.date
+
+        """
+        Check value and convert it if needed.
+
+        :param date: int, datetime.date, datetime.datetime or any else representation of date
+        :type date: datetime.date
+
+        :return: converted date
+        :rtype: datetime.date
+        """
+
+        if isinstance(date, int):
+            date = datetime.date.fromordinal(date)
+
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+
+        if isinstance(date, datetime.date):
+            return date
+
+        raise NotDateException(date.__class__.__name__)
+
+    @staticmethod
+    def _check_datetime(
+        value,  # type: datetime.datetime
+    ):
+        # type: (...) -> datetime.datetime
+
+        """
+        Check value and convert it if needed. Date is converted to midnight.
+
+        :param value: datetime.datetime or datetime.date
+        :type value: datetime.datetime
+
+        :return: converted datetime
+        :rtype: datetime.datetime
+        """
+
+        if isinstance(value, datetime.datetime):
+            return value
+
+        if isinstance(value, datetime.date):
+            return datetime.datetime.combine(value, datetime.time())
+
+        raise NotDateException(value.__class__.__name__)
+
+    @classmethod
+    def _check_dates(
+        cls,
+        dates,  # type: Any
+    ):
+        # type: (...) -> List[datetime.date]
+
+        """
+        Check values and convert them if needed in one pass.
+
+        :param dates: iterable of representations of dates, array of ordinals or 'numpy.datetime64' array
+        :type dates: Any
+
+        :return: converted dates
+        :rtype: List[datetime.date]
+        """
+
+        if vectorized.numpy is not None and isinstance(dates, vectorized.numpy.ndarray):
+            return list(map(datetime.date.fromordinal, vectorized.to_ordinals(dates).ravel().tolist()))
+
+        if isinstance(dates, (array, range)) and (not isinstance(dates, array) or dates.typecode in 'bBhHiIlLqQ'):
+            return list(map(datetime.date.fromordinal, dates))
+
+        return [date if type(date) is datetime.date else cls._check_date(date) for date in dates]
+
+    def _count_days_before(
+        self,
+        ordinal,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Count working days before ordinal.
+
+        :param ordinal: ordinal of date
+        :type ordinal: int
+
+        :return: counter of working days
+        :rtype: int
+        """
+
+        index = self._get_index()
+
+        if index is not None:
+            count = index.count_days_before(ordinal)
+
+            if count is not None:
+                return count
+
+        return self._get_tables().count_days_before(ordinal)
+
+    def _find_ordinal(
+        self,
+        count,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Return minimal ordinal which has 'count' working days before it.
+
+        :param count: counter of working days
+        :type count: int
+
+        :return: ordinal of date
+        :rtype: int
+        """
+
+        index = self._get_index()
+
+        if index is not None:
+            ordinal = index.find_ordinal(count)
+
+            if ordinal is not None:
+                return ordinal
+
+        ordinal = self._get_tables().find_ordinal(count)
+
+        if ordinal is None:
+            raise NotEnoughWorkingDaysException
+
+        return ordinal
+
+    def _count_elapsed_minutes(
+        self,
+        ordinal,  # type: int
+        minute,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Count working minutes of day before minute of day by working schedule.
+        Shorter working day ends earlier, longer working day is continued after the last interval.
+
+        :param ordinal: ordinal of date
+        :type ordinal: int
+
+        :param minute: minute of day
+        :type minute: int
+
+        :return: counter of working minutes
+        :rtype: int
+        """
+
+        day_minutes = self.count_working_minutes_between_ordinals(ordinal, ordinal)
+
+        if not day_minutes:
+            return 0
+
+        elapsed = 0
+
+        for start, end in self._working_schedule:
+            if minute <= start:
+                break
+
+            elapsed += min(minute, end) - start
+
+        last_end = self._working_schedule[-1][1]
+
+        if minute > last_end:
+            elapsed += max(min(minute - last_end, day_minutes - elapsed), 0)
+
+        return min(elapsed, day_minutes)
+
+    @staticmethod
+    def _get_bucket_bounds(
+        start,  # type: int
+        end,  # type: int
+        frequency,  # type: Frequencies
+    ):
+        # type: (...) -> List[int]
+
+        """
+        Split span to buckets (weeks from monday, months, quarters or years) cut by span.
+
+        :param start: ordinal of date for start
+        :type start: int
+
+        :param end: ordinal of date for end
+        :type end: int
+
+        :param frequency: size of bucket
+        :type frequency: Frequencies
+
+        :return: ordinals of the first dates of buckets and ordinal of the date after the last bucket
+        :rtype: List[int]
+        """
+
+        bounds = [start]
+
+        if frequency == Frequencies.WEEK:
+            # ordinal 1 is monday
+            bounds.extend(range(start + 7 - (start - 1) % 7, end + 1, 7))
+        else:
+            step = {Frequencies.MONTH: 1, Frequencies.QUARTER: 3, Frequencies.YEAR: 12}[frequency]
+            date = datetime.date.fromordinal(start)
+            year = date.year
+            month = (date.month - 1) // step * step
+
+            while True:
+                month += step
+
+                if month >= 12:
+                    month -= 12
+                    year += 1
+
+                ordinal = YEAR_FIRST_ORDINALS[year] + MONTH_OFFSETS[Months.is_leap(year)][month]
+
+                if ordinal > end:
+                    break
+
+                bounds.append(ordinal)
+
+        bounds.append(end + 1)
+
+        return bounds
+
+    @staticmethod
+    def _check_day_of_week(
+        day,  # type: Union[DaysOfWeek, int]
+    ):
+        # type: (...) -> DaysOfWeek
+
+        """
+        Check value and convert it to DaysOfWeek if needed.
+
+        :param day: day of the week
+        :type day: Union[DaysOfWeek, int]
+
+        :return: day of the week
+        :rtype: DaysOfWeek
+        """
+
+        if isinstance(day, int):
+            return DaysOfWeek(day)
+
+        if isinstance(day, DaysOfWeek):
+            return day
+
+        raise NotDayOfWeekException
+
+    def clear_cache(self):
+        """
+        Clear cache of results of counting and its statistics.
+        """
+
+        self._cache.clear()
+
+    def get_cache_info(self):
+        # type: (...) -> CacheInfo
+
+        """
+        Return statistics of cache of results of counting.
+
+        :return: hits, misses, maximal and current number of results
+        :rtype: CacheInfo
+        """
+
+        return self._cache.info()
+
+    def get_working_time_minutes(self):
+        # type: (...) -> int
+
+        """
+        Return sum of minutes of working time in working day.
+
+        :return: minutes
+        :rtype: int
+        """
+
+        return self._working_time_minutes
+
+    def get_working_schedule(self):
+        # type: (...) -> Optional[Tuple[Tuple[datetime.time, datetime.time], ...]]
+
+        """
+        Return working intervals of normal working day.
+
+        :return: pairs of times of start and end of intervals or None if schedule is not set
+        :rtype: Optional[Tuple[Tuple[datetime.time, datetime.time], ...]]
+        """
+
+        if self._working_schedule is None:
+            return None
+
+        return tuple(
+            (datetime.time(start // 60, start % 60), datetime.time(end // 60 % 24, end % 60))
+            for start, end in self._working_schedule
+        )
+
+    def dump_csv(
+        self,
+        file,  # type: Any
+    ):
+        """
+        Write holidays, additional working days and not standard working days to CSV sorted by date,
+        row by row. Header is 'date,kind,minutes', minutes are written only for not standard working days.
+        Use 'WorkingCalendar.load_csv' for loading.
+
+        :param file: text file object (opened with newline='')
+        :type file: Any
+        """
+
+        write_csv(iter_records(self), file)
+
+    def dump_json(
+        self,
+        file,  # type: Any
+    ):
+        """
+        Write holidays, additional working days and not standard working days to JSON Lines sorted by date,
+        line by line: one object with keys 'date', 'kind' and 'minutes' per line.
+        Use 'WorkingCalendar.load_json' for loading.
+
+        :param file: text file object
+        :type file: Any
+        """
+
+        write_json(iter_records(self), file)
+
+    def publish(
+        self,
+        name=None,  # type: Optional[str]
+        with_index=True,  # type: bool
+    ):
+        # type: (...) -> Any
+
+        """
+        Copy calendar to shared memory in binary format (see 'save'). Use 'FrozenWorkingCalendar.attach'
+        with name of block in other processes. Publisher should close and unlink block when it is not needed.
+
+        :param name: name of block of shared memory, default: None (unique name is generated)
+        :type name: Optional[str]
+
+        :param with_index: copy counters of precomputed index if calendar has index, default: True
+        :type with_index: bool
+
+        :return: block of shared memory
+        :rtype: multiprocessing.shared_memory.SharedMemory
+        """
+
+        return create_shared_memory(pack_calendar(self, with_index), name)
+
+    def save(
+        self,
+        path,  # type: str
+        with_index=True,  # type: bool
+    ):
+        """
+        Save calendar to file in compact binary format: header and sorted arrays of ordinals,
+        optionally followed by cumulative counters of precomputed index. Use 'FrozenWorkingCalendar.load' for loading.
+
+        :param path: path of file
+        :type path: str
+
+        :param with_index: save counters of precomputed index if calendar has index, default: True
+        :type with_index: bool
+        """
+
+        with open(path, 'wb') as file:
+            file.write(pack_calendar(self, with_index))
+
+    def update_cache_size(
+        self,
+        size,  # type: int
+    ):
+        """
+        Update maximal number of cached results of counting.
+
+        :param size: maximal number of results, 0 disables cache
+        :type size: int
+        """
+
+        self._cache.resize(size)
+
+    def is_weekend(
+        self,
+        date,  # type: datetime.date
+    ):
+        # type: (...) -> bool
+
+        """
+        Checking if date is weekend.
+
+        :param date: date for checking
+        :type date: datetime.date
+
+        :return: result of checking
+        :rtype: bool
+        """
+
+        return self._weekend_flags[self._check_date(date).toordinal() % 7]
+
+    def is_working(
+        self,
+        date,  # type: datetime.date
+    ):
+        # type: (...) -> bool
+
+        """
+        Checking if date is working day.
+
+        :param date: date for checking
+        :type date: datetime.date
+
+        :return: result of checking
+        :rtype: bool
+        """
+
+        return self.is_working_ordinal(self._check_date(date).toordinal())
+
+    def is_working_ordinal(
+        self,
+        ordinal,  # type: int
+    ):
+        # type: (...) -> bool
+
+        """
+        Checking if date is working day. Ordinal is not validated.
+
+        :param ordinal: ordinal of date for checking
+        :type ordinal: int
+
+        :return: result of checking
+        :rtype: bool
+        """
+
+        index = self._get_index()
+
+        if index is not None:
+            working = index.is_working(ordinal)
+
+            if working is not None:
+                return working
+
+        return self._get_tables().is_working(ordinal)
+
+    def aggregate(
+        self,
+        start_date,  # type: datetime.date
+        end_date,  # type: datetime.date
+        frequency=Frequencies.MONTH,  # type: Union[Frequencies, str]
+        as_array=False,  # type: bool
+    ):
+        # type: (...) -> Any
+
+        """
+        Count working days and working minutes by weeks, months, quarters or years between 2 dates in one pass.
+        The first and the last buckets are cut by dates. Weeks start from monday.
+
+        :param start_date: date for start
+        :type start_date: datetime.date
+
+        :param end_date: date for end
+        :type end_date: datetime.date
+
+        :param frequency: size of bucket, default: Frequencies.MONTH
+        :type frequency: Union[Frequencies, str]
+
+        :param as_array: return 'numpy' structured array instead of list, default: False
+        :type as_array: bool
+
+        :return: list of buckets or structured array with fields 'start_date', 'end_date', 'working_days'
+        and 'working_minutes'
+        :rtype: Union[List[Bucket], numpy.ndarray]
+        """
+
+        start_date = self._check_date(start_date)
+        end_date = self._check_date(end_date)
+
+        if start_date > end_date:
+            raise StartGreaterEndException
+
+        if not isinstance(frequency, Frequencies):
+            frequency = Frequencies(frequency)
+
+        bounds = self._get_bucket_bounds(start_date.toordinal(), end_date.toordinal(), frequency)
+        tables = self._get_tables()
+
+        if as_array:
+            vectorized.check_numpy()
+
+            bounds = vectorized.numpy.asarray(bounds, dtype=vectorized.numpy.int64)
+            buckets = vectorized.numpy.zeros(len(bounds) - 1, dtype=[
+                ('start_date', 'datetime64[D]'),
+                ('end_date', 'datetime64[D]'),
+                ('working_days', 'int64'),
+                ('working_minutes', 'int64'),
+            ])
+            buckets['start_date'] = vectorized.from_ordinals(bounds[:-1])
+            buckets['end_date'] = vectorized.from_ordinals(bounds[1:] - 1)
+            buckets['working_days'] = vectorized.numpy.diff(vectorized.count_days_before(tables, bounds))
+            buckets['working_minutes'] = vectorized.numpy.diff(vectorized.count_minutes_before(tables, bounds))
+
+            return buckets
+
+        days = [tables.count_days_before(ordinal) for ordinal in bounds]
+        minutes = [tables.count_minutes_before(ordinal) for ordinal in bounds]
+
+        return [
+            Bucket(
+                datetime.date.fromordinal(bounds[index]),
+                datetime.date.fromordinal(bounds[index + 1] - 1),
+                days[index + 1] - days[index],
+                minutes[index + 1] - minutes[index]
+            )
+            for index in range(len(bounds) - 1)
+        ]
+
+    def count_working_days_between(
+        self,
+        start_date,  # type: datetime.date
+        end_date,  # type: datetime.date
+    ):
+        # type: (...) -> int
+
+        """
+        Count working days between 2 dates.
+
+        :param start_date: date for start
+        :type start_date: datetime.date
+
+        :param end_date: date for end
+        :type end_date: datetime.date
+
+        :return: counter of working days
+        :rtype: int
+        """
+
+        start_date = self._check_date(start_date)
+        end_date = self._check_date(end_date)
+
+        if start_date > end_date:
+            raise StartGreaterEndException
+
+        return self.count_working_days_between_ordinals(start_date.toordinal(), end_date.toordinal())
+
+    def count_working_days_between_ordinals(
+        self,
+        start,  # type: int
+        end,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Count working days between 2 dates. Ordinals are not validated, start should not be greater than end.
+
+        :param start: ordinal of date for start
+        :type start: int
+
+        :param end: ordinal of date for end
+        :type end: int
+
+        :return: counter of working days
+        :rtype: int
+        """
+
+        key = ('days', start, end, self._version)
+        result = self._cache.get(key)
+
+        if result is not None:
+            return result
+
+        index = self._get_index()
+
+        if index is not None and index.covers(start, end):
+            result = index.count_days(start, end)
+        else:
+            tables = self._get_tables()
+            result = tables.count_days_before(end + 1) - tables.count_days_before(start)
+
+        self._cache.put(key, result)
+
+        return result
+
+    def count_working_days_between_many(
+        self,
+        start_dates,  # type: Any
+        end_dates,  # type: Any
+    ):
+        # type: (...) -> Any
+
+        """
+        Count working days between pairs of dates in one vectorized pass. Requires 'numpy'.
+
+        :param start_dates: dates for start ('numpy.datetime64' array, array of ordinals or sequence of dates)
+        :type start_dates: Any
+
+        :param end_dates: dates for end ('numpy.datetime64' array, array of ordinals or sequence of dates)
+        :type end_dates: Any
+
+        :return: array of counters of working days
+        :rtype: numpy.ndarray
+        """
+
+        vectorized.check_numpy()
+
+        starts = vectorized.to_ordinals(start_dates)
+        ends = vectorized.to_ordinals(end_dates)
+
+        if (starts > ends).any():
+            raise StartGreaterEndException
+
+        tables = self._get_tables()
+
+        return vectorized.count_days_before(tables, ends + 1) - vectorized.count_days_before(tables, starts)
+
+    def count_working_days_in_month(
+        self,
+        year,  # type: int
+        month,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Count working days in month.
+
+        :param year: year
+        :type year: int
+
+        :param month: month
+        :type month: int
+
+        :return: counter of working days
+        :rtype: int
+        """
+
+        return self.count_working_days_between_ordinals(*Months.get_month_span(year, month))
+
+    def count_working_days_in_year(
+        self,
+        year,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Count working days in year.
+
+        :param year: year
+        :type year: int
+
+        :return: counter of working days
+        :rtype: int
+        """
+
+        return self.count_working_days_between_ordinals(*Months.get_year_span(year))
+
+    def count_working_minutes_between(
+        self,
+        start_date,  # type: datetime.date
+        end_date,  # type: datetime.date
+    ):
+        # type: (...) -> int
+
+        """
+        Sum of working minutes between 2 dates.
+
+        :param start_date: date for start
+        :type start_date: datetime.date
+
+        :param end_date: date for end
+        :type end_date: datetime.date
+
+        :return: sum of working minutes
+        :rtype: int
+        """
+
+        start_date = self._check_date(start_date)
+        end_date = self._check_date(end_date)
+
+        if start_date > end_date:
+            raise StartGreaterEndException
+
+        return self.count_working_minutes_between_ordinals(start_date.toordinal(), end_date.toordinal())
+
+    def count_working_minutes_between_ordinals(
+        self,
+        start,  # type: int
+        end,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Sum of working minutes between 2 dates. Ordinals are not validated, start should not be greater than end.
+
+        :param start: ordinal of date for start
+        :type start: int
+
+        :param end: ordinal of date for end
+        :type end: int
+
+        :return: sum of working minutes
+        :rtype: int
+        """
+
+        key = ('minutes', start, end, self._version)
+        result = self._cache.get(key)
+
+        if result is not None:
+            return result
+
+        index = self._get_index()
+
+        if index is not None and index.covers(start, end):
+            result = index.count_minutes(start, end)
+        else:
+            tables = self._get_tables()
+            result = tables.count_minutes_before(end + 1) - tables.count_minutes_before(start)
+
+        self._cache.put(key, result)
+
+        return result
+
+    def count_working_minutes_between_many(
+        self,
+        start_dates,  # type: Any
+        end_dates,  # type: Any
+    ):
+        # type: (...) -> Any
+
+        """
+        Sum of working minutes between pairs of dates in one vectorized pass. Requires 'numpy'.
+
+        :param start_dates: dates for start ('numpy.datetime64' array, array of ordinals or sequence of dates)
+        :type start_dates: Any
+
+        :param end_dates: dates for end ('numpy.datetime64' array, array of ordinals or sequence of dates)
+        :type end_dates: Any
+
+        :return: array of sums of working minutes
+        :rtype: numpy.ndarray
+        """
+
+        vectorized.check_numpy()
+
+        starts = vectorized.to_ordinals(start_dates)
+        ends = vectorized.to_ordinals(end_dates)
+
+        if (starts > ends).any():
+            raise StartGreaterEndException
+
+        tables = self._get_tables()
+
+        return vectorized.count_minutes_before(tables, ends + 1) - vectorized.count_minutes_before(tables, starts)
+
+    def count_working_minutes_in_year(
+        self,
+        year,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Sum of working minutes in year.
+
+        :param year: year
+        :type year: int
+
+        :return: sum of working minutes
+        :rtype: int
+        """
+
+        return self.count_working_minutes_between_ordinals(*Months.get_year_span(year))
+
+    def count_working_minutes_in_month(
+        self,
+        year,  # type: int
+        month,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Sum of working minutes in month.
+
+        :param year: year
+        :type year: int
+
+        :param month: month
+        :type month: int
+
+        :return: sum of working minutes
+        :rtype: int
+        """
+
+        return self.count_working_minutes_between_ordinals(*Months.get_month_span(year, month))
+
+    def count_working_hours_between(
+        self,
+        start_date,  # type: datetime.date
+        end_date,  # type: datetime.date
+    ):
+        # type: (...) -> int
+
+        """
+        Count working hours between 2 dates.
+
+        :param start_date: date for start
+        :type start_date: datetime.date
+
+        :param end_date: date for end
+        :type end_date: datetime.date
+
+        :return: counter of working hours
+        :rtype: float
+        """
+
+        return self.count_working_minutes_between(start_date, end_date) / 60
+
+    def count_working_minutes_between_datetimes(
+        self,
+        start_datetime,  # type: datetime.datetime
+        end_datetime,  # type: datetime.datetime
+    ):
+        # type: (...) -> int
+
+        """
+        Count working minutes from one moment to another by working schedule. Seconds are ignored.
+        Whole days between moments are counted by day-level tables and index,
+        only days of moments are counted by schedule.
+
+        :param start_datetime: moment for start
+        :type start_datetime: datetime.datetime
+
+        :param end_datetime: moment for end
+        :type end_datetime: datetime.datetime
+
+        :return: counter of working minutes
+        :rtype: int
+        """
+
+        start_datetime = self._check_datetime(start_datetime)
+        end_datetime = self._check_datetime(end_datetime)
+
+        if start_datetime > end_datetime:
+            raise StartGreaterEndException
+
+        if self._working_schedule is None:
+            raise NotWorkingScheduleException
+
+        start = start_datetime.toordinal()
+        end = end_datetime.toordinal()
+        result = (
+            self._count_elapsed_minutes(end, end_datetime.hour * 60 + end_datetime.minute) -
+            self._count_elapsed_minutes(start, start_datetime.hour * 60 + start_datetime.minute)
+        )
+
+        if start < end:
+            result += self.count_working_minutes_between_ordinals(start, end - 1)
+
+        return result
+
+    def count_working_hours_between_datetimes(
+        self,
+        start_datetime,  # type: datetime.datetime
+        end_datetime,  # type: datetime.datetime
+    ):
+        # type: (...) -> float
+
+        """
+        Count working hours from one moment to another by working schedule.
+
+        :param start_datetime: moment for start
+        :type start_datetime: datetime.datetime
+
+        :param end_datetime: moment for end
+        :type end_datetime: datetime.datetime
+
+        :return: counter of working hours
+        :rtype: float
+        """
+
+        return self.count_working_minutes_between_datetimes(start_datetime, end_datetime) / 60
+
+    def count_working_hours_in_year(
+        self,
+        year,  # type: int
+    ):
+        # type: (...) -> float
+
+        """
+        Sum of working hours in year.
+
+        :param year: year
+        :type year: int
+
+        :return: sum of working hours
+        :rtype: float
+        """
+
+        return self.count_working_minutes_in_year(year) / 60
+
+    def count_working_hours_in_month(
+        self,
+        year,  # type: int
+        month,  # type: int
+    ):
+        # type: (...) -> float
+
+        """
+        Sum of working hours in month.
+
+        :param year: year
+        :type year: int
+
+        :param month: month
+        :type month: int
+
+        :return: sum of working hours
+        :rtype: float
+        """
+
+        return self.count_working_minutes_in_month(year, month) / 60
+
+    def get_next_working_day(
+        self,
+        date,  # type: datetime.date
+    ):
+        # type: (...) -> datetime.date
+
+        """
+        Return date of the next working day.
+
+        :param date: date for start
+        :type date: datetime.date
+
+        :return: date of the next working day
+        :rtype: datetime.date
+        """
+
+        return datetime.date.fromordinal(self.get_next_working_ordinal(self._check_date(date).toordinal()))
+
+    def get_next_working_ordinal(
+        self,
+        ordinal,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Return ordinal of the next working day. Ordinal is not validated.
+
+        :param ordinal: ordinal of date for start
+        :type ordinal: int
+
+        :return: ordinal of the next working day
+        :rtype: int
+        """
+
+        ordinal = self._get_tables().find_next_working(ordinal + 1)
+
+        if ordinal is None:
+            raise NotEnoughWorkingDaysException
+
+        return ordinal
+
+    def get_previous_working_day(
+        self,
+        date,  # type: datetime.date
+    ):
+        # type: (...) -> datetime.date
+
+        """
+        Return date of the previous working day.
+
+        :param date: date for start
+        :type date: datetime.date
+
+        :return: date of the previous working day
+        :rtype: datetime.date
+        """
+
+        return datetime.date.fromordinal(self.get_previous_working_ordinal(self._check_date(date).toordinal()))
+
+    def get_previous_working_ordinal(
+        self,
+        ordinal,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Return ordinal of the previous working day. Ordinal is not validated.
+
+        :param ordinal: ordinal of date for start
+        :type ordinal: int
+
+        :return: ordinal of the previous working day
+        :rtype: int
+        """
+
+        ordinal = self._get_tables().find_previous_working(ordinal - 1)
+
+        if ordinal is None:
+            raise NotEnoughWorkingDaysException
+
+        return ordinal
+
+    def iter_working_days(
+        self,
+        start_date,  # type: datetime.date
+        end_date,  # type: datetime.date
+        step=1,  # type: int
+    ):
+        # type: (...) -> Iterator[datetime.date]
+
+        """
+        Return lazy iterator of working days between 2 dates.
+        Iterator jumps from one working day to the next one without checking of days between them.
+
+        :param start_date: date for start
+        :type start_date: datetime.date
+
+        :param end_date: date for end
+        :type end_date: datetime.date
+
+        :param step: return every 'step'-th working day, default: 1
+        :type step: int
+
+        :return: iterator of working days
+        :rtype: Iterator[datetime.date]
+        """
+
+        start_date = self._check_date(start_date)
+        end_date = self._check_date(end_date)
+
+        if start_date > end_date:
+            raise StartGreaterEndException
+
+        if not (
+            isinstance(step, int) and
+            step > 0
+        ):
+            raise ValueError('Argument \'step\' must be integer greater than 0.')
+
+        return map(
+            datetime.date.fromordinal,
+            self.iter_working_ordinals(start_date.toordinal(), end_date.toordinal(), step)
+        )
+
+    def iter_working_ordinals(
+        self,
+        start,  # type: int
+        end,  # type: int
+        step=1,  # type: int
+    ):
+        # type: (...) -> Iterator[int]
+
+        """
+        Return lazy iterator of ordinals of working days between 2 dates. Arguments are not validated.
+        Iterator uses state of calendar at the moment of the first step.
+
+        :param start: ordinal of date for start
+        :type start: int
+
+        :param end: ordinal of date for end
+        :type end: int
+
+        :param step: return every 'step'-th working day, default: 1
+        :type step: int
+
+        :return: iterator of ordinals of working days
+        :rtype: Iterator[int]
+        """
+
+        tables = self._get_tables()
+        ordinal = tables.find_next_working(start)
+
+        if step > 1 and ordinal is not None:
+            count = tables.count_days_before(ordinal + 1)
+
+        while ordinal is not None and ordinal <= end:
+            yield ordinal
+
+            if step == 1:
+                ordinal = tables.find_next_working(ordinal + 1)
+            else:
+                count += step
+                ordinal = tables.find_ordinal(count)
+
+                if ordinal is not None:
+                    ordinal -= 1
+
+    def iter_working_ordinal_chunks(
+        self,
+        start_date,  # type: datetime.date
+        end_date,  # type: datetime.date
+        size=4096,  # type: int
+    ):
+        # type: (...) -> Iterator[array]
+
+        """
+        Return lazy iterator of arrays of ordinals of working days between 2 dates.
+        Every array has 'size' ordinals except the last one, so memory is bounded for any span.
+
+        :param start_date: date for start
+        :type start_date: datetime.date
+
+        :param end_date: date for end
+        :type end_date: datetime.date
+
+        :param size: maximal number of ordinals in array, default: 4096
+        :type size: int
+
+        :return: iterator of arrays of ordinals
+        :rtype: Iterator[array]
+        """
+
+        start_date = self._check_date(start_date)
+        end_date = self._check_date(end_date)
+
+        if start_date > end_date:
+            raise StartGreaterEndException
+
+        if not (
+            isinstance(size, int) and
+            size > 0
+        ):
+            raise ValueError('Argument \'size\' must be integer greater than 0.')
+
+        ordinals = self.iter_working_ordinals(start_date.toordinal(), end_date.toordinal())
+
+        return iter(lambda: array('l', islice(ordinals, size)), array('l'))
+
+    def iter_non_working_days(
+        self,
+        start_date,  # type: datetime.date
+        end_date,  # type: datetime.date
+    ):
+        # type: (...) -> Iterator[datetime.date]
+
+        """
+        Return lazy iterator of not working days between 2 dates.
+        Iterator jumps from one not working day to the next one without checking of days between them.
+
+        :param start_date: date for start
+        :type start_date: datetime.date
+
+        :param end_date: date for end
+        :type end_date: datetime.date
+
+        :return: iterator of not working days
+        :rtype: Iterator[datetime.date]
+        """
+
+        start_date = self._check_date(start_date)
+        end_date = self._check_date(end_date)
+
+        if start_date > end_date:
+            raise StartGreaterEndException
+
+        return map(
+            datetime.date.fromordinal,
+            self.iter_non_working_ordinals(start_date.toordinal(), end_date.toordinal())
+        )
+
+    def iter_non_working_ordinals(
+        self,
+        start,  # type: int
+        end,  # type: int
+    ):
+        # type: (...) -> Iterator[int]
+
+        """
+        Return lazy iterator of ordinals of not working days between 2 dates. Arguments are not validated.
+        Iterator uses state of calendar at the moment of the first step.
+
+        :param start: ordinal of date for start
+        :type start: int
+
+        :param end: ordinal of date for end
+        :type end: int
+
+        :return: iterator of ordinals of not working days
+        :rtype: Iterator[int]
+        """
+
+        tables = self._get_tables()
+        ordinal = tables.find_next_not_working(start)
+
+        while ordinal is not None and ordinal <= end:
+            yield ordinal
+
+            ordinal = tables.find_next_not_working(ordinal + 1)
+
+    def skip_working_days(
+        self,
+        date,  # type: datetime.date
+        skip_days,  # type: int
+    ):
+        # type: (...) -> datetime.date
+
+        """
+        Return date after skipping from start date.
+        Negative counter skips working days backward: result is date before skipped working days.
+
+        :param date: date for start
+        :type date: datetime.date
+
+        :param skip_days: counter of working days for skipping
+        :type skip_days: int
+
+        :return: date after skipping
+        :rtype: datetime.date
+        """
+
+        date = self._check_date(date)
+
+        if not isinstance(skip_days, int):
+            raise ValueError('Argument \'skip_days\' must be integer.')
+
+        return datetime.date.fromordinal(self.skip_working_days_ordinal(date.toordinal(), skip_days))
+
+    def skip_working_days_ordinal(
+        self,
+        ordinal,  # type: int
+        skip_days,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Return ordinal of date after skipping from start date. Arguments are not validated.
+
+        :param ordinal: ordinal of date for start
+        :type ordinal: int
+
+        :param skip_days: counter of working days for skipping
+        :type skip_days: int
+
+        :return: ordinal of date after skipping
+        :rtype: int
+        """
+
+        if skip_days > 0:
+            return self._find_ordinal(self._count_days_before(ordinal) + skip_days)
+
+        if skip_days < 0:
+            return self._find_ordinal(self._count_days_before(ordinal + 1) + skip_days + 1) - 2
+
+        return ordinal
+
+    def skip_working_days_many(
+        self,
+        dates,  # type: Any
+        skip_days,  # type: Any
+    ):
+        # type: (...) -> Any
+
+        """
+        Return dates after skipping from start dates in one vectorized pass. Requires 'numpy'.
+        Negative counters skip working days backward like 'skip_working_days'.
+
+        :param dates: dates for start ('numpy.datetime64' array, array of ordinals or sequence of dates)
+        :type dates: Any
+
+        :param skip_days: counters of working days for skipping
+        :type skip_days: Any
+
+        :return: array of dates after skipping
+        :rtype: numpy.ndarray
+        """
+
+        vectorized.check_numpy()
+
+        ordinals = vectorized.to_ordinals(dates)
+        skip_days = vectorized.numpy.asarray(skip_days)
+
+        if skip_days.dtype.kind not in 'iu':
+            raise ValueError('Argument \'skip_days\' must be integer array.')
+
+        ordinals, skip_days = vectorized.numpy.broadcast_arrays(ordinals, skip_days.astype(vectorized.numpy.int64))
+        result = ordinals.copy()
+        tables = self._get_tables()
+
+        forward = skip_days > 0
+
+        if forward.any():
+            counts = vectorized.count_days_before(tables, ordinals[forward]) + skip_days[forward]
+            result[forward] = vectorized.find_ordinals(tables, counts)
+
+        backward = skip_days < 0
+
+        if backward.any():
+            counts = vectorized.count_days_before(tables, ordinals[backward] + 1) + skip_days[backward] + 1
+            result[backward] = vectorized.find_ordinals(tables, counts) - 2
+
+        return vectorized.from_ordinals(result)
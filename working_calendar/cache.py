@@ -0,0 +1,157 @@
+import threading
+
+from collections import (
+    OrderedDict,
+    namedtuple
+)
+from typing import (
+    Any,
+    Hashable,
+    Optional,
+    Tuple
+)
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class QueryCache(object):
+    """
+    Bounded cache of query results with eviction of least recently used results.
+    Cache is guarded by lock, so one cache can be used by many threads (for example: by shared snapshot).
+
+    maxsize — maximal number of results (int), 0 disables cache.
+    hits — counter of found results (int).
+    misses — counter of not found results (int).
+    _results — results by keys from least to most recently used (OrderedDict).
+    _lock — lock of results and counters (threading.Lock).
+    """
+
+    def __init__(
+        self,
+        maxsize=0,  # type: int
+    ):
+        """
+        :param maxsize: maximal number of results, default: 0 (cache is disabled)
+        :type maxsize: int
+        """
+
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = 0
+        self.hits = 0
+        self.misses = 0
+
+        self.resize(maxsize)
+
+    def __reduce__(self):
+        # type: (...) -> Tuple[Any, ...]
+
+        """
+        Pickle only maximal number of results, lock can not be pickled and results are not needed.
+
+        :return: class and its arguments
+        :rtype: Tuple[Any, ...]
+        """
+
+        return self.__class__, (self.maxsize,)
+
+    def get(
+        self,
+        key,  # type: Hashable
+    ):
+        # type: (...) -> Optional[Any]
+
+        """
+        Return result by key.
+
+        :param key: key of query
+        :type key: Hashable
+
+        :return: result or None if there is no result
+        :rtype: Optional[Any]
+        """
+
+        if not self.maxsize:
+            return None
+
+        with self._lock:
+            result = self._results.get(key)
+
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._results.move_to_end(key)
+
+        return result
+
+    def put(
+        self,
+        key,  # type: Hashable
+        result,  # type: Any
+    ):
+        """
+        Save result by key.
+
+        :param key: key of query
+        :type key: Hashable
+
+        :param result: result of query
+        :type result: Any
+        """
+
+        if not self.maxsize:
+            return
+
+        with self._lock:
+            self._results[key] = result
+
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def resize(
+        self,
+        maxsize,  # type: int
+    ):
+        """
+        Update maximal number of results. Least recently used results are removed if needed.
+
+        :param maxsize: maximal number of results, 0 disables cache
+        :type maxsize: int
+        """
+
+        if not (
+            isinstance(maxsize, int) and
+            maxsize >= 0
+        ):
+            raise ValueError('Argument \'maxsize\' must be integer greater or equal than 0.')
+
+        with self._lock:
+            self.maxsize = maxsize
+
+            while len(self._results) > maxsize:
+                self._results.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove all results and reset counters.
+        """
+
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        # type: (...) -> CacheInfo
+
+        """
+        Return statistics of cache.
+
+        :return: hits, misses, maximal and current number of results
+        :rtype: CacheInfo
+        """
+
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._results))
@@ -0,0 +1,224 @@
+import functools
+import threading
+
+from contextlib import contextmanager
+from typing import (
+    Callable,
+    Iterator,
+    Optional
+)
+
+from .core import WorkingCalendar
+from .frozen import FrozenWorkingCalendar
+
+
+# methods of 'WorkingCalendar' which change calendar
+MUTATORS = (
+    'add_holiday',
+    'add_weekend',
+    'add_working_day',
+    'build_index',
+    'clear_holidays',
+    'clear_not_standard_working_days',
+    'clear_weekends',
+    'clear_working_days',
+    'drop_index',
+    'extend_holidays',
+    'extend_weekends',
+    'extend_working_days',
+    'import_ics',
+    'load_csv',
+    'load_json',
+    'remove_holiday',
+    'remove_not_standard_working_day',
+    'remove_weekend',
+    'remove_working_day',
+    'update_cache_size',
+    'update_not_standard_working_day',
+    'update_not_standard_working_days',
+    'update_working_schedule',
+    'update_working_time_minutes',
+)
+
+# methods of 'FrozenWorkingCalendar' which only read calendar
+QUERIES = (
+    'aggregate',
+    'clear_cache',
+    'count_working_days_between',
+    'count_working_days_between_many',
+    'count_working_days_between_ordinals',
+    'count_working_days_in_month',
+    'count_working_days_in_year',
+    'count_working_hours_between',
+    'count_working_hours_between_datetimes',
+    'count_working_hours_in_month',
+    'count_working_hours_in_year',
+    'count_working_minutes_between',
+    'count_working_minutes_between_datetimes',
+    'count_working_minutes_between_many',
+    'count_working_minutes_between_ordinals',
+    'count_working_minutes_in_month',
+    'count_working_minutes_in_year',
+    'dump_csv',
+    'dump_json',
+    'get_cache_info',
+    'get_holidays',
+    'get_next_working_day',
+    'get_next_working_ordinal',
+    'get_not_standard_working_days',
+    'get_previous_working_day',
+    'get_previous_working_ordinal',
+    'get_working_days',
+    'get_working_schedule',
+    'get_working_time_minutes',
+    'is_additional_working_day',
+    'is_holiday',
+    'is_not_standard_working_day',
+    'is_weekend',
+    'is_working',
+    'is_working_ordinal',
+    'iter_non_working_days',
+    'iter_non_working_ordinals',
+    'iter_working_days',
+    'iter_working_ordinal_chunks',
+    'iter_working_ordinals',
+    'publish',
+    'save',
+    'skip_working_days',
+    'skip_working_days_many',
+    'skip_working_days_ordinal',
+)
+
+
+def _query(
+    name,  # type: str
+):
+    # type: (...) -> Callable
+
+    """
+    Return method which calls query of published snapshot.
+
+    :param name: name of query
+    :type name: str
+
+    :return: method
+    :rtype: Callable
+    """
+
+    @functools.wraps(getattr(FrozenWorkingCalendar, name))
+    def method(self, *args, **kwargs):
+        return getattr(self._snapshot, name)(*args, **kwargs)
+
+    return method
+
+
+def _mutator(
+    name,  # type: str
+):
+    # type: (...) -> Callable
+
+    """
+    Return method which changes calendar and publishes new snapshot.
+
+    :param name: name of mutator
+    :type name: str
+
+    :return: method
+    :rtype: Callable
+    """
+
+    @functools.wraps(getattr(WorkingCalendar, name))
+    def method(self, *args, **kwargs):
+        with self.transaction() as calendar:
+            return getattr(calendar, name)(*args, **kwargs)
+
+    return method
+
+
+class ConcurrentWorkingCalendar(object):
+    """
+    Working calendar for many reading threads and rare changes (read-copy-update).
+
+    Queries are answered by published immutable snapshot without locks, so reader always sees
+    consistent calendar. Changes are applied to private calendar under lock of writers,
+    then new snapshot is published by replacing of one attribute (atomic operation).
+    Use 'freeze' for several queries over the same snapshot. Snapshot has cache of the same size
+    as private calendar, cache is shared by readers and guarded by its own lock.
+
+    Calendar has all queries of 'FrozenWorkingCalendar' and all mutators of 'WorkingCalendar'.
+
+    _calendar — private calendar for changes (WorkingCalendar).
+    _lock — lock of writers (threading.Lock).
+    _snapshot — published snapshot (FrozenWorkingCalendar).
+    """
+
+    def __init__(
+        self,
+        calendar=None,  # type: Optional[WorkingCalendar]
+    ):
+        """
+        :param calendar: initial state of calendar (it is cloned, not changed), default: new 'WorkingCalendar'
+        :type calendar: Optional[WorkingCalendar]
+        """
+
+        if calendar is None:
+            calendar = WorkingCalendar()
+        elif not isinstance(calendar, WorkingCalendar):
+            raise ValueError('Argument \'calendar\' must be instance of \'WorkingCalendar\'.')
+
+        self._calendar = calendar.clone()
+        self._lock = threading.Lock()
+        self._snapshot = self._calendar.freeze()
+
+    @contextmanager
+    def transaction(self):
+        # type: (...) -> Iterator[WorkingCalendar]
+
+        """
+        Apply several changes as one: new snapshot is published once after all changes.
+        If exception is raised, changes are discarded.
+
+        :return: private calendar for changes
+        :rtype: Iterator[WorkingCalendar]
+        """
+
+        with self._lock:
+            calendar = self._calendar.clone()
+            yield calendar
+            self._snapshot = calendar.freeze()
+            self._calendar = calendar
+
+    def freeze(self):
+        # type: (...) -> FrozenWorkingCalendar
+
+        """
+        Return published snapshot.
+
+        :return: immutable snapshot
+        :rtype: FrozenWorkingCalendar
+        """
+
+        return self._snapshot
+
+    def thaw(self):
+        # type: (...) -> WorkingCalendar
+
+        """
+        Return mutable copy of calendar, changes of copy are not published.
+
+        :return: copy of calendar
+        :rtype: WorkingCalendar
+        """
+
+        with self._lock:
+            return self._calendar.clone()
+
+
+for _name in QUERIES:
+    if not hasattr(ConcurrentWorkingCalendar, _name):
+        setattr(ConcurrentWorkingCalendar, _name, _query(_name))
+
+for _name in MUTATORS:
+    setattr(ConcurrentWorkingCalendar, _name, _mutator(_name))
+
+del _name
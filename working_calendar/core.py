@@ -1,24 +1,57 @@
 import datetime
 
+from array import array
 from typing import (
+    Any,
+    Callable,
     Dict,
     Iterable,
+    Iterator,
+    List,
+    Mapping,
     Optional,
+    Tuple,
     Union
 )
 
+from .base import BaseWorkingCalendar
 from .enumerations import (
-    Months,
-    DaysOfWeek
+    DaysOfWeek,
+    DayKinds,
+    IndexKinds
 )
+from .cache import QueryCache
 from .exceptions import (
-    NotDateException,
-    NotDayOfWeekException,
+    InvalidRecordsException,
     StartGreaterEndException
 )
+from .frozen import FrozenWorkingCalendar
+from .indexes import (
+    FenwickIndex,
+    PrefixSumIndex
+)
+from .ics import (
+    iter_event_ordinals,
+    iter_events
+)
+from .records import (
+    read_csv,
+    read_json
+)
+from .storage import (
+    pack_calendar,
+    unpack_calendar
+)
+from .tables import Tables
 
 
-class WorkingCalendar(object):
+INDEX_CLASSES = {
+    IndexKinds.PREFIX_SUM: PrefixSumIndex,
+    IndexKinds.FENWICK: FenwickIndex,
+}
+
+
+class WorkingCalendar(BaseWorkingCalendar):
     """
     Utility for operates with working days.
 
@@ -26,13 +59,23 @@ class WorkingCalendar(object):
     _holidays — set of holidays (datetime.date).
     _not_standard_working_days — dictionary (key is working day (datetime.date) and value is working time minutes).
     _weekends — what days of week are weekends (int).
+    _weekend_flags — is day weekend by ordinal of date modulo 7 (bool), refreshed after changes of weekends.
     _working_time_minutes — working minutes of normal working day
+    _working_schedule — working intervals of day (minutes from midnight, int), None if schedule is not set.
+    _version — counter of changes of calendar (int).
+    _cache — cache of results of counting (QueryCache).
+    _tables — lookup tables for counting (Tables), None if should be rebuilt.
+    _index_span — ordinals of first and last dates of precomputed index (int), None if index is not used.
+    _index_kind — kind of precomputed index (IndexKinds).
+    _index — precomputed index (PrefixSumIndex or FenwickIndex), None if should be rebuilt.
+    _shared — names of containers shared with clones (str), container is copied before first change.
     """
 
     def __init__(
         self,
         weekends=None,  # type: Optional[Iterable[Union[DaysOfWeek, int]]]
-        working_time_minutes=480  # type: Optional[int]
+        working_time_minutes=480,  # type: Optional[int]
+        cache_size=0,  # type: int
     ):
         """
         :param weekends: days of the week
@@ -40,72 +83,336 @@ class WorkingCalendar(object):
 
         :param working_time_minutes: working time for one working day in minutes, default: 8 * 60
         :type working_time_minutes: int
+
+        :param cache_size: maximal number of cached results of counting, default: 0 (cache is disabled)
+        :type cache_size: int
         """
 
         self._working_days = set()
         self._holidays = set()
         self._weekends = set()
+        self._weekend_flags = (False,) * 7
         self._not_standard_working_days = dict()
+        self._version = 0
+        self._cache = QueryCache(cache_size)
+        self._tables = None
+        self._index_span = None
+        self._index_kind = IndexKinds.PREFIX_SUM
+        self._index = None
+        self._shared = set()
 
         if weekends is None:
             self._weekends.add(DaysOfWeek.SATURDAY)
             self._weekends.add(DaysOfWeek.SUNDAY)
+            self._update_weekend_flags()
         else:
             self.extend_weekends(weekends)
 
         self._working_time_minutes = 0
+        self._working_schedule = None
         self.update_working_time_minutes(working_time_minutes)
 
-    @staticmethod
-    def _check_date(
-        date  # type: datetime.date
+    def __getstate__(self):
+        # type: (...) -> Tuple[bytes, int, Optional[Tuple[int, int]], str]
+
+        """
+        Return compact state for pickling: calendar in binary format (mask of weekends and packed ordinals),
+        size of cache and span and kind of index. Lookup tables, index and cached results are rebuilt after loading.
+
+        :return: state of calendar
+        :rtype: Tuple[bytes, int, Optional[Tuple[int, int]], str]
+        """
+
+        return pack_calendar(self, with_index=False), self._cache.maxsize, self._index_span, self._index_kind.value
+
+    def __setstate__(
+        self,
+        state,  # type: Tuple[bytes, int, Optional[Tuple[int, int]], str]
     ):
-        # type: (...) -> datetime.date
+        """
+        Restore calendar from state returned by '__getstate__'.
 
+        :param state: state of calendar
+        :type state: Tuple[bytes, int, Optional[Tuple[int, int]], str]
         """
-        Check value and convert it if needed.
 
-        :param date: int, datetime.date, datetime.datetime or any else representation of date
-        :type date: datetime.date
+        buffer, cache_size, index_span, index_kind = state
+        data = unpack_calendar(buffer)
+
+        self._working_days = set(map(datetime.date.fromordinal, data.working_days))
+        self._holidays = set(map(datetime.date.fromordinal, data.holidays))
+        self._weekends = {DaysOfWeek(residue or 7) for residue, flag in enumerate(data.weekend_flags) if flag}
+        self._weekend_flags = data.weekend_flags
+        self._not_standard_working_days = dict(zip(
+            map(datetime.date.fromordinal, data.not_standard_ordinals),
+            data.not_standard_minutes
+        ))
+        self._working_time_minutes = data.working_time_minutes
+        self._working_schedule = data.working_schedule
+        self._version = 0
+        self._cache = QueryCache(cache_size)
+        self._tables = None
+        self._index_span = index_span
+        self._index_kind = IndexKinds(index_kind)
+        self._index = None
+        self._shared = set()
+
+    def __copy__(self):
+        # type: (...) -> WorkingCalendar
+
+        """
+        Return copy of calendar (see 'clone').
+
+        :return: copy of calendar
+        :rtype: WorkingCalendar
+        """
+
+        return self.clone()
+
+    def __deepcopy__(
+        self,
+        memo,  # type: Dict[int, Any]
+    ):
+        # type: (...) -> WorkingCalendar
+
+        """
+        Return independent copy of calendar. Holidays, additional working days, not standard working days
+        and weekends are copied, dates, lookup tables and not incremental index are immutable, so they are shared.
+
+        :param memo: copied objects by identifiers
+        :type memo: Dict[int, Any]
+
+        :return: copy of calendar
+        :rtype: WorkingCalendar
+        """
+
+        copy = self.__class__.__new__(self.__class__)
+        copy.__dict__.update(self.__dict__)
+        copy._holidays = set(self._holidays)
+        copy._working_days = set(self._working_days)
+        copy._not_standard_working_days = dict(self._not_standard_working_days)
+        copy._weekends = set(self._weekends)
+        copy._cache = QueryCache(self._cache.maxsize)
+        copy._shared = set()
+
+        if self._index is not None and self._index.incremental:
+            # incremental index is changed in place, so copy builds its own one
+            copy._index = None
+
+        memo[id(self)] = copy
+
+        return copy
+
+    def _changed(
+        self,
+        date=None,  # type: Optional[datetime.date]
+    ):
+        """
+        Register change of calendar: increase version and reset lookup tables.
+        Incremental index is updated in place after change of single date and rebuilt after other changes.
+
+        :param date: changed date or None if calendar is changed entirely
+        :type date: Optional[datetime.date]
+        """
+
+        self._version += 1
+        self._tables = None
+
+        if self._index is not None and self._index.incremental:
+            if date is None:
+                self._index = None
+            else:
+                working = date in self._working_days or (
+                    date not in self._holidays and
+                    not self._weekend_flags[date.toordinal() % 7]
+                )
+                minutes = self._not_standard_working_days.get(date, self._working_time_minutes) if working else 0
+                self._index.update(date.toordinal(), working, minutes)
+
+    def _get_tables(self):
+        # type: (...) -> Tables
+
+        """
+        Return lookup tables for counting. Tables are rebuilt after any change of calendar.
+
+        :return: lookup tables
+        :rtype: Tables
+        """
+
+        if self._tables is None:
+            self._tables = Tables(
+                self._weekend_flags,
+                self._working_time_minutes,
+                {date.toordinal() for date in self._holidays},
+                {date.toordinal() for date in self._working_days},
+                {date.toordinal(): minutes for date, minutes in self._not_standard_working_days.items()}
+            )
+
+        return self._tables
+
+    def _get_index(self):
+        # type: (...) -> Optional[Union[PrefixSumIndex, FenwickIndex]]
+
+        """
+        Return precomputed index. Index is rebuilt after changes of calendar unless it is updated in place.
+
+        :return: precomputed index or None if index is not used
+        :rtype: Optional[Union[PrefixSumIndex, FenwickIndex]]
+        """
+
+        if self._index_span is None:
+            return None
+
+        if self._index is None or not (self._index.incremental or self._index.tables is self._tables):
+            index_class = INDEX_CLASSES[self._index_kind]
+            self._index = index_class(self._get_tables(), self._index_span[0], self._index_span[1])
+
+        return self._index
+
+    def _unshare(
+        self,
+        name,  # type: str
+        keep=True,  # type: bool
+    ):
+        """
+        Copy container before change if it is shared with clones.
+
+        :param name: name of container
+        :type name: str
+
+        :param keep: copy items of container, default: True (False if container will be cleared)
+        :type keep: bool
+        """
+
+        if name in self._shared:
+            container = getattr(self, name)
+            setattr(self, name, container.copy() if keep else container.__class__())
+            self._shared.discard(name)
+
+    def _load_records(
+        self,
+        rows,  # type: Iterator[Tuple[int, Optional[Tuple[int, DayKinds, Optional[int]]], Optional[str]]]
+        skip_errors,  # type: bool
+    ):
+        # type: (...) -> List[Tuple[int, str]]
 
-        :return: converted date
-        :rtype: datetime.date
         """
+        Load parsed records: all rows are validated first (including limit of working time by working schedule),
+        then dates are added in one pass of each kind, so calendar is not changed if any row is invalid.
+
+        :param rows: number of line, record and error of each row
+        :type rows: Iterator[Tuple[int, Optional[Tuple[int, DayKinds, Optional[int]]], Optional[str]]]
+
+        :param skip_errors: load valid records if there are invalid ones
+        :type skip_errors: bool
+
+        :return: numbers of lines and errors of invalid records
+        :rtype: List[Tuple[int, str]]
+        """
+
+        holidays = array('l')
+        working_days = array('l')
+        not_standard_working_days = dict()
+        errors = []
+
+        for line, record, error in rows:
+            if record is None:
+                errors.append((line, error))
+            elif record[1] is DayKinds.HOLIDAY:
+                holidays.append(record[0])
+            elif record[1] is DayKinds.WORKING_DAY:
+                working_days.append(record[0])
+            else:
+                # working time is checked by working schedule of calendar before any change of calendar
+                try:
+                    self._check_not_standard_minutes(record[2])
+                except ValueError as exception:
+                    errors.append((line, str(exception)))
+                else:
+                    not_standard_working_days[datetime.date.fromordinal(record[0])] = record[2]
 
-        if isinstance(date, int):
-            date = datetime.date.fromordinal(date)
+        if errors and not skip_errors:
+            raise InvalidRecordsException(errors)
 
-        if isinstance(date, datetime.datetime):
-            date = date.date()
+        self.extend_holidays(holidays)
+        self.extend_working_days(working_days)
+        self.update_not_standard_working_days(not_standard_working_days)
 
-        if isinstance(date, datetime.date):
-            return date
+        return errors
 
-        raise NotDateException(date.__class__.__name__)
+    def _update_weekend_flags(self):
+        """
+        Refresh flags of weekends by ordinal of date modulo 7 (ordinal 0 is sunday, ordinal 1 is monday, etc.).
+        """
+
+        self._weekend_flags = tuple(DaysOfWeek(residue or 7) in self._weekends for residue in range(7))
+
+    def _check_not_standard_minutes(
+        self,
+        working_time_minutes,  # type: int
+    ):
+        """
+        Check working time of not standard working day. If working schedule is set, working day must end
+        before midnight (see '_get_day_minutes_limit').
+
+        :param working_time_minutes: number of working minutes of the working day
+        :type working_time_minutes: int
+        """
+
+        if not (
+            isinstance(working_time_minutes, int) and
+            working_time_minutes > 0
+        ):
+            raise ValueError('Argument \'working_time_minutes\' must be integer greater than 0.')
+
+        if self._working_schedule is not None:
+            limit = self._get_day_minutes_limit(self._working_schedule)
+
+            if working_time_minutes > limit:
+                raise ValueError(
+                    'Argument \'working_time_minutes\' must not be greater than {} '
+                    '(working day must end before midnight).'.format(limit)
+                )
 
     @staticmethod
-    def _check_day_of_week(
-        day,  # type: Union[DaysOfWeek, int]
+    def _get_day_minutes_limit(
+        schedule,  # type: Tuple[Tuple[int, int], ...]
     ):
-        # type: (...) -> DaysOfWeek
+        # type: (...) -> int
 
         """
-        Check value and convert it to DaysOfWeek if needed.
+        Return maximal working time of day by working schedule: longer working day is continued
+        after the last interval, so it must end before midnight.
 
-        :param day: day of the week
-        :type day: Union[DaysOfWeek, int]
+        :param schedule: sorted working intervals of day in minutes from midnight
+        :type schedule: Tuple[Tuple[int, int], ...]
 
-        :return: day of the week
-        :rtype: DaysOfWeek
+        :return: maximal number of working minutes
+        :rtype: int
         """
 
-        if isinstance(day, int):
-            return DaysOfWeek(day)
+        return sum(end - start for start, end in schedule) + 1440 - schedule[-1][1]
 
-        if isinstance(day, DaysOfWeek):
-            return day
+    @staticmethod
+    def _check_index_kind(
+        kind,  # type: Union[IndexKinds, str]
+    ):
+        # type: (...) -> IndexKinds
 
-        raise NotDayOfWeekException
+        """
+        Check value and convert it to IndexKinds if needed.
+
+        :param kind: kind of index
+        :type kind: Union[IndexKinds, str]
+
+        :return: kind of index
+        :rtype: IndexKinds
+        """
+
+        if isinstance(kind, IndexKinds):
+            return kind
+
+        return IndexKinds(kind)
 
     def add_holiday(
         self,
@@ -118,7 +425,10 @@ class WorkingCalendar(object):
         :type date: datetime.date
         """
 
-        self._holidays.add(self._check_date(date))
+        date = self._check_date(date)
+        self._unshare('_holidays')
+        self._holidays.add(date)
+        self._changed(date)
 
     def add_weekend(
         self,
@@ -131,7 +441,10 @@ class WorkingCalendar(object):
         :type weekend: Union[DaysOfWeek, int]
         """
 
+        self._unshare('_weekends')
         self._weekends.add(self._check_day_of_week(weekend))
+        self._update_weekend_flags()
+        self._changed()
 
     def add_working_day(
         self,
@@ -144,49 +457,133 @@ class WorkingCalendar(object):
         :type date: datetime.date
         """
 
-        self._working_days.add(self._check_date(date))
+        date = self._check_date(date)
+        self._unshare('_working_days')
+        self._working_days.add(date)
+        self._changed(date)
+
+    def build_index(
+        self,
+        start_date,  # type: datetime.date
+        end_date,  # type: datetime.date
+        kind=IndexKinds.PREFIX_SUM,  # type: Union[IndexKinds, str]
+    ):
+        """
+        Precompute index of days between 2 dates. Index is rebuilt automatically after changes of calendar.
+
+        Kinds of index:
+        IndexKinds.PREFIX_SUM — cumulative counters of working days and working minutes,
+        counting inside of span takes constant time.
+        IndexKinds.FENWICK — Fenwick trees of working days and working minutes, counting inside of span takes
+        logarithmic time and index is updated in place after changes of single dates in logarithmic time.
+
+        :param start_date: date for start
+        :type start_date: datetime.date
+
+        :param end_date: date for end
+        :type end_date: datetime.date
+
+        :param kind: kind of index, default: IndexKinds.PREFIX_SUM
+        :type kind: Union[IndexKinds, str]
+        """
+
+        start_date = self._check_date(start_date)
+        end_date = self._check_date(end_date)
+
+        if start_date > end_date:
+            raise StartGreaterEndException
+
+        self._index_span = (start_date.toordinal(), end_date.toordinal())
+        self._index_kind = self._check_index_kind(kind)
+        self._index = None
+        self._get_index()
 
     def clear_holidays(self):
         """
         Clear set of holidays.
         """
 
+        self._unshare('_holidays', keep=False)
         self._holidays.clear()
+        self._changed()
 
     def clear_not_standard_working_days(self):
         """
         Clear dictionary of not standard working days.
         """
 
+        self._unshare('_not_standard_working_days', keep=False)
         self._not_standard_working_days.clear()
+        self._changed()
 
     def clear_weekends(self):
         """
         Clear set of weekends.
         """
 
+        self._unshare('_weekends', keep=False)
         self._weekends.clear()
+        self._update_weekend_flags()
+        self._changed()
 
     def clear_working_days(self):
         """
         Clear set of additional working days.
         """
 
+        self._unshare('_working_days', keep=False)
         self._working_days.clear()
+        self._changed()
+
+    def clone(self):
+        # type: (...) -> WorkingCalendar
+
+        """
+        Return copy of calendar which shares holidays, additional working days, not standard working days,
+        weekends, lookup tables and index with this calendar. Shared container is copied by calendar
+        which changes it first, so cloning takes constant time and only changed containers take memory.
+        Containers returned by 'get_*' methods must not be changed directly.
+
+        :return: copy of calendar
+        :rtype: WorkingCalendar
+        """
+
+        names = {'_holidays', '_working_days', '_not_standard_working_days', '_weekends'}
+
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone._cache = QueryCache(self._cache.maxsize)
+        clone._shared = set(names)
+        self._shared.update(names)
+
+        if self._index is not None and self._index.incremental:
+            # incremental index is changed in place, so clone builds its own one
+            clone._index = None
+
+        return clone
+
+    def drop_index(self):
+        """
+        Drop precomputed index.
+        """
+
+        self._index_span = None
+        self._index = None
 
     def extend_holidays(
         self,
-        dates,  # type: Iterable[datetime.date]
+        dates,  # type: Any
     ):
         """
-        Extend set of holidays with new dates.
+        Extend set of holidays with new dates. Dates are validated before adding in one pass.
 
-        :param dates: new dates for adding
-        :type dates: Iterable[datetime.date]
+        :param dates: new dates for adding (iterable of dates, array of ordinals or 'numpy.datetime64' array)
+        :type dates: Any
         """
 
-        for date in dates:
-            self.add_holiday(date)
+        self._unshare('_holidays')
+        self._holidays.update(self._check_dates(dates))
+        self._changed()
 
     def extend_weekends(
         self,
@@ -199,22 +596,55 @@ class WorkingCalendar(object):
         :type weekends: Iterable[Union[DaysOfWeek, int]]
         """
 
-        for weekend in weekends:
-            self.add_weekend(weekend)
+        self._unshare('_weekends')
+        self._weekends.update([self._check_day_of_week(weekend) for weekend in weekends])
+        self._update_weekend_flags()
+        self._changed()
 
     def extend_working_days(
         self,
-        dates,  # type: Iterable[datetime.date]
+        dates,  # type: Any
     ):
         """
-        Extend set of additional working days with new dates.
+        Extend set of additional working days with new dates. Dates are validated before adding in one pass.
+
+        :param dates: new dates for adding (iterable of dates, array of ordinals or 'numpy.datetime64' array)
+        :type dates: Any
+        """
 
-        :param dates: new dates for adding
-        :type dates: Iterable[datetime.date]
+        self._unshare('_working_days')
+        self._working_days.update(self._check_dates(dates))
+        self._changed()
+
+    def freeze(self):
+        # type: (...) -> FrozenWorkingCalendar
+
+        """
+        Return immutable snapshot of calendar. Snapshot is hashable and can be shared between threads.
+        Snapshot has own cache of the same size.
+
+        :return: immutable snapshot
+        :rtype: FrozenWorkingCalendar
         """
 
-        for date in dates:
-            self.add_working_day(date)
+        tables = self._get_tables()
+        index = self._get_index()
+
+        if index is not None and index.incremental:
+            # incremental index is changed in place, so snapshot gets its own one
+            index = PrefixSumIndex(tables, index.start, index.end)
+
+        return FrozenWorkingCalendar(
+            self._weekend_flags,
+            self._working_time_minutes,
+            sorted(date.toordinal() for date in self._holidays),
+            sorted(date.toordinal() for date in self._working_days),
+            sorted((date.toordinal(), minutes) for date, minutes in self._not_standard_working_days.items()),
+            tables,
+            index,
+            self._cache.maxsize,
+            self._working_schedule
+        )
 
     def get_holidays(self):
         # type: (...) -> set
@@ -252,498 +682,348 @@ class WorkingCalendar(object):
 
         return self._working_days
 
-    def get_working_time_minutes(self):
+    def import_ics(
+        self,
+        file,  # type: Any
+        start_date,  # type: datetime.date
+        end_date,  # type: datetime.date
+        kind=DayKinds.HOLIDAY,  # type: Union[DayKinds, str, Callable[[str], Optional[Union[DayKinds, str]]]]
+    ):
         # type: (...) -> int
 
         """
-        Return sum of minutes of working time in working day.
+        Import dates of events of iCalendar between 2 dates as holidays or additional working days.
+        File is parsed line by line, multi-day events and yearly recurrences are expanded,
+        dates are added in one pass after parsing.
 
-        :return: minutes
-        :rtype: int
-        """
+        :param file: file object or any iterable of lines (str or bytes)
+        :type file: Any
 
-        return self._working_time_minutes
+        :param start_date: date for start
+        :type start_date: datetime.date
 
-    def remove_holiday(
-        self,
-        date,  # type: datetime.date
-    ):
-        """
-        Remove date from set of holidays.
+        :param end_date: date for end
+        :type end_date: datetime.date
 
-        :param date: date for removing
-        :type date: datetime.date
+        :param kind: kind of dates of all events (DayKinds.HOLIDAY or DayKinds.WORKING_DAY), or function which returns
+        kind by summary of event (None skips event), default: DayKinds.HOLIDAY
+        :type kind: Union[DayKinds, str, Callable[[str], Optional[Union[DayKinds, str]]]]
+
+        :return: number of imported dates
+        :rtype: int
         """
 
-        self._holidays.remove(self._check_date(date))
+        start_date = self._check_date(start_date)
+        end_date = self._check_date(end_date)
 
-    def remove_not_standard_working_day(
-        self,
-        date,  # type: datetime.date
-    ):
-        """
-        Remove date from dictionary of not standard working days.
+        if start_date > end_date:
+            raise StartGreaterEndException
 
-        :param date: date for removing
-        :type date: datetime.date
-        """
+        classify = kind if callable(kind) else (lambda summary: kind)
+        start = start_date.toordinal()
+        end = end_date.toordinal()
+        ordinals = {
+            DayKinds.HOLIDAY: array('l'),
+            DayKinds.WORKING_DAY: array('l'),
+        }
 
-        self._not_standard_working_days.pop(self._check_date(date), None)
+        for event in iter_events(file):
+            event_kind = classify(event.summary)
 
-    def remove_weekend(
-        self,
-        weekend,  # type: Union[DaysOfWeek, int]
-    ):
-        """
-        Remove weekend from set of weekends.
+            if event_kind is None:
+                continue
 
-        :param weekend: weekend for removing
-        :type weekend: Union[DaysOfWeek, int]
-        """
+            if not isinstance(event_kind, DayKinds):
+                event_kind = DayKinds(event_kind)
 
-        self._weekends.remove(self._check_day_of_week(weekend))
+            if event_kind not in ordinals:
+                raise ValueError('Kind of imported dates must be holiday or working day.')
 
-    def remove_working_day(
-        self,
-        date,  # type: datetime.date
-    ):
-        """
-        Remove date from set of additional working days.
+            ordinals[event_kind].extend(iter_event_ordinals(event, start, end))
 
-        :param date: date for removing
-        :type date: datetime.date
-        """
+        self.extend_holidays(ordinals[DayKinds.HOLIDAY])
+        self.extend_working_days(ordinals[DayKinds.WORKING_DAY])
 
-        self._working_days.remove(self._check_date(date))
+        return len(ordinals[DayKinds.HOLIDAY]) + len(ordinals[DayKinds.WORKING_DAY])
 
-    def update_not_standard_working_day(
+    def load_csv(
         self,
-        date,  # type: datetime.date,
-        working_time_minutes,  # type: int
+        file,  # type: Any
+        skip_errors=False,  # type: bool
     ):
-        """
-        Update dictionary of not standard working days.
+        # type: (...) -> List[Tuple[int, str]]
 
-        :param date: date for updating
-        :type date: datetime.date
-
-        :param working_time_minutes: number of working minutes of the working day
-        :type working_time_minutes: int
         """
+        Load holidays, additional working days and not standard working days from CSV written by 'dump_csv'.
+        File is read row by row and all rows are validated before loading, so errors of all invalid rows are reported.
 
-        if not (
-            isinstance(working_time_minutes, int) and
-            working_time_minutes > 0
-        ):
-            raise ValueError('Argument \'working_time_minutes\' must be integer greater than 0.')
-
-        self._not_standard_working_days[self._check_date(date)] = working_time_minutes
+        :param file: text file object (opened with newline='') or any iterable of lines
+        :type file: Any
 
-    def update_working_time_minutes(
-        self,
-        minutes,  # type: int
-    ):
-        """
-        Update working time in normal working day.
+        :param skip_errors: load valid rows if there are invalid ones, default: False
+        (nothing is loaded and InvalidRecordsException is raised)
+        :type skip_errors: bool
 
-        :param minutes: minutes of the working time in normal working day
-        :type minutes: int
+        :return: numbers of lines and errors of skipped rows
+        :rtype: List[Tuple[int, str]]
         """
 
-        if not (
-            isinstance(minutes, int) and
-            0 < minutes < 1441
-        ):
-            raise ValueError('Argument \'minutes\' must be integer in range [1; 1440].')
-
-        self._working_time_minutes = minutes
+        return self._load_records(read_csv(file), skip_errors)
 
-    def is_additional_working_day(
+    def load_json(
         self,
-        date,  # type: datetime.date
+        file,  # type: Any
+        skip_errors=False,  # type: bool
     ):
-        # type: (...) -> bool
+        # type: (...) -> List[Tuple[int, str]]
 
         """
-        Checking if date is additional working day.
+        Load holidays, additional working days and not standard working days from JSON Lines written by 'dump_json'.
+        File is read line by line and all lines are validated before loading, so errors of all invalid lines are reported.
 
-        :param date: date for checking
-        :type date: datetime.date
+        :param file: text file object or any iterable of lines
+        :type file: Any
 
-        :return: result of checking
-        :rtype: bool
+        :param skip_errors: load valid lines if there are invalid ones, default: False
+        (nothing is loaded and InvalidRecordsException is raised)
+        :type skip_errors: bool
+
+        :return: numbers of lines and errors of skipped lines
+        :rtype: List[Tuple[int, str]]
         """
 
-        return self._check_date(date) in self._working_days
+        return self._load_records(read_json(file), skip_errors)
 
-    def is_holiday(
+    def remove_holiday(
         self,
         date,  # type: datetime.date
     ):
-        # type: (...) -> bool
-
         """
-        Checking if date is holiday.
+        Remove date from set of holidays.
 
-        :param date: date for checking
+        :param date: date for removing
         :type date: datetime.date
-
-        :return: result of checking
-        :rtype: bool
         """
 
-        return self._check_date(date) in self._holidays
+        date = self._check_date(date)
+        self._unshare('_holidays')
+        self._holidays.remove(date)
+        self._changed(date)
 
-    def is_not_standard_working_day(
+    def remove_not_standard_working_day(
         self,
         date,  # type: datetime.date
     ):
-        # type: (...) -> bool
-
         """
-        Checking if date is not standard working day.
+        Remove date from dictionary of not standard working days.
 
-        :param date: date for checking
+        :param date: date for removing
         :type date: datetime.date
-
-        :return: result of checking
-        :rtype: bool
         """
 
-        return self._check_date(date) in self._not_standard_working_days
+        date = self._check_date(date)
+        self._unshare('_not_standard_working_days')
+        self._not_standard_working_days.pop(date, None)
+        self._changed(date)
 
-    def is_weekend(
+    def remove_weekend(
         self,
-        date,  # type: datetime.date
+        weekend,  # type: Union[DaysOfWeek, int]
     ):
-        # type: (...) -> bool
-
         """
-        Checking if date is weekend.
-
-        :param date: date for checking
-        :type date: datetime.date
+        Remove weekend from set of weekends.
 
-        :return: result of checking
-        :rtype: bool
+        :param weekend: weekend for removing
+        :type weekend: Union[DaysOfWeek, int]
         """
 
-        return DaysOfWeek(self._check_date(date).isoweekday()) in self._weekends
+        self._unshare('_weekends')
+        self._weekends.remove(self._check_day_of_week(weekend))
+        self._update_weekend_flags()
+        self._changed()
 
-    def is_working(
+    def remove_working_day(
         self,
         date,  # type: datetime.date
     ):
-        # type: (...) -> bool
-
         """
-        Checking if date is working day.
+        Remove date from set of additional working days.
 
-        :param date: date for checking
+        :param date: date for removing
         :type date: datetime.date
-
-        :return: result of checking
-        :rtype: bool
         """
 
         date = self._check_date(date)
+        self._unshare('_working_days')
+        self._working_days.remove(date)
+        self._changed(date)
 
-        if self.is_additional_working_day(date):
-            return True
-
-        if self.is_holiday(date):
-            return False
-
-        return not self.is_weekend(date)
-
-    def count_working_days_between(
+    def update_not_standard_working_day(
         self,
-        start_date,  # type: datetime.date
-        end_date,  # type: datetime.date
+        date,  # type: datetime.date,
+        working_time_minutes,  # type: int
     ):
-        # type: (...) -> int
-
         """
-        Count working days between 2 dates.
-
-        :param start_date: date for start
-        :type start_date: datetime.date
+        Update dictionary of not standard working days.
 
-        :param end_date: date for end
-        :type end_date: datetime.date
+        :param date: date for updating
+        :type date: datetime.date
 
-        :return: counter of working days
-        :rtype: int
+        :param working_time_minutes: number of working minutes of the working day
+        :type working_time_minutes: int
         """
 
-        start_date = self._check_date(start_date)
-        end_date = self._check_date(end_date)
+        self._check_not_standard_minutes(working_time_minutes)
 
-        if start_date > end_date:
-            raise StartGreaterEndException
-
-        delta = (end_date - start_date).days
-        date = start_date
-        counter = 1 if self.is_working(date) else 0
-
-        for day in range(delta):
-            date += datetime.timedelta(days=1)
-
-            if self.is_working(date):
-                counter += 1
-
-        return counter
+        date = self._check_date(date)
+        self._unshare('_not_standard_working_days')
+        self._not_standard_working_days[date] = working_time_minutes
+        self._changed(date)
 
-    def count_working_days_in_month(
+    def update_not_standard_working_days(
         self,
-        year,  # type: int
-        month,  # type: int
+        working_days,  # type: Mapping[datetime.date, int]
     ):
-        # type: (...) -> int
-
         """
-        Count working days in month.
-
-        :param year: year
-        :type year: int
+        Update dictionary of not standard working days with many dates. Values are validated before updating.
 
-        :param month: month
-        :type month: int
-
-        :return: counter of working days
-        :rtype: int
+        :param working_days: number of working minutes by date
+        :type working_days: Mapping[datetime.date, int]
         """
 
-        return self.count_working_days_between(
-            datetime.date(year, month, 1),
-            datetime.date(year, month, Months.get_by_ordinal(month).get_max_days(year))
-        )
+        dates = self._check_dates(working_days.keys())
+        minutes = list(working_days.values())
 
-    def count_working_days_in_year(
-        self,
-        year,  # type: int
-    ):
-        # type: (...) -> int
-
-        """
-        Count working days in year.
-
-        :param year: year
-        :type year: int
-
-        :return: counter of working days
-        :rtype: int
-        """
+        for working_time_minutes in minutes:
+            self._check_not_standard_minutes(working_time_minutes)
 
-        return self.count_working_days_between(
-            datetime.date(year, 1, 1),
-            datetime.date(year, 12, Months.get_by_ordinal(12).get_max_days(year))
-        )
+        self._unshare('_not_standard_working_days')
+        self._not_standard_working_days.update(zip(dates, minutes))
+        self._changed()
 
-    def count_working_minutes_between(
+    def update_working_schedule(
         self,
-        start_date,  # type: datetime.date
-        end_date,  # type: datetime.date
+        intervals,  # type: Iterable[Tuple[datetime.time, datetime.time]]
     ):
-        # type: (...) -> int
-
         """
-        Sum of working minutes between 2 dates.
+        Update working intervals of normal working day (for example: 09:00-13:00 and 14:00-18:00).
+        Working time in normal working day becomes sum of intervals.
+        Not standard working day follows the same intervals, but ends earlier or later (before midnight).
 
-        :param start_date: date for start
-        :type start_date: datetime.date
-
-        :param end_date: date for end
-        :type end_date: datetime.date
-
-        :return: sum of working minutes
-        :rtype: int
+        :param intervals: pairs of times of start and end of intervals, time 00:00 as end is midnight
+        :type intervals: Iterable[Tuple[datetime.time, datetime.time]]
         """
 
-        start_date = self._check_date(start_date)
-        end_date = self._check_date(end_date)
+        schedule = []
 
-        if start_date > end_date:
-            raise StartGreaterEndException
+        for start_time, end_time in intervals:
+            if not (
+                isinstance(start_time, datetime.time) and
+                isinstance(end_time, datetime.time) and
+                not (start_time.second or start_time.microsecond or end_time.second or end_time.microsecond)
+            ):
+                raise ValueError('Intervals must be pairs of \'datetime.time\' without seconds.')
 
-        delta = (end_date - start_date).days
-        date = start_date
-        total = self._not_standard_working_days.get(date, self._working_time_minutes) if self.is_working(date) else 0
+            start = start_time.hour * 60 + start_time.minute
+            end = end_time.hour * 60 + end_time.minute or 1440
 
-        for day in range(delta):
-            date += datetime.timedelta(days=1)
+            if start >= end:
+                raise ValueError('Start of interval must be less than end of interval.')
 
-            if self.is_working(date):
-                total += self._not_standard_working_days.get(date, self._working_time_minutes)
+            schedule.append((start, end))
 
-        return total
+        schedule.sort()
 
-    def count_working_minutes_in_year(
-        self,
-        year,  # type: int
-    ):
-        # type: (...) -> int
+        if not schedule:
+            raise ValueError('Argument \'intervals\' must not be empty.')
 
-        """
-        Sum of working minutes in year.
-
-        :param year: year
-        :type year: int
-
-        :return: sum of working minutes
-        :rtype: int
-        """
-
-        return self.count_working_minutes_between(
-            datetime.date(year, 1, 1),
-            datetime.date(year, 12, Months.get_by_ordinal(12).get_max_days(year))
-        )
+        for previous, current in zip(schedule, schedule[1:]):
+            if previous[1] > current[0]:
+                raise ValueError('Intervals must not overlap.')
 
-    def count_working_minutes_in_month(
-        self,
-        year,  # type: int
-        month,  # type: int
-    ):
-        # type: (...) -> int
+        limit = self._get_day_minutes_limit(schedule)
 
-        """
-        Sum of working minutes in month.
+        if self._not_standard_working_days and max(self._not_standard_working_days.values()) > limit:
+            raise ValueError(
+                'Working time of not standard working days must not be greater than {} '
+                '(working day must end before midnight).'.format(limit)
+            )
 
-        :param year: year
-        :type year: int
+        self._working_schedule = tuple(schedule)
+        self._working_time_minutes = sum(end - start for start, end in schedule)
+        self._changed()
 
-        :param month: month
-        :type month: int
-
-        :return: sum of working minutes
-        :rtype: int
-        """
-
-        return self.count_working_minutes_between(
-            datetime.date(year, month, 1),
-            datetime.date(year, month, Months.get_by_ordinal(month).get_max_days(year))
-        )
-
-    def count_working_hours_between(
+    def update_working_time_minutes(
         self,
-        start_date,  # type: datetime.date
-        end_date,  # type: datetime.date
+        minutes,  # type: int
     ):
-        # type: (...) -> int
-
         """
-        Count working hours between 2 dates.
-
-        :param start_date: date for start
-        :type start_date: datetime.date
-
-        :param end_date: date for end
-        :type end_date: datetime.date
-
-        :return: counter of working hours
-        :rtype: float
-        """
-
-        return self.count_working_minutes_between(start_date, end_date) / 60
-
-    def count_working_hours_in_year(
-        self,
-        year,  # type: int
-    ):
-        # type: (...) -> float
+        Update working time in normal working day. Working schedule is dropped.
 
+        :param minutes: minutes of the working time in normal working day
+        :type minutes: int
         """
-        Sum of working hours in year.
-
-        :param year: year
-        :type year: int
 
-        :return: sum of working hours
-        :rtype: float
-        """
+        if not (
+            isinstance(minutes, int) and
+            0 < minutes < 1441
+        ):
+            raise ValueError('Argument \'minutes\' must be integer in range [1; 1440].')
 
-        return self.count_working_minutes_in_year(year) / 60
+        self._working_time_minutes = minutes
+        self._working_schedule = None
+        self._changed()
 
-    def count_working_hours_in_month(
+    def is_additional_working_day(
         self,
-        year,  # type: int
-        month,  # type: int
+        date,  # type: datetime.date
     ):
-        # type: (...) -> float
+        # type: (...) -> bool
 
         """
-        Sum of working hours in month.
-
-        :param year: year
-        :type year: int
+        Checking if date is additional working day.
 
-        :param month: month
-        :type month: int
+        :param date: date for checking
+        :type date: datetime.date
 
-        :return: sum of working hours
-        :rtype: float
+        :return: result of checking
+        :rtype: bool
         """
 
-        return self.count_working_minutes_in_month(year, month) / 60
+        return self._check_date(date) in self._working_days
 
-    def get_next_working_day(
+    def is_holiday(
         self,
         date,  # type: datetime.date
     ):
-        # type: (...) -> datetime.date
+        # type: (...) -> bool
 
         """
-        Return date of the next working day.
+        Checking if date is holiday.
 
-        :param date: date for start
+        :param date: date for checking
         :type date: datetime.date
 
-        :return: date of the next working day
-        :rtype: datetime.date
+        :return: result of checking
+        :rtype: bool
         """
 
-        date = self._check_date(date)
-
-        while True:
-            date += datetime.timedelta(days=1)
-
-            if self.is_working(date):
-                break
-
-        return date
+        return self._check_date(date) in self._holidays
 
-    def skip_working_days(
+    def is_not_standard_working_day(
         self,
         date,  # type: datetime.date
-        skip_days,  # type: int
     ):
-        # type: (...) -> datetime.date
+        # type: (...) -> bool
 
         """
-        Return date after skipping from start date.
+        Checking if date is not standard working day.
 
-        :param date: date for start
+        :param date: date for checking
         :type date: datetime.date
 
-        :param skip_days: counter of working days for skipping
-        :type skip_days: int
-
-        :return: date after skipping
-        :rtype: datetime.date
+        :return: result of checking
+        :rtype: bool
         """
 
-        date = self._check_date(date)
-
-        if not (
-            isinstance(skip_days, int) and
-            skip_days > 0
-        ):
-            raise ValueError('Argument \'skip_days\' must be integer greater than 0.')
-
-        while skip_days > 0:
-            if self.is_working(date):
-                skip_days -= 1
-
-            date += datetime.timedelta(days=1)
-
-        return date
+        return self._check_date(date) in self._not_standard_working_days
@@ -1,5 +1,12 @@
+import datetime
+
+from array import array
 from collections import namedtuple
 from enum import Enum
+from itertools import (
+    accumulate,
+    chain
+)
 from typing import (
     Optional,
     Tuple,
@@ -20,6 +27,24 @@ class DaysOfWeek(Enum):
     SUNDAY = 7
 
 
+class DayKinds(Enum):
+    HOLIDAY = 'holiday'
+    WORKING_DAY = 'working_day'
+    NOT_STANDARD_WORKING_DAY = 'not_standard_working_day'
+
+
+class Frequencies(Enum):
+    WEEK = 'week'
+    MONTH = 'month'
+    QUARTER = 'quarter'
+    YEAR = 'year'
+
+
+class IndexKinds(Enum):
+    PREFIX_SUM = 'prefix_sum'
+    FENWICK = 'fenwick'
+
+
 class Months(Enum):
     JANUARY = Month(1, 31)
     FEBRUARY = Month(2, (28, 29))
@@ -79,9 +104,8 @@ class Months(Enum):
         if not isinstance(ordinal, int):
             raise ValueError('Ordinal must be integer.')
 
-        for month in Months:
-            if month.ordinal == ordinal:
-                return month
+        if 1 <= ordinal <= 12:
+            return MONTHS[ordinal - 1]
 
         return None
 
@@ -124,10 +148,77 @@ class Months(Enum):
 
         max_days = self._max_days
 
-        if self.name == 'FEBRUARY':
+        if self is Months.FEBRUARY:
             if year is None:
                 raise ValueError('Year is necessary for \'FEBRUARY\'.')
 
             return max_days[1] if self.is_leap(year) else max_days[0]
 
         return max_days
+
+    @staticmethod
+    def get_month_span(
+        year,  # type: int
+        month,  # type: int
+    ):
+        # type: (...) -> Tuple[int, int]
+
+        """
+        Get ordinals of the first and the last dates of month from precomputed table.
+
+        :param year: year
+        :type year: int
+
+        :param month: ordinal of month
+        :type month: int
+
+        :return: ordinals of the first and the last dates
+        :rtype: Tuple[int, int]
+        """
+
+        if not (isinstance(year, int) and datetime.MINYEAR <= year <= datetime.MAXYEAR):
+            raise ValueError('Year must be integer in range [{}; {}].'.format(datetime.MINYEAR, datetime.MAXYEAR))
+
+        if not (isinstance(month, int) and 1 <= month <= 12):
+            raise ValueError('Month must be integer in range [1; 12].')
+
+        first_ordinal = YEAR_FIRST_ORDINALS[year]
+        offsets = MONTH_OFFSETS[Months.is_leap(year)]
+
+        return first_ordinal + offsets[month - 1], first_ordinal + offsets[month] - 1
+
+    @staticmethod
+    def get_year_span(
+        year,  # type: int
+    ):
+        # type: (...) -> Tuple[int, int]
+
+        """
+        Get ordinals of the first and the last dates of year from precomputed table.
+
+        :param year: year
+        :type year: int
+
+        :return: ordinals of the first and the last dates
+        :rtype: Tuple[int, int]
+        """
+
+        if not (isinstance(year, int) and datetime.MINYEAR <= year <= datetime.MAXYEAR):
+            raise ValueError('Year must be integer in range [{}; {}].'.format(datetime.MINYEAR, datetime.MAXYEAR))
+
+        return YEAR_FIRST_ORDINALS[year], YEAR_FIRST_ORDINALS[year + 1] - 1
+
+
+MONTHS = tuple(Months)
+
+# counters of days before month (and after the last month) for not leap and leap years
+MONTH_OFFSETS = tuple(
+    tuple(sum(month.get_max_days(year) for month in MONTHS[:ordinal]) for ordinal in range(13))
+    for year in (1, 4)
+)
+
+# ordinal of the first date of year by year, including the year after the last supported one
+YEAR_FIRST_ORDINALS = array('l', accumulate(chain(
+    (0, 1),
+    (MONTH_OFFSETS[Months.is_leap(year)][12] for year in range(datetime.MINYEAR, datetime.MAXYEAR + 1))
+)))
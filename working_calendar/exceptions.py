@@ -3,6 +3,16 @@ class NotDateException(Exception):
         super().__init__('Argument \'date\' is \'{}\'. It should be \'datetime.date\'.'.format(class_name))
 
 
+class NotEnoughWorkingDaysException(Exception):
+    def __init__(self):
+        super().__init__('There are not enough working days in calendar.')
+
+
+class NotWorkingScheduleException(Exception):
+    def __init__(self):
+        super().__init__('Working schedule is not set. It should be set by \'update_working_schedule\'.')
+
+
 class NotDayOfWeekException(Exception):
     def __init__(self, class_name):
         super().__init__('Argument \'day\' is \'{}\'. It should be \'DayOfWeek\'.'.format(class_name))
@@ -11,3 +21,14 @@ class NotDayOfWeekException(Exception):
 class StartGreaterEndException(Exception):
     def __init__(self):
         super().__init__('Argument \'end_date\' should be greater or equal than argument \'start_date\'')
+
+
+class InvalidRecordsException(Exception):
+    def __init__(self, errors):
+        self.errors = errors
+        message = '; '.join('line {}: {}'.format(line, error) for line, error in errors[:10])
+
+        if len(errors) > 10:
+            message += '; and {} more'.format(len(errors) - 10)
+
+        super().__init__('There are invalid records ({}): {}.'.format(len(errors), message))
@@ -0,0 +1,447 @@
+import bisect
+import datetime
+import mmap
+
+from array import array
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Optional,
+    Tuple
+)
+
+from .base import BaseWorkingCalendar
+from .cache import QueryCache
+from .indexes import PrefixSumIndex
+from .storage import (
+    attach_shared_memory,
+    pack_calendar,
+    unpack_calendar
+)
+from .tables import Tables
+
+
+class FrozenWorkingCalendar(BaseWorkingCalendar):
+    """
+    Immutable snapshot of working calendar. Use 'WorkingCalendar.freeze' for creating.
+
+    Snapshot has all queries of 'WorkingCalendar' and no mutators, lookup tables and index are precomputed,
+    so one snapshot can be shared between threads without locks and used as key of dictionary.
+
+    _weekend_flags — is day weekend by ordinal of date modulo 7 (bool).
+    _working_time_minutes — working minutes of normal working day (int).
+    _holidays — sorted ordinals of holidays (int).
+    _working_days — sorted ordinals of additional working days (int).
+    _not_standard_ordinals — sorted ordinals of not standard working days (int).
+    _not_standard_minutes — working time minutes of not standard working days (int).
+    _working_schedule — working intervals of day (minutes from midnight, int), None if schedule is not set.
+    _tables — lookup tables for counting (Tables).
+    _index — precomputed index (PrefixSumIndex), None if index is not used.
+    _version — counter of changes of calendar, always 0 (int).
+    _cache — cache of results of counting (QueryCache).
+    _hash — hash of snapshot (int).
+    _buffer — owner of memory of saved index (mmap.mmap, bytes or AttachedSharedMemory), None if index is not loaded.
+    """
+
+    def __init__(
+        self,
+        weekend_flags,  # type: Tuple[bool, ...]
+        working_time_minutes,  # type: int
+        holidays,  # type: Iterable[int]
+        working_days,  # type: Iterable[int]
+        not_standard_working_days,  # type: Iterable[Tuple[int, int]]
+        tables=None,  # type: Optional[Tables]
+        index=None,  # type: Optional[PrefixSumIndex]
+        cache_size=0,  # type: int
+        working_schedule=None,  # type: Optional[Tuple[Tuple[int, int], ...]]
+    ):
+        """
+        :param weekend_flags: is day weekend by ordinal of date modulo 7
+        :type weekend_flags: Tuple[bool, ...]
+
+        :param working_time_minutes: working time for one working day in minutes
+        :type working_time_minutes: int
+
+        :param holidays: sorted ordinals of holidays
+        :type holidays: Iterable[int]
+
+        :param working_days: sorted ordinals of additional working days
+        :type working_days: Iterable[int]
+
+        :param not_standard_working_days: sorted pairs of ordinal and working time minutes
+        :type not_standard_working_days: Iterable[Tuple[int, int]]
+
+        :param tables: lookup tables built from the same data, built if not passed
+        :type tables: Optional[Tables]
+
+        :param index: precomputed index built from tables
+        :type index: Optional[PrefixSumIndex]
+
+        :param cache_size: maximal number of cached results of counting, default: 0 (cache is disabled)
+        :type cache_size: int
+
+        :param working_schedule: working intervals of day in minutes from midnight, default: None (not set)
+        :type working_schedule: Optional[Tuple[Tuple[int, int], ...]]
+        """
+
+        not_standard_working_days = list(not_standard_working_days)
+
+        attributes = dict(
+            _weekend_flags=tuple(weekend_flags),
+            _working_time_minutes=working_time_minutes,
+            _holidays=array('i', holidays),
+            _working_days=array('i', working_days),
+            _not_standard_ordinals=array('i', (ordinal for ordinal, minutes in not_standard_working_days)),
+            _not_standard_minutes=array('i', (minutes for ordinal, minutes in not_standard_working_days)),
+            _working_schedule=None if working_schedule is None else tuple(map(tuple, working_schedule)),
+            _version=0,
+            _cache=QueryCache(cache_size),
+        )
+
+        if tables is None:
+            tables = Tables(
+                attributes['_weekend_flags'],
+                working_time_minutes,
+                set(attributes['_holidays']),
+                set(attributes['_working_days']),
+                dict(not_standard_working_days)
+            )
+
+        attributes['_tables'] = tables
+        attributes['_index'] = index
+        attributes['_hash'] = hash((
+            attributes['_weekend_flags'],
+            working_time_minutes,
+            attributes['_holidays'].tobytes(),
+            attributes['_working_days'].tobytes(),
+            attributes['_not_standard_ordinals'].tobytes(),
+            attributes['_not_standard_minutes'].tobytes(),
+            attributes['_working_schedule'],
+        ))
+        # the last attribute, so it is released after arrays which refer to it
+        attributes['_buffer'] = None
+
+        for name, value in attributes.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(
+        self,
+        name,  # type: str
+        value,  # type: Any
+    ):
+        raise AttributeError('\'FrozenWorkingCalendar\' is immutable.')
+
+    def __delattr__(
+        self,
+        name,  # type: str
+    ):
+        raise AttributeError('\'FrozenWorkingCalendar\' is immutable.')
+
+    def __eq__(
+        self,
+        other,  # type: Any
+    ):
+        # type: (...) -> bool
+
+        if not isinstance(other, FrozenWorkingCalendar):
+            return NotImplemented
+
+        return (
+            self._weekend_flags == other._weekend_flags and
+            self._working_time_minutes == other._working_time_minutes and
+            self._holidays == other._holidays and
+            self._working_days == other._working_days and
+            self._not_standard_ordinals == other._not_standard_ordinals and
+            self._not_standard_minutes == other._not_standard_minutes and
+            self._working_schedule == other._working_schedule
+        )
+
+    def __hash__(self):
+        # type: (...) -> int
+
+        return self._hash
+
+    def __reduce__(self):
+        # type: (...) -> Tuple[Any, ...]
+
+        """
+        Pickle snapshot in compact binary format (mask of weekends and packed ordinals).
+        Index is not pickled, use 'publish' and 'attach' for sharing index between processes.
+
+        :return: function for restoring and its arguments
+        :rtype: Tuple[Any, ...]
+        """
+
+        return self.__class__.from_buffer, (pack_calendar(self, with_index=False), self._cache.maxsize)
+
+    def __copy__(self):
+        # type: (...) -> FrozenWorkingCalendar
+
+        return self
+
+    def __deepcopy__(
+        self,
+        memo,  # type: Dict[int, Any]
+    ):
+        # type: (...) -> FrozenWorkingCalendar
+
+        return self
+
+    @staticmethod
+    def _contains(
+        ordinals,  # type: array
+        ordinal,  # type: int
+    ):
+        # type: (...) -> bool
+
+        """
+        Checking if sorted array contains ordinal.
+
+        :param ordinals: sorted ordinals
+        :type ordinals: array
+
+        :param ordinal: ordinal for checking
+        :type ordinal: int
+
+        :return: result of checking
+        :rtype: bool
+        """
+
+        index = bisect.bisect_left(ordinals, ordinal)
+
+        return index < len(ordinals) and ordinals[index] == ordinal
+
+    @classmethod
+    def from_buffer(
+        cls,
+        buffer,  # type: Any
+        cache_size=0,  # type: int
+    ):
+        # type: (...) -> FrozenWorkingCalendar
+
+        """
+        Return snapshot from bytes of calendar in binary format (see 'save').
+        Saved index refers to buffer without copying, so buffer should stay unchanged.
+
+        :param buffer: bytes of calendar (any object which supports buffer protocol)
+        :type buffer: Any
+
+        :param cache_size: maximal number of cached results of counting, default: 0 (cache is disabled)
+        :type cache_size: int
+
+        :return: immutable snapshot
+        :rtype: FrozenWorkingCalendar
+        """
+
+        data = unpack_calendar(buffer)
+        tables = Tables(
+            data.weekend_flags,
+            data.working_time_minutes,
+            set(data.holidays),
+            set(data.working_days),
+            dict(zip(data.not_standard_ordinals, data.not_standard_minutes))
+        )
+        index = None
+
+        if data.index is not None:
+            index = PrefixSumIndex.restore(tables, *data.index)
+
+        snapshot = cls(
+            data.weekend_flags,
+            data.working_time_minutes,
+            data.holidays,
+            data.working_days,
+            zip(data.not_standard_ordinals, data.not_standard_minutes),
+            tables,
+            index,
+            cache_size,
+            data.working_schedule
+        )
+
+        if index is not None:
+            object.__setattr__(snapshot, '_buffer', buffer)
+
+        return snapshot
+
+    @classmethod
+    def load(
+        cls,
+        path,  # type: str
+        use_mmap=True,  # type: bool
+        cache_size=0,  # type: int
+    ):
+        # type: (...) -> FrozenWorkingCalendar
+
+        """
+        Return snapshot from file in binary format (see 'save').
+        Memory-mapped file is not read at start and its pages are shared between processes.
+
+        :param path: path of file
+        :type path: str
+
+        :param use_mmap: map file to memory instead of reading, default: True
+        :type use_mmap: bool
+
+        :param cache_size: maximal number of cached results of counting, default: 0 (cache is disabled)
+        :type cache_size: int
+
+        :return: immutable snapshot
+        :rtype: FrozenWorkingCalendar
+        """
+
+        with open(path, 'rb') as file:
+            if use_mmap:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                buffer = file.read()
+
+        return cls.from_buffer(buffer, cache_size)
+
+    @classmethod
+    def attach(
+        cls,
+        name,  # type: str
+        cache_size=0,  # type: int
+    ):
+        # type: (...) -> FrozenWorkingCalendar
+
+        """
+        Return snapshot of calendar published to shared memory (see 'publish').
+        Saved index is used from shared memory without copying, block stays mapped while snapshot exists.
+
+        :param name: name of block of shared memory
+        :type name: str
+
+        :param cache_size: maximal number of cached results of counting, default: 0 (cache is disabled)
+        :type cache_size: int
+
+        :return: immutable snapshot
+        :rtype: FrozenWorkingCalendar
+        """
+
+        block = attach_shared_memory(name)
+        snapshot = cls.from_buffer(block.buf, cache_size)
+
+        if snapshot._buffer is None:
+            # arrays are copied if index is not saved, so block is not needed
+            block.close()
+        else:
+            object.__setattr__(snapshot, '_buffer', block)
+
+        return snapshot
+
+    def _get_tables(self):
+        # type: (...) -> Tables
+
+        """
+        Return precomputed lookup tables for counting.
+
+        :return: lookup tables
+        :rtype: Tables
+        """
+
+        return self._tables
+
+    def _get_index(self):
+        # type: (...) -> Optional[PrefixSumIndex]
+
+        """
+        Return precomputed index.
+
+        :return: precomputed index or None if index is not used
+        :rtype: Optional[PrefixSumIndex]
+        """
+
+        return self._index
+
+    def get_holidays(self):
+        # type: (...) -> FrozenSet[datetime.date]
+
+        """
+        Return set of holidays.
+
+        :return: set of holidays
+        :rtype: FrozenSet[datetime.date]
+        """
+
+        return frozenset(map(datetime.date.fromordinal, self._holidays))
+
+    def get_not_standard_working_days(self):
+        # type: (...) -> Dict[datetime.date: int]
+
+        """
+        Return copy of dictionary of not standard working days.
+
+        :return: dictionary of not standard working days
+        :rtype: Dict[datetime.date: int]
+        """
+
+        return dict(zip(map(datetime.date.fromordinal, self._not_standard_ordinals), self._not_standard_minutes))
+
+    def get_working_days(self):
+        # type: (...) -> FrozenSet[datetime.date]
+
+        """
+        Return set of additional working days.
+
+        :return: set of additional working days
+        :rtype: FrozenSet[datetime.date]
+        """
+
+        return frozenset(map(datetime.date.fromordinal, self._working_days))
+
+    def is_additional_working_day(
+        self,
+        date,  # type: datetime.date
+    ):
+        # type: (...) -> bool
+
+        """
+        Checking if date is additional working day.
+
+        :param date: date for checking
+        :type date: datetime.date
+
+        :return: result of checking
+        :rtype: bool
+        """
+
+        return self._contains(self._working_days, self._check_date(date).toordinal())
+
+    def is_holiday(
+        self,
+        date,  # type: datetime.date
+    ):
+        # type: (...) -> bool
+
+        """
+        Checking if date is holiday.
+
+        :param date: date for checking
+        :type date: datetime.date
+
+        :return: result of checking
+        :rtype: bool
+        """
+
+        return self._contains(self._holidays, self._check_date(date).toordinal())
+
+    def is_not_standard_working_day(
+        self,
+        date,  # type: datetime.date
+    ):
+        # type: (...) -> bool
+
+        """
+        Checking if date is not standard working day.
+
+        :param date: date for checking
+        :type date: datetime.date
+
+        :return: result of checking
+        :rtype: bool
+        """
+
+        return self._contains(self._not_standard_ordinals, self._check_date(date).toordinal())
@@ -0,0 +1,435 @@
+import calendar
+import datetime
+import re
+
+from collections import namedtuple
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Tuple
+)
+
+
+# event of iCalendar: ordinals of the first date and the date after the last date, summary,
+# yearly recurrence or None, ordinals of excluded first dates of occurrences and number of line of 'BEGIN:VEVENT'
+Event = namedtuple('Event', ['start', 'end', 'summary', 'recurrence', 'excluded', 'line'])
+
+# yearly recurrence: interval in years, maximal number of occurrences or None, ordinal of the last date or None,
+# months (int), days of month (int, negative from the end of month) and days of week
+# (number of occurrence in month, 0 for all occurrences, and day of week, 0 is monday)
+Recurrence = namedtuple('Recurrence', ['interval', 'count', 'until', 'months', 'month_days', 'week_days'])
+
+# parts of 'RRULE' which are supported ('WKST' does not change yearly recurrence by months)
+RULE_PARTS = frozenset(('FREQ', 'INTERVAL', 'COUNT', 'UNTIL', 'BYMONTH', 'BYMONTHDAY', 'BYDAY', 'WKST'))
+
+WEEK_DAYS = ('MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU')
+
+WEEK_DAY_PATTERN = re.compile(r'^([+-]?\d{1,2})?(MO|TU|WE|TH|FR|SA|SU)$')
+
+
+def _parse_date(
+    value,  # type: str
+    line,  # type: int
+):
+    # type: (...) -> Tuple[int, bool]
+
+    """
+    Parse value of 'DATE' or 'DATE-TIME' type. Time zones are ignored, date of local time is used.
+
+    :param value: value of property
+    :type value: str
+
+    :param line: number of line
+    :type line: int
+
+    :return: ordinal of date and flag of midnight
+    :rtype: Tuple[int, bool]
+    """
+
+    try:
+        ordinal = datetime.date(int(value[0:4]), int(value[4:6]), int(value[6:8])).toordinal()
+    except ValueError:
+        raise ValueError('Line {}: invalid date \'{}\'.'.format(line, value))
+
+    return ordinal, value[9:15] in ('', '000000')
+
+
+def _parse_duration(
+    value,  # type: str
+    line,  # type: int
+):
+    # type: (...) -> int
+
+    """
+    Parse value of 'DURATION' property to number of days (weeks and days are counted, time is ignored).
+
+    :param value: value of property
+    :type value: str
+
+    :param line: number of line
+    :type line: int
+
+    :return: number of days
+    :rtype: int
+    """
+
+    value = value.lstrip('+').partition('T')[0]
+
+    if not value.startswith('P'):
+        raise ValueError('Line {}: invalid duration \'{}\'.'.format(line, value))
+
+    days = 0
+    number = ''
+
+    for char in value[1:]:
+        if char.isdigit():
+            number += char
+        elif char == 'W' and number:
+            days += int(number) * 7
+            number = ''
+        elif char == 'D' and number:
+            days += int(number)
+            number = ''
+        else:
+            raise ValueError('Line {}: invalid duration \'{}\'.'.format(line, value))
+
+    return days
+
+
+def _parse_rule(
+    value,  # type: str
+    line,  # type: int
+):
+    # type: (...) -> Recurrence
+
+    """
+    Parse value of 'RRULE' property. Only yearly recurrence is supported, it can be limited by months ('BYMONTH')
+    and days of month ('BYMONTHDAY') or days of week in months ('BYDAY' with 'BYMONTH'). Other parts are rejected,
+    so dates are never imported by partially applied rule.
+
+    :param value: value of property
+    :type value: str
+
+    :param line: number of line
+    :type line: int
+
+    :return: recurrence
+    :rtype: Recurrence
+    """
+
+    parts = dict(part.partition('=')[::2] for part in value.upper().split(';') if part)
+
+    if parts.get('FREQ') != 'YEARLY':
+        raise ValueError('Line {}: only yearly recurrence is supported.'.format(line))
+
+    unsupported = sorted(set(parts) - RULE_PARTS)
+
+    if unsupported:
+        raise ValueError('Line {}: recurrence part \'{}\' is not supported.'.format(line, unsupported[0]))
+
+    if 'BYDAY' in parts and ('BYMONTH' not in parts or 'BYMONTHDAY' in parts):
+        raise ValueError('Line {}: recurrence part \'BYDAY\' is supported only with \'BYMONTH\'.'.format(line))
+
+    try:
+        interval = int(parts.get('INTERVAL', 1))
+        count = int(parts['COUNT']) if 'COUNT' in parts else None
+        months = tuple(sorted({int(month) for month in parts['BYMONTH'].split(',')})) if 'BYMONTH' in parts else ()
+        month_days = tuple(int(day) for day in parts['BYMONTHDAY'].split(',')) if 'BYMONTHDAY' in parts else ()
+        week_days = tuple(_parse_week_day(day) for day in parts['BYDAY'].split(',')) if 'BYDAY' in parts else ()
+    except ValueError:
+        raise ValueError('Line {}: invalid recurrence \'{}\'.'.format(line, value))
+
+    if not (
+        interval >= 1 and
+        (count is None or count >= 1) and
+        all(1 <= month <= 12 for month in months) and
+        all(1 <= abs(day) <= 31 for day in month_days) and
+        all(abs(number) <= 5 for number, week_day in week_days)
+    ):
+        raise ValueError('Line {}: invalid recurrence \'{}\'.'.format(line, value))
+
+    until = _parse_date(parts['UNTIL'], line)[0] if 'UNTIL' in parts else None
+
+    return Recurrence(interval, count, until, months, month_days, week_days)
+
+
+def _parse_week_day(
+    value,  # type: str
+):
+    # type: (...) -> Tuple[int, int]
+
+    """
+    Parse day of week of 'BYDAY' part of 'RRULE' (for example: 'MO', '4TH', '-1FR').
+
+    :param value: day of week with optional number of occurrence
+    :type value: str
+
+    :return: number of occurrence in month (0 for all occurrences) and day of week (0 is monday)
+    :rtype: Tuple[int, int]
+    """
+
+    match = WEEK_DAY_PATTERN.match(value)
+
+    if match is None or (match.group(1) is not None and int(match.group(1)) == 0):
+        raise ValueError('Invalid day of week \'{}\'.'.format(value))
+
+    return int(match.group(1) or 0), WEEK_DAYS.index(match.group(2))
+
+
+def iter_events(
+    file,  # type: Any
+):
+    # type: (...) -> Iterator[Event]
+
+    """
+    Parse events of iCalendar line by line, so memory does not depend on size of file.
+    Folded lines are unfolded, properties except 'DTSTART', 'DTEND', 'DURATION', 'RRULE', 'EXDATE'
+    and 'SUMMARY' are ignored, properties of components inside event (for example: 'VALARM') are ignored too.
+    Event without end lasts one day.
+
+    :param file: file object or any iterable of lines (str or bytes)
+    :type file: Any
+
+    :return: iterator of events
+    :rtype: Iterator[Event]
+    """
+
+    properties = None
+    begin = 0
+    depth = 0
+    logical = ''
+    logical_number = 0
+
+    for number, raw in enumerate(file, 1):
+        if isinstance(raw, bytes):
+            raw = raw.decode('utf-8')
+
+        raw = raw.rstrip('\r\n')
+
+        if raw[:1] in (' ', '\t'):
+            logical += raw[1:]
+            continue
+
+        text, line = logical, logical_number
+        logical, logical_number = raw, number
+
+        if properties is None:
+            if text == 'BEGIN:VEVENT':
+                properties = {}
+                begin = line
+                depth = 0
+
+            continue
+
+        # depth of component inside event, its properties do not belong to event
+        if text.startswith('BEGIN:'):
+            depth += 1
+            continue
+
+        if depth:
+            if text.startswith('END:'):
+                depth -= 1
+
+            continue
+
+        if text != 'END:VEVENT':
+            head, _, value = text.partition(':')
+            name, _, parameters = head.partition(';')
+            name = name.upper()
+
+            if name == 'EXDATE':
+                properties.setdefault(name, []).extend((value, line) for value in value.split(','))
+            elif name in ('DTSTART', 'DTEND', 'DURATION', 'RRULE', 'SUMMARY'):
+                properties[name] = (value, line)
+
+            continue
+
+        yield _build_event(properties, begin)
+        properties = None
+
+    if logical == 'END:VEVENT' and properties is not None:
+        yield _build_event(properties, begin)
+
+
+def _build_event(
+    properties,  # type: Dict[str, Any]
+    line,  # type: int
+):
+    # type: (...) -> Event
+
+    """
+    Build event from properties.
+
+    :param properties: values and numbers of lines by names of properties
+    :type properties: Dict[str, Any]
+
+    :param line: number of line of 'BEGIN:VEVENT'
+    :type line: int
+
+    :return: event
+    :rtype: Event
+    """
+
+    if 'DTSTART' not in properties:
+        raise ValueError('Line {}: event has no \'DTSTART\'.'.format(line))
+
+    start = _parse_date(*properties['DTSTART'])[0]
+
+    if 'DTEND' in properties:
+        end, midnight = _parse_date(*properties['DTEND'])
+
+        # end of event is exclusive, so event which ends at midnight does not take the last date
+        if not midnight:
+            end += 1
+    elif 'DURATION' in properties:
+        end = start + _parse_duration(*properties['DURATION'])
+    else:
+        end = start + 1
+
+    end = max(end, start + 1)
+    recurrence = _parse_rule(*properties['RRULE']) if 'RRULE' in properties else None
+    excluded = frozenset(_parse_date(*value)[0] for value in properties.get('EXDATE', ()))
+    summary = properties.get('SUMMARY', ('', 0))[0]
+
+    return Event(start, end, summary, recurrence, excluded, line)
+
+
+def iter_event_ordinals(
+    event,  # type: Event
+    start,  # type: int
+    end,  # type: int
+):
+    # type: (...) -> Iterator[int]
+
+    """
+    Expand occurrences of event to ordinals of dates between 2 dates.
+    Yearly occurrence is skipped in years without date of the first occurrence (february 29).
+
+    :param event: event of iCalendar
+    :type event: Event
+
+    :param start: ordinal of date for start
+    :type start: int
+
+    :param end: ordinal of date for end
+    :type end: int
+
+    :return: iterator of ordinals
+    :rtype: Iterator[int]
+    """
+
+    length = event.end - event.start
+
+    if event.recurrence is None:
+        occurrences = (event.start,)
+    else:
+        occurrences = _iter_yearly(event, end)
+
+    for first in occurrences:
+        if first in event.excluded or first + length <= start:
+            continue
+
+        yield from range(max(first, start), min(first + length, end + 1))
+
+
+def _iter_yearly(
+    event,  # type: Event
+    end,  # type: int
+):
+    # type: (...) -> Iterator[int]
+
+    """
+    Return ordinals of the first dates of yearly occurrences up to date for end.
+    Occurrences before the first date of event are skipped.
+
+    :param event: event of iCalendar with yearly recurrence
+    :type event: Event
+
+    :param end: ordinal of date for end
+    :type end: int
+
+    :return: iterator of ordinals
+    :rtype: Iterator[int]
+    """
+
+    recurrence = event.recurrence
+    first = datetime.date.fromordinal(event.start)
+    last = end if recurrence.until is None else min(end, recurrence.until)
+    number = 0
+
+    for year in range(first.year, datetime.MAXYEAR + 1, recurrence.interval):
+        if datetime.date(year, 1, 1).toordinal() > last:
+            return
+
+        for ordinal in _get_year_occurrences(recurrence, first, year):
+            if ordinal < event.start:
+                continue
+
+            if ordinal > last or (recurrence.count is not None and number >= recurrence.count):
+                return
+
+            number += 1
+
+            yield ordinal
+
+
+def _get_year_occurrences(
+    recurrence,  # type: Recurrence
+    first,  # type: datetime.date
+    year,  # type: int
+):
+    # type: (...) -> List[int]
+
+    """
+    Return sorted ordinals of the first dates of occurrences in year. Without 'BYMONTH' days of month
+    ('BYMONTHDAY') are used in all months, otherwise the month of the first occurrence is used.
+    Without 'BYMONTHDAY' and 'BYDAY' the day of the first occurrence is used
+    (occurrence is skipped in month without this day, for example: february 29).
+
+    :param recurrence: yearly recurrence
+    :type recurrence: Recurrence
+
+    :param first: the first date of event
+    :type first: datetime.date
+
+    :param year: year
+    :type year: int
+
+    :return: sorted ordinals
+    :rtype: List[int]
+    """
+
+    ordinals = []
+
+    if recurrence.months:
+        months = recurrence.months
+    elif recurrence.month_days:
+        # days of month of yearly recurrence are expanded to all months
+        months = range(1, 13)
+    else:
+        months = (first.month,)
+
+    for month in months:
+        first_week_day, size = calendar.monthrange(year, month)
+
+        if recurrence.month_days:
+            days = {day if day > 0 else size + day + 1 for day in recurrence.month_days}
+        elif recurrence.week_days:
+            days = set()
+
+            for number, week_day in recurrence.week_days:
+                matching = range(1 + (week_day - first_week_day) % 7, size + 1, 7)
+
+                if not number:
+                    days.update(matching)
+                elif number <= len(matching) and -number <= len(matching):
+                    days.add(matching[number - 1 if number > 0 else number])
+        else:
+            days = {first.day}
+
+        month_ordinal = datetime.date(year, month, 1).toordinal() - 1
+        ordinals.extend(month_ordinal + day for day in sorted(days) if 1 <= day <= size)
+
+    return ordinals
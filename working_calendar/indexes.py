@@ -0,0 +1,497 @@
+import bisect
+
+from array import array
+from typing import (
+    Optional,
+    Sequence
+)
+
+from .tables import Tables
+
+
+class PrefixSumIndex(object):
+    """
+    Precomputed cumulative counters of working days and working minutes for span of dates.
+
+    start — ordinal of first date of span (int).
+    end — ordinal of last date of span (int).
+    tables — lookup tables which index was built from (Tables).
+    base_days — counter of working days before start (int).
+    base_minutes — sum of working minutes before start (int).
+    days — counter of working days before start + position (int).
+    minutes — sum of working minutes before start + position (int).
+    incremental — is index updated in place after changes of single dates (bool).
+    """
+
+    incremental = False
+
+    @classmethod
+    def restore(
+        cls,
+        tables,  # type: Tables
+        start,  # type: int
+        end,  # type: int
+        base_days,  # type: int
+        base_minutes,  # type: int
+        days,  # type: Sequence[int]
+        minutes,  # type: Sequence[int]
+    ):
+        # type: (...) -> PrefixSumIndex
+
+        """
+        Return index from saved counters without recomputing. Counters are not copied.
+
+        :param tables: lookup tables of calendar
+        :type tables: Tables
+
+        :param start: ordinal of first date of span
+        :type start: int
+
+        :param end: ordinal of last date of span
+        :type end: int
+
+        :param base_days: counter of working days before start
+        :type base_days: int
+
+        :param base_minutes: sum of working minutes before start
+        :type base_minutes: int
+
+        :param days: counters of working days before start + position
+        :type days: Sequence[int]
+
+        :param minutes: sums of working minutes before start + position
+        :type minutes: Sequence[int]
+
+        :return: index
+        :rtype: PrefixSumIndex
+        """
+
+        index = cls.__new__(cls)
+        index.start = start
+        index.end = end
+        index.tables = tables
+        index.base_days = base_days
+        index.base_minutes = base_minutes
+        index.days = days
+        index.minutes = minutes
+
+        return index
+
+    def __init__(
+        self,
+        tables,  # type: Tables
+        start,  # type: int
+        end,  # type: int
+    ):
+        """
+        :param tables: lookup tables of calendar
+        :type tables: Tables
+
+        :param start: ordinal of first date of span
+        :type start: int
+
+        :param end: ordinal of last date of span
+        :type end: int
+        """
+
+        self.start = start
+        self.end = end
+        self.tables = tables
+
+        self.base_days = base_days = tables.count_days_before(start)
+        self.base_minutes = base_minutes = tables.count_minutes_before(start)
+
+        self.days = array('i', (tables.count_days_before(ordinal) - base_days for ordinal in range(start, end + 2)))
+        self.minutes = array(
+            'q',
+            (tables.count_minutes_before(ordinal) - base_minutes for ordinal in range(start, end + 2))
+        )
+
+    def covers(
+        self,
+        start,  # type: int
+        end,  # type: int
+    ):
+        # type: (...) -> bool
+
+        """
+        Checking if range is inside span of index.
+
+        :param start: ordinal of first date of range
+        :type start: int
+
+        :param end: ordinal of last date of range
+        :type end: int
+
+        :return: result of checking
+        :rtype: bool
+        """
+
+        return self.start <= start and end <= self.end
+
+    def count_days(
+        self,
+        start,  # type: int
+        end,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Count working days in range.
+
+        :param start: ordinal of first date of range
+        :type start: int
+
+        :param end: ordinal of last date of range
+        :type end: int
+
+        :return: counter of working days
+        :rtype: int
+        """
+
+        return self.days[end + 1 - self.start] - self.days[start - self.start]
+
+    def count_minutes(
+        self,
+        start,  # type: int
+        end,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Sum of working minutes in range.
+
+        :param start: ordinal of first date of range
+        :type start: int
+
+        :param end: ordinal of last date of range
+        :type end: int
+
+        :return: sum of working minutes
+        :rtype: int
+        """
+
+        return self.minutes[end + 1 - self.start] - self.minutes[start - self.start]
+
+    def is_working(
+        self,
+        ordinal,  # type: int
+    ):
+        # type: (...) -> Optional[bool]
+
+        """
+        Checking if date is working day.
+
+        :param ordinal: ordinal of date
+        :type ordinal: int
+
+        :return: result of checking or None if ordinal is outside of span
+        :rtype: Optional[bool]
+        """
+
+        if self.start <= ordinal <= self.end:
+            position = ordinal - self.start
+
+            return self.days[position + 1] != self.days[position]
+
+        return None
+
+    def count_days_before(
+        self,
+        ordinal,  # type: int
+    ):
+        # type: (...) -> Optional[int]
+
+        """
+        Count working days before ordinal.
+
+        :param ordinal: ordinal of date
+        :type ordinal: int
+
+        :return: counter of working days or None if ordinal is outside of span
+        :rtype: Optional[int]
+        """
+
+        if self.start <= ordinal <= self.end + 1:
+            return self.base_days + self.days[ordinal - self.start]
+
+        return None
+
+    def find_ordinal(
+        self,
+        count,  # type: int
+    ):
+        # type: (...) -> Optional[int]
+
+        """
+        Return minimal ordinal which has 'count' working days before it.
+
+        :param count: counter of working days
+        :type count: int
+
+        :return: ordinal of date or None if ordinal is outside of span
+        :rtype: Optional[int]
+        """
+
+        count -= self.base_days
+
+        if not 0 < count <= self.days[-1]:
+            return None
+
+        return self.start + bisect.bisect_left(self.days, count)
+
+
+class FenwickIndex(object):
+    """
+    Fenwick trees of working days and working minutes for span of dates.
+    Change of one day and counting in range take logarithmic time, so index is updated in place after changes
+    of single dates instead of rebuilding.
+
+    start — ordinal of first date of span (int).
+    end — ordinal of last date of span (int).
+    tables — lookup tables which index was built from (Tables).
+    day_values — working day flag of start + position (int).
+    minute_values — working minutes of start + position (int).
+    day_tree — Fenwick tree of working day flags (int).
+    minute_tree — Fenwick tree of working minutes (int).
+    incremental — is index updated in place after changes of single dates (bool).
+    """
+
+    incremental = True
+
+    def __init__(
+        self,
+        tables,  # type: Tables
+        start,  # type: int
+        end,  # type: int
+    ):
+        """
+        :param tables: lookup tables of calendar
+        :type tables: Tables
+
+        :param start: ordinal of first date of span
+        :type start: int
+
+        :param end: ordinal of last date of span
+        :type end: int
+        """
+
+        self.start = start
+        self.end = end
+        self.tables = tables
+
+        previous_days = tables.count_days_before(start)
+        previous_minutes = tables.count_minutes_before(start)
+        self.day_values = bytearray()
+        self.minute_values = array('i')
+
+        for ordinal in range(start + 1, end + 2):
+            days = tables.count_days_before(ordinal)
+            minutes = tables.count_minutes_before(ordinal)
+            self.day_values.append(days - previous_days)
+            self.minute_values.append(minutes - previous_minutes)
+            previous_days = days
+            previous_minutes = minutes
+
+        size = len(self.day_values)
+
+        # trees are 1-based, every node is added to its parent in one pass
+        self.day_tree = array('i', [0])
+        self.day_tree.extend(self.day_values)
+        self.minute_tree = array('q', [0])
+        self.minute_tree.extend(iter(self.minute_values))
+
+        for node in range(1, size + 1):
+            parent = node + (node & -node)
+
+            if parent <= size:
+                self.day_tree[parent] += self.day_tree[node]
+                self.minute_tree[parent] += self.minute_tree[node]
+
+    def _sum(
+        self,
+        tree,  # type: array
+        position,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Sum of values before position.
+
+        :param tree: Fenwick tree
+        :type tree: array
+
+        :param position: position of value
+        :type position: int
+
+        :return: sum of values
+        :rtype: int
+        """
+
+        total = 0
+
+        while position > 0:
+            total += tree[position]
+            position -= position & -position
+
+        return total
+
+    def covers(
+        self,
+        start,  # type: int
+        end,  # type: int
+    ):
+        # type: (...) -> bool
+
+        """
+        Checking if range is inside span of index.
+
+        :param start: ordinal of first date of range
+        :type start: int
+
+        :param end: ordinal of last date of range
+        :type end: int
+
+        :return: result of checking
+        :rtype: bool
+        """
+
+        return self.start <= start and end <= self.end
+
+    def update(
+        self,
+        ordinal,  # type: int
+        working,  # type: bool
+        minutes,  # type: int
+    ):
+        """
+        Update status of one day. Days outside of span are ignored.
+
+        :param ordinal: ordinal of date
+        :type ordinal: int
+
+        :param working: is day working
+        :type working: bool
+
+        :param minutes: working minutes of day (0 if day is not working)
+        :type minutes: int
+        """
+
+        if not self.start <= ordinal <= self.end:
+            return
+
+        position = ordinal - self.start
+        day_delta = working - self.day_values[position]
+        minute_delta = minutes - self.minute_values[position]
+        self.day_values[position] = working
+        self.minute_values[position] = minutes
+
+        size = len(self.day_values)
+        position += 1
+
+        while position <= size:
+            self.day_tree[position] += day_delta
+            self.minute_tree[position] += minute_delta
+            position += position & -position
+
+    def is_working(
+        self,
+        ordinal,  # type: int
+    ):
+        # type: (...) -> Optional[bool]
+
+        """
+        Checking if date is working day.
+
+        :param ordinal: ordinal of date
+        :type ordinal: int
+
+        :return: result of checking or None if ordinal is outside of span
+        :rtype: Optional[bool]
+        """
+
+        if self.start <= ordinal <= self.end:
+            return bool(self.day_values[ordinal - self.start])
+
+        return None
+
+    def count_days(
+        self,
+        start,  # type: int
+        end,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Count working days in range.
+
+        :param start: ordinal of first date of range
+        :type start: int
+
+        :param end: ordinal of last date of range
+        :type end: int
+
+        :return: counter of working days
+        :rtype: int
+        """
+
+        return self._sum(self.day_tree, end + 1 - self.start) - self._sum(self.day_tree, start - self.start)
+
+    def count_minutes(
+        self,
+        start,  # type: int
+        end,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Sum of working minutes in range.
+
+        :param start: ordinal of first date of range
+        :type start: int
+
+        :param end: ordinal of last date of range
+        :type end: int
+
+        :return: sum of working minutes
+        :rtype: int
+        """
+
+        return self._sum(self.minute_tree, end + 1 - self.start) - self._sum(self.minute_tree, start - self.start)
+
+    def count_days_before(
+        self,
+        ordinal,  # type: int
+    ):
+        # type: (...) -> Optional[int]
+
+        """
+        Count working days before ordinal. Days before span are not counted by trees, so lookup tables are used.
+
+        :param ordinal: ordinal of date
+        :type ordinal: int
+
+        :return: counter of working days
+        :rtype: Optional[int]
+        """
+
+        return None
+
+    def find_ordinal(
+        self,
+        count,  # type: int
+    ):
+        # type: (...) -> Optional[int]
+
+        """
+        Return minimal ordinal which has 'count' working days before it.
+        Days before span are not counted by trees, so lookup tables are used.
+
+        :param count: counter of working days
+        :type count: int
+
+        :return: ordinal of date
+        :rtype: Optional[int]
+        """
+
+        return None
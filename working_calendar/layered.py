@@ -0,0 +1,316 @@
+import datetime
+
+from typing import (
+    Dict,
+    FrozenSet,
+    Optional,
+    Tuple,
+    Union
+)
+
+from .base import BaseWorkingCalendar
+from .cache import QueryCache
+from .core import (
+    INDEX_CLASSES,
+    WorkingCalendar
+)
+from .enumerations import IndexKinds
+from .exceptions import StartGreaterEndException
+from .indexes import (
+    FenwickIndex,
+    PrefixSumIndex
+)
+from .tables import Tables
+
+
+class LayeredWorkingCalendar(BaseWorkingCalendar):
+    """
+    Stack of calendars (for example: national, regional and company calendars) queried as one calendar.
+
+    Layers are not copied. Holidays and additional working days of all layers are merged,
+    additional working day of any layer overrides holiday of any layer (as in one calendar).
+    Working time of not standard working day is taken from the last layer which has this day.
+    Weekends, working time and working schedule of normal working day are taken from the first layer.
+
+    Lookup tables and index are merged lazily and rebuilt only after changes of layers.
+
+    _layers — calendars from the first (base) to the last (most specific) one (BaseWorkingCalendar).
+    _cache — cache of results of counting (QueryCache).
+    _tables — merged lookup tables for counting (Tables), None until first query.
+    _tables_version — versions of layers which merged lookup tables are built from (tuple).
+    _index_span — ordinals of first and last dates of precomputed index (int), None if index is not used.
+    _index_kind — kind of precomputed index (IndexKinds).
+    _index — precomputed index (PrefixSumIndex or FenwickIndex), None if should be rebuilt.
+    """
+
+    def __init__(
+        self,
+        *layers,  # type: BaseWorkingCalendar
+        cache_size=0  # type: int
+    ):
+        """
+        :param layers: calendars from the first (base) to the last (most specific) one
+        :type layers: BaseWorkingCalendar
+
+        :param cache_size: maximal number of cached results of counting, default: 0 (cache is disabled)
+        :type cache_size: int
+        """
+
+        if not layers:
+            raise ValueError('At least one layer is required.')
+
+        for layer in layers:
+            if not isinstance(layer, BaseWorkingCalendar):
+                raise ValueError('Layer must be working calendar.')
+
+        self._layers = tuple(layers)
+        self._cache = QueryCache(cache_size)
+        self._tables = None
+        self._tables_version = None
+        self._index_span = None
+        self._index_kind = IndexKinds.PREFIX_SUM
+        self._index = None
+
+    @property
+    def _version(self):
+        # type: (...) -> Tuple
+
+        """
+        Versions of layers, changed after change of any layer.
+
+        :return: versions of layers
+        :rtype: Tuple
+        """
+
+        return tuple(layer._version for layer in self._layers)
+
+    @property
+    def _weekend_flags(self):
+        # type: (...) -> Tuple[bool, ...]
+
+        """
+        Flags of weekends of the first layer.
+
+        :return: is day weekend by ordinal of date modulo 7
+        :rtype: Tuple[bool, ...]
+        """
+
+        return self._layers[0]._weekend_flags
+
+    @property
+    def _working_time_minutes(self):
+        # type: (...) -> int
+
+        """
+        Working time of normal working day of the first layer.
+
+        :return: working minutes of normal working day
+        :rtype: int
+        """
+
+        return self._layers[0]._working_time_minutes
+
+    @property
+    def _working_schedule(self):
+        # type: (...) -> Optional[Tuple[Tuple[int, int], ...]]
+
+        """
+        Working schedule of the first layer.
+
+        :return: working intervals of day in minutes from midnight or None if schedule is not set
+        :rtype: Optional[Tuple[Tuple[int, int], ...]]
+        """
+
+        return self._layers[0]._working_schedule
+
+    def _get_tables(self):
+        # type: (...) -> Tables
+
+        """
+        Return merged lookup tables for counting. Tables are rebuilt after change of any layer.
+
+        :return: lookup tables
+        :rtype: Tables
+        """
+
+        version = self._version
+
+        if self._tables is None or self._tables_version != version:
+            not_standard_working_days = self.get_not_standard_working_days()
+            self._tables = Tables(
+                self._weekend_flags,
+                self._working_time_minutes,
+                {date.toordinal() for date in self.get_holidays()},
+                {date.toordinal() for date in self.get_working_days()},
+                {date.toordinal(): minutes for date, minutes in not_standard_working_days.items()}
+            )
+            self._tables_version = version
+
+        return self._tables
+
+    def _get_index(self):
+        # type: (...) -> Optional[Union[PrefixSumIndex, FenwickIndex]]
+
+        """
+        Return precomputed index. Index is rebuilt after change of any layer.
+
+        :return: precomputed index or None if index is not used
+        :rtype: Optional[Union[PrefixSumIndex, FenwickIndex]]
+        """
+
+        if self._index_span is None:
+            return None
+
+        tables = self._get_tables()
+
+        if self._index is None or self._index.tables is not tables:
+            index_class = INDEX_CLASSES[self._index_kind]
+            self._index = index_class(tables, self._index_span[0], self._index_span[1])
+
+        return self._index
+
+    def build_index(
+        self,
+        start_date,  # type: datetime.date
+        end_date,  # type: datetime.date
+        kind=IndexKinds.PREFIX_SUM,  # type: Union[IndexKinds, str]
+    ):
+        """
+        Precompute merged index of days between 2 dates. Index is rebuilt automatically after changes of layers.
+        Kinds of index are described in 'WorkingCalendar.build_index'.
+
+        :param start_date: date for start
+        :type start_date: datetime.date
+
+        :param end_date: date for end
+        :type end_date: datetime.date
+
+        :param kind: kind of index, default: IndexKinds.PREFIX_SUM
+        :type kind: Union[IndexKinds, str]
+        """
+
+        start_date = self._check_date(start_date)
+        end_date = self._check_date(end_date)
+
+        if start_date > end_date:
+            raise StartGreaterEndException
+
+        self._index_span = (start_date.toordinal(), end_date.toordinal())
+        self._index_kind = WorkingCalendar._check_index_kind(kind)
+        self._index = None
+        self._get_index()
+
+    def drop_index(self):
+        """
+        Drop precomputed index.
+        """
+
+        self._index_span = None
+        self._index = None
+
+    def get_layers(self):
+        # type: (...) -> Tuple[BaseWorkingCalendar, ...]
+
+        """
+        Return layers from the first (base) to the last (most specific) one.
+
+        :return: layers
+        :rtype: Tuple[BaseWorkingCalendar, ...]
+        """
+
+        return self._layers
+
+    def get_holidays(self):
+        # type: (...) -> FrozenSet[datetime.date]
+
+        """
+        Return merged set of holidays of all layers.
+
+        :return: set of holidays
+        :rtype: FrozenSet[datetime.date]
+        """
+
+        return frozenset().union(*(layer.get_holidays() for layer in self._layers))
+
+    def get_not_standard_working_days(self):
+        # type: (...) -> Dict[datetime.date: int]
+
+        """
+        Return merged dictionary of not standard working days, later layers override earlier ones.
+
+        :return: dictionary of not standard working days
+        :rtype: Dict[datetime.date: int]
+        """
+
+        not_standard_working_days = dict()
+
+        for layer in self._layers:
+            not_standard_working_days.update(layer.get_not_standard_working_days())
+
+        return not_standard_working_days
+
+    def get_working_days(self):
+        # type: (...) -> FrozenSet[datetime.date]
+
+        """
+        Return merged set of additional working days of all layers.
+
+        :return: set of additional working days
+        :rtype: FrozenSet[datetime.date]
+        """
+
+        return frozenset().union(*(layer.get_working_days() for layer in self._layers))
+
+    def is_additional_working_day(
+        self,
+        date,  # type: datetime.date
+    ):
+        # type: (...) -> bool
+
+        """
+        Checking if date is additional working day of any layer.
+
+        :param date: date for checking
+        :type date: datetime.date
+
+        :return: result of checking
+        :rtype: bool
+        """
+
+        return any(layer.is_additional_working_day(date) for layer in self._layers)
+
+    def is_holiday(
+        self,
+        date,  # type: datetime.date
+    ):
+        # type: (...) -> bool
+
+        """
+        Checking if date is holiday of any layer.
+
+        :param date: date for checking
+        :type date: datetime.date
+
+        :return: result of checking
+        :rtype: bool
+        """
+
+        return any(layer.is_holiday(date) for layer in self._layers)
+
+    def is_not_standard_working_day(
+        self,
+        date,  # type: datetime.date
+    ):
+        # type: (...) -> bool
+
+        """
+        Checking if date is not standard working day of any layer.
+
+        :param date: date for checking
+        :type date: datetime.date
+
+        :return: result of checking
+        :rtype: bool
+        """
+
+        return any(layer.is_not_standard_working_day(date) for layer in self._layers)
@@ -0,0 +1,220 @@
+import csv
+import datetime
+import heapq
+import json
+
+from typing import (
+    Any,
+    Iterator,
+    Optional,
+    Tuple
+)
+
+from .enumerations import DayKinds
+
+
+# names of fields of record
+FIELDS = ('date', 'kind', 'minutes')
+
+# record of calendar: ordinal of date, kind of date and working minutes (only for not standard working day)
+Record = Tuple[int, DayKinds, Optional[int]]
+
+
+def iter_records(
+    calendar,  # type: Any
+):
+    # type: (...) -> Iterator[Record]
+
+    """
+    Return records of calendar sorted by date (holiday, additional working day, not standard working day
+    for the same date). Records are merged from sorted ordinals of each kind, they are not collected.
+
+    :param calendar: working calendar
+    :type calendar: BaseWorkingCalendar
+
+    :return: iterator of records
+    :rtype: Iterator[Record]
+    """
+
+    holidays = sorted(date.toordinal() for date in calendar.get_holidays())
+    working_days = sorted(date.toordinal() for date in calendar.get_working_days())
+    not_standard_working_days = sorted(
+        (date.toordinal(), minutes) for date, minutes in calendar.get_not_standard_working_days().items()
+    )
+
+    return heapq.merge(
+        ((ordinal, DayKinds.HOLIDAY, None) for ordinal in holidays),
+        ((ordinal, DayKinds.WORKING_DAY, None) for ordinal in working_days),
+        ((ordinal, DayKinds.NOT_STANDARD_WORKING_DAY, minutes) for ordinal, minutes in not_standard_working_days),
+        key=lambda record: record[0]
+    )
+
+
+def write_csv(
+    records,  # type: Iterator[Record]
+    file,  # type: Any
+):
+    """
+    Write records as CSV with header 'date,kind,minutes', row by row.
+
+    :param records: records of calendar
+    :type records: Iterator[Record]
+
+    :param file: text file object (opened with newline='')
+    :type file: Any
+    """
+
+    writer = csv.writer(file, lineterminator='\n')
+    writer.writerow(FIELDS)
+
+    for ordinal, kind, minutes in records:
+        writer.writerow((datetime.date.fromordinal(ordinal).isoformat(), kind.value, minutes))
+
+
+def write_json(
+    records,  # type: Iterator[Record]
+    file,  # type: Any
+):
+    """
+    Write records as JSON Lines (one object with keys 'date', 'kind' and 'minutes' per line), line by line.
+
+    :param records: records of calendar
+    :type records: Iterator[Record]
+
+    :param file: text file object
+    :type file: Any
+    """
+
+    for ordinal, kind, minutes in records:
+        file.write(json.dumps(dict(zip(FIELDS, (
+            datetime.date.fromordinal(ordinal).isoformat(),
+            kind.value,
+            minutes
+        )))))
+        file.write('\n')
+
+
+def _parse_record(
+    date,  # type: Any
+    kind,  # type: Any
+    minutes,  # type: Any
+):
+    # type: (...) -> Record
+
+    """
+    Parse and validate values of record.
+
+    :param date: date in ISO format ('YYYY-MM-DD')
+    :type date: Any
+
+    :param kind: kind of date (value of DayKinds)
+    :type kind: Any
+
+    :param minutes: working minutes for not standard working day, None or empty string for other kinds
+    :type minutes: Any
+
+    :return: record
+    :rtype: Record
+    """
+
+    if not (isinstance(date, str) and len(date) == 10 and date[4] == '-' and date[7] == '-'):
+        raise ValueError('invalid date \'{}\''.format(date))
+
+    try:
+        ordinal = datetime.date(int(date[0:4]), int(date[5:7]), int(date[8:10])).toordinal()
+    except ValueError:
+        raise ValueError('invalid date \'{}\''.format(date))
+
+    try:
+        kind = DayKinds(kind)
+    except ValueError:
+        raise ValueError('invalid kind \'{}\''.format(kind))
+
+    if kind is not DayKinds.NOT_STANDARD_WORKING_DAY:
+        if minutes not in (None, ''):
+            raise ValueError('minutes are allowed only for not standard working day')
+
+        return ordinal, kind, None
+
+    if not (isinstance(minutes, int) and not isinstance(minutes, bool) and minutes > 0):
+        raise ValueError('minutes must be integer greater than 0')
+
+    return ordinal, kind, minutes
+
+
+def read_csv(
+    file,  # type: Any
+):
+    # type: (...) -> Iterator[Tuple[int, Optional[Record], Optional[str]]]
+
+    """
+    Read records from CSV with header 'date,kind,minutes' row by row.
+    Invalid row does not stop reading, its error is returned instead of record.
+
+    :param file: text file object (opened with newline='') or any iterable of lines
+    :type file: Any
+
+    :return: iterator of number of line, record (None for invalid row) and error (None for valid row)
+    :rtype: Iterator[Tuple[int, Optional[Record], Optional[str]]]
+    """
+
+    reader = csv.reader(file)
+    header = next(reader, None)
+
+    if header is None:
+        return
+
+    if tuple(field.strip() for field in header) != FIELDS:
+        yield reader.line_num, None, 'header must be \'{}\''.format(','.join(FIELDS))
+        return
+
+    for row in reader:
+        if not row:
+            continue
+
+        if len(row) != len(FIELDS):
+            yield reader.line_num, None, 'expected {} fields, got {}'.format(len(FIELDS), len(row))
+            continue
+
+        date, kind, minutes = (value.strip() for value in row)
+
+        try:
+            yield reader.line_num, _parse_record(date, kind, int(minutes) if minutes.isdigit() else minutes), None
+        except ValueError as error:
+            yield reader.line_num, None, str(error)
+
+
+def read_json(
+    file,  # type: Any
+):
+    # type: (...) -> Iterator[Tuple[int, Optional[Record], Optional[str]]]
+
+    """
+    Read records from JSON Lines line by line. Invalid line does not stop reading,
+    its error is returned instead of record.
+
+    :param file: text file object or any iterable of lines
+    :type file: Any
+
+    :return: iterator of number of line, record (None for invalid line) and error (None for valid line)
+    :rtype: Iterator[Tuple[int, Optional[Record], Optional[str]]]
+    """
+
+    for line, text in enumerate(file, 1):
+        if not text.strip():
+            continue
+
+        try:
+            value = json.loads(text)
+        except ValueError:
+            yield line, None, 'invalid JSON'
+            continue
+
+        if not isinstance(value, dict) or set(value) - set(FIELDS) or 'date' not in value or 'kind' not in value:
+            yield line, None, 'expected object with keys \'date\', \'kind\' and optional \'minutes\''
+            continue
+
+        try:
+            yield line, _parse_record(value['date'], value['kind'], value.get('minutes')), None
+        except ValueError as error:
+            yield line, None, str(error)
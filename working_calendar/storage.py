@@ -0,0 +1,335 @@
+import os
+import struct
+import sys
+
+from array import array
+from collections import namedtuple
+from typing import (
+    Any,
+    Optional,
+    Sequence,
+    Tuple
+)
+
+from .indexes import PrefixSumIndex
+
+try:
+    from multiprocessing import (
+        resource_tracker,
+        shared_memory
+    )
+except ImportError:
+    resource_tracker = None
+    shared_memory = None
+
+
+# signature of file and version of format
+MAGIC = b'WCAL'
+FORMAT_VERSION = 1
+
+# little-endian header: signature, version, mask of weekends by ordinal modulo 7, flags, working time minutes,
+# number of intervals of schedule, numbers of holidays, additional working days and not standard working days,
+# span of index and counters of working days and minutes before span
+HEADER = struct.Struct('<4sHBBiH2xIIIiiqq4x')
+
+FLAG_INDEX = 1
+
+# names of blocks of shared memory created by this process (and inherited by forked processes),
+# they are tracked by the same resource tracker as in process which created them
+PUBLISHED_NAMES = set()
+
+CalendarData = namedtuple('CalendarData', [
+    'weekend_flags',
+    'working_time_minutes',
+    'working_schedule',
+    'holidays',
+    'working_days',
+    'not_standard_ordinals',
+    'not_standard_minutes',
+    'index',
+])
+
+IndexData = namedtuple('IndexData', ['start', 'end', 'base_days', 'base_minutes', 'days', 'minutes'])
+
+
+if shared_memory is not None:
+    class AttachedSharedMemory(shared_memory.SharedMemory):
+        """
+        Block of shared memory attached by snapshot. Memory of block is exported by arrays of snapshot,
+        so block can not be closed before them (for example: when objects are collected at exit of interpreter).
+        Memory is unmapped after release of the last array in this case.
+        """
+
+        def __del__(self):
+            try:
+                self.close()
+            except (BufferError, OSError):
+                pass
+
+
+def check_shared_memory():
+    """
+    Check if shared memory is supported.
+    """
+
+    if shared_memory is None:
+        raise ImportError('Module \'multiprocessing.shared_memory\' is required (Python 3.8 or newer).')
+
+
+def create_shared_memory(
+    data,  # type: bytes
+    name=None,  # type: Optional[str]
+):
+    # type: (...) -> shared_memory.SharedMemory
+
+    """
+    Create block of shared memory and copy data to it.
+
+    :param data: bytes for copying
+    :type data: bytes
+
+    :param name: name of block, default: None (unique name is generated)
+    :type name: Optional[str]
+
+    :return: block of shared memory
+    :rtype: shared_memory.SharedMemory
+    """
+
+    check_shared_memory()
+
+    block = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+    block.buf[:len(data)] = data
+    PUBLISHED_NAMES.add(block.name)
+
+    return block
+
+
+def attach_shared_memory(
+    name,  # type: str
+):
+    # type: (...) -> AttachedSharedMemory
+
+    """
+    Attach existing block of shared memory. Block is not tracked, so it is not removed when process exits
+    (only process which created block removes it).
+
+    :param name: name of block
+    :type name: str
+
+    :return: block of shared memory
+    :rtype: AttachedSharedMemory
+    """
+
+    check_shared_memory()
+
+    if sys.version_info >= (3, 13):
+        return AttachedSharedMemory(name=name, track=False)
+
+    block = AttachedSharedMemory(name=name)
+
+    if os.name == 'posix' and block.name not in PUBLISHED_NAMES:
+        # before Python 3.13 attached block is registered in resource tracker of process,
+        # which removes block when process exits
+        resource_tracker.unregister(block._name, 'shared_memory')
+
+    return block
+
+
+def _pack_array(
+    typecode,  # type: str
+    values,  # type: Sequence[int]
+):
+    # type: (...) -> bytes
+
+    """
+    Pack integers as little-endian array padded to 8 bytes.
+
+    :param typecode: type code of array ('i' or 'q')
+    :type typecode: str
+
+    :param values: integers
+    :type values: Sequence[int]
+
+    :return: bytes of array
+    :rtype: bytes
+    """
+
+    values = array(typecode, values)
+
+    if sys.byteorder == 'big':
+        values.byteswap()
+
+    data = values.tobytes()
+
+    return data + bytes(-len(data) % 8)
+
+
+def _unpack_array(
+    buffer,  # type: memoryview
+    offset,  # type: int
+    typecode,  # type: str
+    size,  # type: int
+):
+    # type: (...) -> Tuple[Sequence[int], int]
+
+    """
+    Unpack little-endian array padded to 8 bytes. Array is not copied on little-endian platforms.
+
+    :param buffer: bytes of calendar
+    :type buffer: memoryview
+
+    :param offset: position of array
+    :type offset: int
+
+    :param typecode: type code of array ('i' or 'q')
+    :type typecode: str
+
+    :param size: number of integers
+    :type size: int
+
+    :return: integers and position after array
+    :rtype: Tuple[Sequence[int], int]
+    """
+
+    length = size * array(typecode).itemsize
+    data = buffer[offset:offset + length]
+
+    if len(data) != length:
+        raise ValueError('Buffer of working calendar is truncated.')
+
+    if sys.byteorder == 'big':
+        values = array(typecode, data.tobytes())
+        values.byteswap()
+    else:
+        values = data.cast(typecode)
+
+    return values, offset + length + (-length % 8)
+
+
+def pack_calendar(
+    calendar,  # type: Any
+    with_index=True,  # type: bool
+):
+    # type: (...) -> bytes
+
+    """
+    Pack calendar to compact binary format: header and sorted arrays of ordinals,
+    optionally followed by cumulative counters of precomputed index.
+
+    :param calendar: working calendar
+    :type calendar: BaseWorkingCalendar
+
+    :param with_index: pack counters of precomputed index if calendar has index, default: True
+    :type with_index: bool
+
+    :return: bytes of calendar
+    :rtype: bytes
+    """
+
+    schedule = calendar._working_schedule or ()
+    holidays = sorted(date.toordinal() for date in calendar.get_holidays())
+    working_days = sorted(date.toordinal() for date in calendar.get_working_days())
+    not_standard_working_days = sorted(
+        (date.toordinal(), minutes) for date, minutes in calendar.get_not_standard_working_days().items()
+    )
+    index = calendar._get_index() if with_index else None
+
+    if index is not None and not isinstance(index, PrefixSumIndex):
+        index = PrefixSumIndex(calendar._get_tables(), index.start, index.end)
+
+    parts = [
+        HEADER.pack(
+            MAGIC,
+            FORMAT_VERSION,
+            sum(flag << residue for residue, flag in enumerate(calendar._weekend_flags)),
+            FLAG_INDEX if index is not None else 0,
+            calendar._working_time_minutes,
+            len(schedule),
+            len(holidays),
+            len(working_days),
+            len(not_standard_working_days),
+            index.start if index is not None else 0,
+            index.end if index is not None else 0,
+            index.base_days if index is not None else 0,
+            index.base_minutes if index is not None else 0,
+        ),
+        _pack_array('i', [minute for interval in schedule for minute in interval]),
+        _pack_array('i', holidays),
+        _pack_array('i', working_days),
+        _pack_array('i', [ordinal for ordinal, minutes in not_standard_working_days]),
+        _pack_array('i', [minutes for ordinal, minutes in not_standard_working_days]),
+    ]
+
+    if index is not None:
+        parts.append(_pack_array('i', index.days))
+        parts.append(_pack_array('q', index.minutes))
+
+    return b''.join(parts)
+
+
+def unpack_calendar(
+    buffer,  # type: Any
+):
+    # type: (...) -> CalendarData
+
+    """
+    Unpack calendar from compact binary format. Arrays refer to buffer (for example: memory-mapped file)
+    without copying on little-endian platforms, so buffer should stay unchanged.
+
+    :param buffer: bytes of calendar (any object which supports buffer protocol)
+    :type buffer: Any
+
+    :return: data of calendar
+    :rtype: CalendarData
+    """
+
+    buffer = memoryview(buffer).cast('B')
+
+    if len(buffer) < HEADER.size:
+        raise ValueError('Buffer of working calendar is truncated.')
+
+    (
+        magic,
+        version,
+        weekend_mask,
+        flags,
+        working_time_minutes,
+        schedule_size,
+        holidays_size,
+        working_days_size,
+        not_standard_size,
+        index_start,
+        index_end,
+        index_base_days,
+        index_base_minutes,
+    ) = HEADER.unpack_from(buffer)
+
+    if magic != MAGIC:
+        raise ValueError('Buffer is not working calendar.')
+
+    if version != FORMAT_VERSION:
+        raise ValueError('Version {} of format of working calendar is not supported.'.format(version))
+
+    offset = HEADER.size
+    schedule, offset = _unpack_array(buffer, offset, 'i', schedule_size * 2)
+    holidays, offset = _unpack_array(buffer, offset, 'i', holidays_size)
+    working_days, offset = _unpack_array(buffer, offset, 'i', working_days_size)
+    not_standard_ordinals, offset = _unpack_array(buffer, offset, 'i', not_standard_size)
+    not_standard_minutes, offset = _unpack_array(buffer, offset, 'i', not_standard_size)
+    index = None
+
+    if flags & FLAG_INDEX:
+        days, offset = _unpack_array(buffer, offset, 'i', index_end - index_start + 2)
+        minutes, offset = _unpack_array(buffer, offset, 'q', index_end - index_start + 2)
+        index = IndexData(index_start, index_end, index_base_days, index_base_minutes, days, minutes)
+
+    return CalendarData(
+        tuple(bool(weekend_mask >> residue & 1) for residue in range(7)),
+        working_time_minutes,
+        tuple(zip(schedule[::2], schedule[1::2])) or None,
+        holidays,
+        working_days,
+        not_standard_ordinals,
+        not_standard_minutes,
+        index,
+    )
@@ -0,0 +1,376 @@
+import bisect
+
+from typing import (
+    Dict,
+    Optional,
+    Set,
+    Tuple
+)
+
+
+class Tables(object):
+    """
+    Lookup tables for counting working days and working minutes arithmetically.
+
+    Every range is split to whole weeks (multiplied by count of working days of the week)
+    and leftover days. Result is corrected by exceptions — days which status or working time
+    differs from status or working time of their day of the week.
+
+    working_weekdays — is day working by ordinal of date modulo 7 (bool).
+    weekday_prefix — counter of working days of the week before ordinal modulo 7 (int).
+    working_per_week — counter of working days of the week (int).
+    working_time_minutes — working minutes of normal working day (int).
+    ordinals — sorted ordinals of exceptions (int).
+    day_prefix — cumulative corrections of working days before exception (int).
+    minute_prefix — cumulative corrections of working minutes before exception (int).
+    day_min — minimal cumulative correction of working days (int).
+    day_max — maximal cumulative correction of working days (int).
+    next_jumps — days to the next working day of the week by ordinal modulo 7 (int), None if there is no one.
+    previous_jumps — days to the previous working day of the week by ordinal modulo 7 (int), None if there is no one.
+    rest_jumps — days to the next weekend by ordinal modulo 7 (int), None if there is no one.
+    added — sorted ordinals of working days which are not working days of the week (int).
+    removed — ordinals of not working days which are working days of the week (int).
+    removed_sorted — sorted ordinals of not working days which are working days of the week (int).
+    run_starts — sorted first ordinals of runs of removed days, which have no other working days of the week (int).
+    run_ends — last ordinals of runs of removed days by index of run (int).
+    vectors — tables converted to numpy arrays (Vectors), None until vectorized counting is used.
+    """
+
+    def __init__(
+        self,
+        weekend_flags,  # type: Tuple[bool, ...]
+        working_time_minutes,  # type: int
+        holidays,  # type: Set[int]
+        working_days,  # type: Set[int]
+        not_standard_working_days,  # type: Dict[int, int]
+    ):
+        """
+        :param weekend_flags: is day weekend by ordinal of date modulo 7
+        :type weekend_flags: Tuple[bool, ...]
+
+        :param working_time_minutes: working time for one working day in minutes
+        :type working_time_minutes: int
+
+        :param holidays: ordinals of holidays
+        :type holidays: Set[int]
+
+        :param working_days: ordinals of additional working days
+        :type working_days: Set[int]
+
+        :param not_standard_working_days: working time minutes of not standard working days by ordinals
+        :type not_standard_working_days: Dict[int, int]
+        """
+
+        self.working_weekdays = tuple(not weekend for weekend in weekend_flags)
+        self.weekday_prefix = [0]
+
+        for working in self.working_weekdays:
+            self.weekday_prefix.append(self.weekday_prefix[-1] + working)
+
+        self.working_per_week = self.weekday_prefix[-1]
+        self.next_jumps = tuple(
+            next((jump for jump in range(7) if self.working_weekdays[(residue + jump) % 7]), None)
+            for residue in range(7)
+        )
+        self.previous_jumps = tuple(
+            next((jump for jump in range(7) if self.working_weekdays[(residue - jump) % 7]), None)
+            for residue in range(7)
+        )
+        self.rest_jumps = tuple(
+            next((jump for jump in range(7) if not self.working_weekdays[(residue + jump) % 7]), None)
+            for residue in range(7)
+        )
+        self.working_time_minutes = working_time_minutes
+
+        self.ordinals = []
+        self.day_prefix = [0]
+        self.minute_prefix = [0]
+        self.added = []
+        self.removed = set()
+        self.removed_sorted = []
+
+        ordinals = set(holidays)
+        ordinals.update(working_days)
+        ordinals.update(not_standard_working_days)
+
+        for ordinal in sorted(ordinals):
+            default = self.working_weekdays[ordinal % 7]
+            working = ordinal in working_days or (default and ordinal not in holidays)
+
+            day_delta = working - default
+            minute_delta = (
+                (not_standard_working_days.get(ordinal, working_time_minutes) if working else 0) -
+                (working_time_minutes if default else 0)
+            )
+
+            if day_delta > 0:
+                self.added.append(ordinal)
+            elif day_delta < 0:
+                self.removed.add(ordinal)
+                self.removed_sorted.append(ordinal)
+
+            if day_delta or minute_delta:
+                self.ordinals.append(ordinal)
+                self.day_prefix.append(self.day_prefix[-1] + day_delta)
+                self.minute_prefix.append(self.minute_prefix[-1] + minute_delta)
+
+        # consecutive removed days (for example: long holidays) are jumped at once
+        self.run_starts = []
+        self.run_ends = []
+
+        for ordinal in self.removed_sorted:
+            # removed day continues run if there are no working days of the week between them
+            if self.run_ends and (
+                self.count_weekdays_before(ordinal) == self.count_weekdays_before(self.run_ends[-1] + 1)
+            ):
+                self.run_ends[-1] = ordinal
+            else:
+                self.run_starts.append(ordinal)
+                self.run_ends.append(ordinal)
+
+        self.day_min = min(self.day_prefix)
+        self.day_max = max(self.day_prefix)
+        self.vectors = None
+
+    def count_weekdays_before(
+        self,
+        ordinal,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Count working days of the week before ordinal ignoring exceptions.
+
+        :param ordinal: ordinal of date
+        :type ordinal: int
+
+        :return: counter of working days
+        :rtype: int
+        """
+
+        return ordinal // 7 * self.working_per_week + self.weekday_prefix[ordinal % 7]
+
+    def find_weekday_ordinal(
+        self,
+        count,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Return minimal ordinal which has 'count' working days of the week before it ignoring exceptions.
+        There should be at least one working day of the week.
+
+        :param count: counter of working days
+        :type count: int
+
+        :return: ordinal of date
+        :rtype: int
+        """
+
+        weeks, rest = divmod(count - 1, self.working_per_week)
+
+        return weeks * 7 + bisect.bisect_left(self.weekday_prefix, rest + 1)
+
+    def find_ordinal(
+        self,
+        count,  # type: int
+    ):
+        # type: (...) -> Optional[int]
+
+        """
+        Return minimal ordinal which has 'count' working days before it.
+
+        :param count: counter of working days
+        :type count: int
+
+        :return: ordinal of date or None if there is no such date
+        :rtype: Optional[int]
+        """
+
+        if not self.working_per_week:
+            # only additional working days are working, so corrections never decrease
+            if not 0 < count <= self.day_max:
+                return None
+
+            return self.ordinals[bisect.bisect_left(self.day_prefix, count) - 1] + 1
+
+        low = self.find_weekday_ordinal(count - self.day_max)
+        high = self.find_weekday_ordinal(count - self.day_min)
+
+        while low < high:
+            middle = (low + high) // 2
+
+            if self.count_days_before(middle) < count:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def is_working(
+        self,
+        ordinal,  # type: int
+    ):
+        # type: (...) -> bool
+
+        """
+        Checking if date is working day.
+
+        :param ordinal: ordinal of date
+        :type ordinal: int
+
+        :return: result of checking
+        :rtype: bool
+        """
+
+        if self.working_weekdays[ordinal % 7]:
+            return ordinal not in self.removed
+
+        index = bisect.bisect_left(self.added, ordinal)
+
+        return index < len(self.added) and self.added[index] == ordinal
+
+    def find_next_working(
+        self,
+        ordinal,  # type: int
+    ):
+        # type: (...) -> Optional[int]
+
+        """
+        Return ordinal of the first working day on or after ordinal.
+        Weekends and runs of removed days are jumped at once.
+
+        :param ordinal: ordinal of date
+        :type ordinal: int
+
+        :return: ordinal of working day or None if there is no one
+        :rtype: Optional[int]
+        """
+
+        index = bisect.bisect_left(self.added, ordinal)
+        added = self.added[index] if index < len(self.added) else None
+
+        if not self.working_per_week:
+            return added
+
+        ordinal += self.next_jumps[ordinal % 7]
+
+        if ordinal in self.removed:
+            # the first working day of the week after run is not removed
+            ordinal = self.run_ends[bisect.bisect_right(self.run_starts, ordinal) - 1] + 1
+            ordinal += self.next_jumps[ordinal % 7]
+
+        if added is not None and added < ordinal:
+            return added
+
+        return ordinal
+
+    def find_previous_working(
+        self,
+        ordinal,  # type: int
+    ):
+        # type: (...) -> Optional[int]
+
+        """
+        Return ordinal of the last working day on or before ordinal.
+        Weekends and runs of removed days are jumped at once.
+
+        :param ordinal: ordinal of date
+        :type ordinal: int
+
+        :return: ordinal of working day or None if there is no one
+        :rtype: Optional[int]
+        """
+
+        index = bisect.bisect_right(self.added, ordinal)
+        added = self.added[index - 1] if index else None
+
+        if not self.working_per_week:
+            return added
+
+        ordinal -= self.previous_jumps[ordinal % 7]
+
+        if ordinal in self.removed:
+            # the last working day of the week before run is not removed
+            ordinal = self.run_starts[bisect.bisect_right(self.run_starts, ordinal) - 1] - 1
+            ordinal -= self.previous_jumps[ordinal % 7]
+
+        if added is not None and added > ordinal:
+            return added
+
+        return ordinal
+
+    def find_next_not_working(
+        self,
+        ordinal,  # type: int
+    ):
+        # type: (...) -> Optional[int]
+
+        """
+        Return ordinal of the first not working day on or after ordinal.
+
+        :param ordinal: ordinal of date
+        :type ordinal: int
+
+        :return: ordinal of not working day or None if there is no one
+        :rtype: Optional[int]
+        """
+
+        index = bisect.bisect_left(self.removed_sorted, ordinal)
+        removed = self.removed_sorted[index] if index < len(self.removed_sorted) else None
+
+        if self.working_per_week == 7:
+            return removed
+
+        while True:
+            ordinal += self.rest_jumps[ordinal % 7]
+
+            if removed is not None and removed < ordinal:
+                return removed
+
+            index = bisect.bisect_left(self.added, ordinal)
+
+            if index == len(self.added) or self.added[index] != ordinal:
+                return ordinal
+
+            ordinal += 1
+
+    def count_days_before(
+        self,
+        ordinal,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Count working days before ordinal.
+
+        :param ordinal: ordinal of date
+        :type ordinal: int
+
+        :return: counter of working days
+        :rtype: int
+        """
+
+        index = bisect.bisect_left(self.ordinals, ordinal)
+
+        return self.count_weekdays_before(ordinal) + self.day_prefix[index]
+
+    def count_minutes_before(
+        self,
+        ordinal,  # type: int
+    ):
+        # type: (...) -> int
+
+        """
+        Sum of working minutes before ordinal.
+
+        :param ordinal: ordinal of date
+        :type ordinal: int
+
+        :return: sum of working minutes
+        :rtype: int
+        """
+
+        index = bisect.bisect_left(self.ordinals, ordinal)
+
+        return self.count_weekdays_before(ordinal) * self.working_time_minutes + self.minute_prefix[index]
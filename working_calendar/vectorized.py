@@ -0,0 +1,262 @@
+import datetime
+
+from typing import Any
+
+from .exceptions import NotEnoughWorkingDaysException
+from .tables import Tables
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# ordinal of 1970-01-01, epoch of 'numpy.datetime64'
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+class Vectors(object):
+    """
+    Lookup tables converted to numpy arrays.
+
+    weekday_prefix — counter of working days of the week before ordinal modulo 7 (numpy.ndarray).
+    ordinals — sorted ordinals of exceptions (numpy.ndarray).
+    day_prefix — cumulative corrections of working days before exception (numpy.ndarray).
+    minute_prefix — cumulative corrections of working minutes before exception (numpy.ndarray).
+    """
+
+    def __init__(
+        self,
+        tables,  # type: Tables
+    ):
+        """
+        :param tables: lookup tables of calendar
+        :type tables: Tables
+        """
+
+        self.weekday_prefix = numpy.asarray(tables.weekday_prefix, dtype=numpy.int64)
+        self.ordinals = numpy.asarray(tables.ordinals, dtype=numpy.int64)
+        self.day_prefix = numpy.asarray(tables.day_prefix, dtype=numpy.int64)
+        self.minute_prefix = numpy.asarray(tables.minute_prefix, dtype=numpy.int64)
+
+
+def check_numpy():
+    """
+    Check if numpy is installed.
+    """
+
+    if numpy is None:
+        raise ImportError('Package \'numpy\' is required. Install it with \'pip install working_calendar[numpy]\'.')
+
+
+def get_vectors(
+    tables,  # type: Tables
+):
+    # type: (...) -> Vectors
+
+    """
+    Return lookup tables converted to numpy arrays. Arrays are cached in tables.
+
+    :param tables: lookup tables of calendar
+    :type tables: Tables
+
+    :return: numpy arrays
+    :rtype: Vectors
+    """
+
+    if tables.vectors is None:
+        tables.vectors = Vectors(tables)
+
+    return tables.vectors
+
+
+def to_ordinals(
+    dates,  # type: Any
+):
+    # type: (...) -> numpy.ndarray
+
+    """
+    Convert array of dates to array of ordinals.
+
+    :param dates: 'numpy.datetime64' array, integer array of ordinals or sequence of 'datetime.date'
+    :type dates: Any
+
+    :return: array of ordinals
+    :rtype: numpy.ndarray
+    """
+
+    dates = numpy.asarray(dates)
+
+    if dates.dtype.kind == 'M':
+        return dates.astype('datetime64[D]').astype(numpy.int64) + EPOCH_ORDINAL
+
+    if dates.dtype.kind in 'iu':
+        return dates.astype(numpy.int64)
+
+    if dates.dtype.kind == 'O':
+        return numpy.fromiter(
+            (date.toordinal() for date in dates.ravel()),
+            dtype=numpy.int64,
+            count=dates.size
+        ).reshape(dates.shape)
+
+    raise ValueError('Array of dates must be \'datetime64\', integer or \'datetime.date\' array.')
+
+
+def from_ordinals(
+    ordinals,  # type: numpy.ndarray
+):
+    # type: (...) -> numpy.ndarray
+
+    """
+    Convert array of ordinals to 'numpy.datetime64' array.
+
+    :param ordinals: array of ordinals
+    :type ordinals: numpy.ndarray
+
+    :return: array of dates
+    :rtype: numpy.ndarray
+    """
+
+    return (ordinals - EPOCH_ORDINAL).astype('datetime64[D]')
+
+
+def count_weekdays_before(
+    tables,  # type: Tables
+    ordinals,  # type: numpy.ndarray
+):
+    # type: (...) -> numpy.ndarray
+
+    """
+    Count working days of the week before ordinals ignoring exceptions.
+
+    :param tables: lookup tables of calendar
+    :type tables: Tables
+
+    :param ordinals: array of ordinals
+    :type ordinals: numpy.ndarray
+
+    :return: array of counters of working days
+    :rtype: numpy.ndarray
+    """
+
+    vectors = get_vectors(tables)
+
+    return ordinals // 7 * tables.working_per_week + vectors.weekday_prefix[ordinals % 7]
+
+
+def count_days_before(
+    tables,  # type: Tables
+    ordinals,  # type: numpy.ndarray
+):
+    # type: (...) -> numpy.ndarray
+
+    """
+    Count working days before ordinals.
+
+    :param tables: lookup tables of calendar
+    :type tables: Tables
+
+    :param ordinals: array of ordinals
+    :type ordinals: numpy.ndarray
+
+    :return: array of counters of working days
+    :rtype: numpy.ndarray
+    """
+
+    vectors = get_vectors(tables)
+    indexes = numpy.searchsorted(vectors.ordinals, ordinals, side='left')
+
+    return count_weekdays_before(tables, ordinals) + vectors.day_prefix[indexes]
+
+
+def count_minutes_before(
+    tables,  # type: Tables
+    ordinals,  # type: numpy.ndarray
+):
+    # type: (...) -> numpy.ndarray
+
+    """
+    Sum of working minutes before ordinals.
+
+    :param tables: lookup tables of calendar
+    :type tables: Tables
+
+    :param ordinals: array of ordinals
+    :type ordinals: numpy.ndarray
+
+    :return: array of sums of working minutes
+    :rtype: numpy.ndarray
+    """
+
+    vectors = get_vectors(tables)
+    indexes = numpy.searchsorted(vectors.ordinals, ordinals, side='left')
+
+    return count_weekdays_before(tables, ordinals) * tables.working_time_minutes + vectors.minute_prefix[indexes]
+
+
+def find_weekday_ordinals(
+    tables,  # type: Tables
+    counts,  # type: numpy.ndarray
+):
+    # type: (...) -> numpy.ndarray
+
+    """
+    Return minimal ordinals which have 'counts' working days of the week before them ignoring exceptions.
+    There should be at least one working day of the week.
+
+    :param tables: lookup tables of calendar
+    :type tables: Tables
+
+    :param counts: array of counters of working days
+    :type counts: numpy.ndarray
+
+    :return: array of ordinals
+    :rtype: numpy.ndarray
+    """
+
+    vectors = get_vectors(tables)
+    weeks, rest = numpy.divmod(counts - 1, tables.working_per_week)
+
+    return weeks * 7 + numpy.searchsorted(vectors.weekday_prefix, rest + 1, side='left')
+
+
+def find_ordinals(
+    tables,  # type: Tables
+    counts,  # type: numpy.ndarray
+):
+    # type: (...) -> numpy.ndarray
+
+    """
+    Return minimal ordinals which have 'counts' working days before them.
+    All rows are bisected together, so number of passes is logarithmic in number of exceptions.
+
+    :param tables: lookup tables of calendar
+    :type tables: Tables
+
+    :param counts: array of counters of working days
+    :type counts: numpy.ndarray
+
+    :return: array of ordinals
+    :rtype: numpy.ndarray
+    """
+
+    vectors = get_vectors(tables)
+
+    if not tables.working_per_week:
+        # only additional working days are working, so corrections never decrease
+        if ((counts <= 0) | (counts > tables.day_max)).any():
+            raise NotEnoughWorkingDaysException
+
+        return vectors.ordinals[numpy.searchsorted(vectors.day_prefix, counts, side='left') - 1] + 1
+
+    low = find_weekday_ordinals(tables, counts - tables.day_max)
+    high = find_weekday_ordinals(tables, counts - tables.day_min)
+
+    while (low < high).any():
+        middle = (low + high) // 2
+        less = count_days_before(tables, middle) < counts
+        low = numpy.where(less, middle + 1, low)
+        high = numpy.where(less, high, middle)
+
+    return low